@@ -0,0 +1,957 @@
+# Benchmarks for the hot paths of the Rover mission.
+# Usage: python benchmarks.py <benchmark name> [options], run it without arguments to list the benchmarks available.
+
+# Python imports
+import argparse
+import asyncio
+import io
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+# Custom imports
+from project_rover.common_params import value_zero, value_one, value_two
+from project_rover.coordinates import Coordinates as myCoordinate
+from project_rover.rover import Rover
+from project_rover.rover_records import RoverRecords
+from project_rover.rover_exceptions import ExceptionRoverAttemptingToExitKnownPlane, ExceptionRoverCollision
+from project_rover import rover as rover_module
+from project_rover import movement_engine
+from project_rover import fleet_simulator
+from project_rover import mission_runner
+from project_rover import main as main_module
+from project_rover.plane_coverage import CoverageMap
+from project_rover import plane_coverage
+from project_rover.path_planner import plan_instructions
+from project_rover.resumable_execution import ResumableExecution
+from project_rover import resumable_execution
+from project_rover import instrumentation
+from project_rover import mission_generator
+from project_rover.coverage_planner import generate_coverage_instructions, check_coverage_instructions
+
+# Seed used for every synthetic input, so that runs can be compared
+benchmark_seed = 1969
+
+# Budget for importing everything the command line needs before reading the first mission line, in ms
+startup_budget = 30.0
+
+# Results of the regression benchmark are compared with the previous run stored in this file
+default_results_path = 'benchmark_results.json'
+
+# Throughput drop, from the previous run, flagged as a regression
+default_tolerance = 0.1
+
+# Workloads of the regression benchmark: plane sizes, Rover counts, mean lengths and distribution of the lengths
+regression_workloads = {
+    'many_short': ((1000,), (100,), (10,), ('uniform',)),
+    'mixed': ((10, 100, 1000), (5, 20), (50, 200), ('fixed', 'uniform', 'long_tail')),
+    'long_tail': ((10 ** 4,), (20,), (1000,), ('long_tail',)),
+    'long': ((10 ** 5,), (5,), (10 ** 4,), ('fixed',))
+}
+regression_missions = 50
+
+
+def build_instructions(length, seed=benchmark_seed, block_length=1000):
+    """
+    build_instructions(): Function that will build a synthetic list of instructions, a random block is repeated
+    until having the requested length so that huge lists can be built quickly.
+    :param length: Number of instructions.
+    :param seed: Seed for the random block.
+    :param block_length: Length of the random block repeated.
+    :return: List of instructions.
+    """
+    generator = random.Random(seed)
+    block = [generator.choice('LRMM') for _ in range(min(length, block_length))]
+    return (block * (length // len(block) + value_one))[:length]
+
+
+def build_open_plane(length):
+    """
+    build_open_plane(): Function that will build a plane big enough for a Rover placed at its center to never exit it
+    whilst executing the given number of instructions.
+    :param length: Number of instructions.
+    :return: Tuple (Coordinates object, start position).
+    """
+    coordinates = myCoordinate()
+    coordinates.set_top_right_coordinates([value_two * length, value_two * length])
+    return coordinates, [length, length, 'N']
+
+
+def build_mission(generator, number_of_rovers, length, plane_size=100):
+    """
+    build_mission(): Function that will build the lines of a synthetic mission.
+    :param generator: Random object.
+    :param number_of_rovers: Number of Rovers deployed.
+    :param length: Number of instructions of each Rover.
+    :param plane_size: Top right coordinates of the plane, on both axis.
+    :return: List of lines of the mission.
+    """
+    mission = ["{} {}".format(plane_size, plane_size)]
+
+    for _ in range(number_of_rovers):
+        mission.append("{} {} {}".format(generator.randint(value_zero, plane_size),
+                                         generator.randint(value_zero, plane_size), generator.choice('NESW')))
+        mission.append(''.join(generator.choice('LRMM') for _ in range(length)))
+
+    return mission
+
+
+def time_call(function, repeat):
+    """
+    time_call(): Function that will return the best wall time of several calls to function.
+    """
+    return min(timeit.repeat(function, number=value_one, repeat=repeat))
+
+
+def benchmark_movement_engine(arguments):
+    """
+    benchmark_movement_engine(): Compare the step by step rover.execute_movement against the compiled movement
+    engine and the segmented execution. Both are called directly, the program effect cache and the periodic fast
+    path of rover.execute_movement would otherwise answer every repetition of the same repeated block.
+    """
+    print("{:>10} {:>14} {:>14} {:>9} {:>14} {:>9}".format("Commands", "Reference [s]", "Engine [s]", "Speed up",
+                                                            "Segments [s]", "Speed up"))
+
+    for exponent in range(3, arguments.max_exponent + value_one):
+        length = 10 ** exponent
+        coordinates, start_position = build_open_plane(length)
+
+        rover = Rover(value_one)
+        rover.set_rover_start_position(start_position)
+        rover.requested_list_of_instructions = build_instructions(length)
+        compiled_instructions = movement_engine.compile_instructions(rover.requested_list_of_instructions)
+
+        reference_time = time_call(lambda: rover_module.execute_movement_step_by_step(rover, coordinates),
+                                   arguments.repeat)
+        engine_time = time_call(lambda: movement_engine.execute_compiled_movement(start_position,
+                                                                                  compiled_instructions,
+                                                                                  coordinates), arguments.repeat)
+        segments_time = time_call(lambda: movement_engine.execute_segmented_movement(
+            start_position, rover.requested_list_of_instructions, coordinates), arguments.repeat)
+
+        if not rover_module.execute_movement_step_by_step(rover, coordinates) == \
+                movement_engine.execute_compiled_movement(start_position, compiled_instructions, coordinates) == \
+                movement_engine.execute_segmented_movement(start_position, rover.requested_list_of_instructions,
+                                                           coordinates):
+            print("\t[!!]\tEnd positions differ for {} commands".format(length))
+
+        print("{:>10} {:>14.6f} {:>14.6f} {:>8.1f}x {:>14.6f} {:>8.1f}x".format(length, reference_time, engine_time,
+                                                                                 reference_time / engine_time,
+                                                                                 segments_time,
+                                                                                 reference_time / segments_time))
+
+
+def benchmark_segments(arguments):
+    """
+    benchmark_segments(): Compare the step by step rover.execute_movement against the segmented execution on
+    survey-like instructions, long runs of forward movements and redundant spins. The segmented execution is called
+    directly, so that the program effect cache does not answer the repetitions.
+    """
+    print("{:>10} {:>10} {:>14} {:>14} {:>9}".format("Commands", "Segments", "Reference [s]", "Segments [s]",
+                                                      "Speed up"))
+
+    generator = random.Random(benchmark_seed)
+
+    for exponent in range(3, arguments.max_exponent + value_one):
+        length = 10 ** exponent
+        coordinates, start_position = build_open_plane(length)
+
+        # Runs of forward movements up to 100 steps, separated by a few spins
+        list_of_instructions = list()
+        while len(list_of_instructions) < length:
+            list_of_instructions.extend(['M'] * generator.randint(value_one, 100))
+            list_of_instructions.extend(generator.choice(['R', 'L', 'LR', 'RRRRL', 'LLLLR']))
+        list_of_instructions = list_of_instructions[:length]
+
+        rover = Rover(value_one)
+        rover.set_rover_start_position(start_position)
+        rover.requested_list_of_instructions = list_of_instructions
+
+        reference_time = time_call(lambda: rover_module.execute_movement_step_by_step(rover, coordinates),
+                                   arguments.repeat)
+        segments_time = time_call(lambda: movement_engine.execute_segmented_movement(start_position,
+                                                                                     list_of_instructions,
+                                                                                     coordinates), arguments.repeat)
+
+        print("{:>10} {:>10} {:>14.6f} {:>14.6f} {:>8.1f}x".format(
+            length, len(movement_engine.compress_instructions(list_of_instructions)), reference_time, segments_time,
+            reference_time / segments_time))
+
+
+def benchmark_fleet(arguments):
+    """
+    benchmark_fleet(): Compare moving Rovers one at a time with the segmented execution against moving the whole
+    fleet in lockstep with the vectorized simulator, from 1 to 10^max_exponent Rovers of 100 instructions each, on a
+    plane with 100 Rovers already deployed. The segmented execution is called directly, so that the program effect
+    cache does not answer the repetitions.
+    """
+    print("{:>10} {:>14} {:>14} {:>9} {:>14}".format("Rovers", "Scalar [s]", "Fleet [s]", "Speed up", "Rovers/s"))
+
+    generator = random.Random(benchmark_seed)
+    length = 100
+    coordinates, start_position = build_open_plane(length)
+
+    # Some Rovers already deployed, which the fleet has to look for at every step
+    for _ in range(100):
+        coordinates.set_occupied_position([generator.randint(value_zero, value_two * length),
+                                           generator.randint(value_zero, value_two * length), 'N'])
+
+    for exponent in range(arguments.max_exponent + value_one):
+        number_of_rovers = 10 ** exponent
+        start_positions = [[start_position[value_zero] + generator.randint(-length, length),
+                            start_position[value_one] + generator.randint(-length, length),
+                            generator.choice('NESW')] for _ in range(number_of_rovers)]
+        lists_of_instructions = [''.join(build_instructions(length, seed=generator.random(), block_length=length))
+                                 for _ in range(number_of_rovers)]
+
+        def run_scalar():
+            for start, list_of_instructions in zip(start_positions, lists_of_instructions):
+                try:
+                    movement_engine.execute_segmented_movement(start, list_of_instructions, coordinates)
+                except (ExceptionRoverAttemptingToExitKnownPlane, ExceptionRoverCollision):
+                    pass
+
+        scalar_time = time_call(run_scalar, arguments.repeat)
+        fleet_time = time_call(lambda: fleet_simulator.simulate_fleet(start_positions, lists_of_instructions,
+                                                                      coordinates), arguments.repeat)
+
+        print("{:>10} {:>14.6f} {:>14.6f} {:>8.1f}x {:>14.0f}".format(number_of_rovers, scalar_time, fleet_time,
+                                                                       scalar_time / fleet_time,
+                                                                       number_of_rovers / fleet_time))
+
+
+def benchmark_mission_runner(arguments):
+    """
+    benchmark_mission_runner(): Throughput of the mission runner from 1 to the number of CPUs available, on 400
+    missions of 50 Rovers with 200 instructions each.
+    """
+    print("{:>8} {:>12} {:>14} {:>9}".format("Workers", "Time [s]", "Missions/s", "Speed up"))
+
+    generator = random.Random(benchmark_seed)
+    missions = [build_mission(generator, 50, 200) for _ in range(400)]
+    single_worker_time = None
+
+    for workers in range(value_one, multiprocessing.cpu_count() + value_one):
+        elapsed_time = time_call(lambda: list(mission_runner.run_missions_in_parallel(missions, workers)),
+                                 arguments.repeat)
+        single_worker_time = single_worker_time or elapsed_time
+
+        print("{:>8} {:>12.4f} {:>14.1f} {:>8.1f}x".format(workers, elapsed_time, len(missions) / elapsed_time,
+                                                            single_worker_time / elapsed_time))
+
+
+def benchmark_coverage(arguments):
+    """
+    benchmark_coverage(): Overhead of recording the positions visited whilst executing the movements of a survey
+    pattern, on a plane kept as one bitset and on the same plane kept as sparse tiles.
+    """
+    print("{:>10} {:>14} {:>14} {:>9} {:>14} {:>9} {:>12}".format("Commands", "Plain [s]", "Bitset [s]", "Overhead",
+                                                                   "Tiles [s]", "Overhead", "Bitset [B]"))
+
+    for exponent in range(3, arguments.max_exponent + value_one):
+        length = 10 ** exponent
+
+        # Survey pattern going up and down columns of a square plane
+        side = int(length ** 0.5)
+        survey = 'M' * side + 'RMR' + 'M' * side + 'LML'
+        list_of_instructions = (survey * (length // len(survey) + value_one))[:length]
+        coordinates = myCoordinate()
+        coordinates.set_top_right_coordinates([value_two * side + 4, side])
+        start_position = [value_zero, value_zero, 'N']
+
+        def run_with(size_limit):
+            # Same segmented execution in every column, the plain one can not skip the cycles or use the cache
+            coverage = CoverageMap(coordinates, size_limit) if size_limit is not None else None
+            try:
+                movement_engine.execute_segmented_movement(start_position, list_of_instructions, coordinates,
+                                                           coverage)
+            except ExceptionRoverAttemptingToExitKnownPlane:
+                pass
+
+        plain_time = time_call(lambda: run_with(None), arguments.repeat)
+        bitset_time = time_call(lambda: run_with(plane_coverage.dense_size_limit), arguments.repeat)
+        tiles_time = time_call(lambda: run_with(value_zero), arguments.repeat)
+
+        print("{:>10} {:>14.6f} {:>14.6f} {:>8.1f}x {:>14.6f} {:>8.1f}x {:>12}".format(
+            length, plain_time, bitset_time, bitset_time / plain_time, tiles_time, tiles_time / plain_time,
+            len(CoverageMap(coordinates).bits)))
+
+
+def benchmark_parsers(arguments):
+    """
+    benchmark_parsers(): Compare the single pass parsers against the token by token and letter by letter ones, on
+    batches of 10^5 position lines and on instruction lines from 10^3 to 10^max_exponent characters.
+    """
+    generator = random.Random(benchmark_seed)
+    coordinates = myCoordinate()
+    coordinates.set_top_right_coordinates([1000, 1000])
+    rover = Rover(value_one)
+
+    position_lines = {
+        'correct': ["{} {} {}".format(generator.randint(0, 1000), generator.randint(0, 1000),
+                                      generator.choice('NESWnesw')) for _ in range(10 ** 5)],
+        'extra spaces': ["  {}   {}  {} ".format(generator.randint(0, 1000), generator.randint(0, 1000),
+                                                  generator.choice('NESW')) for _ in range(10 ** 5)],
+        'wrong': ["{} {} {}".format(generator.randint(0, 2000), generator.choice(['1', 'a', '-3']),
+                                    generator.choice('NESWX')) for _ in range(10 ** 5)],
+    }
+
+    def parse_all(parse_function, lines):
+        for line in lines:
+            try:
+                parse_function(line, main_module.second_line_types, coordinates)
+            except main_module.rover_exceptions_list:
+                pass
+
+    print("{:>24} {:>14} {:>14} {:>9}".format("Position lines", "Tokens [s]", "Single [s]", "Speed up"))
+    for name in sorted(position_lines.keys()):
+        token_time = time_call(lambda: parse_all(main_module.parse_rover_parameters_token_by_token,
+                                                 position_lines[name]), arguments.repeat)
+        single_time = time_call(lambda: parse_all(main_module.parse_rover_parameters, position_lines[name]),
+                                arguments.repeat)
+        print("{:>24} {:>14.6f} {:>14.6f} {:>8.1f}x".format("10^5 " + name, token_time, single_time,
+                                                              token_time / single_time))
+
+    print("{:>24} {:>14} {:>14} {:>9}".format("Instructions", "Letters [s]", "Single [s]", "Speed up"))
+    for exponent in range(3, arguments.max_exponent + value_one):
+        length = 10 ** exponent
+        instructions = ''.join(build_instructions(length)).lower()
+        line = ' '.join(instructions[start:start + 100] for start in range(value_zero, length, 100))
+
+        letter_time = time_call(lambda: rover_module.parse_set_of_instructions_letter_by_letter(rover, line),
+                                arguments.repeat)
+        single_time = time_call(lambda: rover_module.parse_set_of_instructions(rover, line), arguments.repeat)
+        print("{:>24} {:>14.6f} {:>14.6f} {:>8.1f}x".format(length, letter_time, single_time,
+                                                              letter_time / single_time))
+
+
+def benchmark_effect_cache(arguments):
+    """
+    benchmark_effect_cache(): Execute 10^4 Rovers picking their list of instructions from a small set of survey
+    patterns and calibration spins, with and without the program effect cache.
+    """
+    print("{:>10} {:>14} {:>14} {:>9} {:>10} {:>10}".format("Patterns", "No cache [s]", "Cache [s]", "Speed up",
+                                                            "Hits", "Misses"))
+
+    generator = random.Random(benchmark_seed)
+    coordinates = myCoordinate()
+    coordinates.set_top_right_coordinates([1000, 1000])
+
+    for number_of_patterns in (1, 10, 100, 1000, 5000):
+        patterns = [''.join(build_instructions(generator.randint(10, 1000), seed=generator.random()))
+                    for _ in range(number_of_patterns)]
+        rovers = list()
+        for count in range(10 ** 4):
+            rover = Rover(count)
+            rover.set_rover_start_position([generator.randint(400, 600), generator.randint(400, 600),
+                                            generator.choice('NESW')])
+            rover.requested_list_of_instructions = generator.choice(patterns)
+            rovers.append(rover)
+
+        def run_all(maximum_size):
+            rover_module.program_effect_cache.clear()
+            rover_module.program_effect_cache.set_maximum_size(maximum_size)
+            for rover in rovers:
+                try:
+                    rover_module.execute_movement(rover, coordinates)
+                except ExceptionRoverAttemptingToExitKnownPlane:
+                    pass
+
+        no_cache_time = time_call(lambda: run_all(value_zero), arguments.repeat)
+        cache_time = time_call(lambda: run_all(rover_module.default_program_effect_cache_size), arguments.repeat)
+        statistics = rover_module.program_effect_cache.statistics()
+
+        print("{:>10} {:>14.6f} {:>14.6f} {:>8.1f}x {:>10} {:>10}".format(number_of_patterns, no_cache_time,
+                                                                           cache_time, no_cache_time / cache_time,
+                                                                           statistics['hits'], statistics['misses']))
+
+    rover_module.program_effect_cache.clear()
+
+
+def measure_import_time(statement):
+    """
+    measure_import_time(): Function that will run statement in a new interpreter with -X importtime and add up the
+    cumulative time of the modules imported by it, leaving out the ones imported by the interpreter itself.
+    :param statement: Python code run with -c.
+    :return: Import time in ms.
+    """
+    baseline = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'pass'], stderr=subprocess.PIPE,
+                              universal_newlines=True).stderr
+    report = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement], stderr=subprocess.PIPE,
+                            universal_newlines=True, cwd=os.path.dirname(os.path.abspath(__file__))).stderr
+
+    def top_level_modules(lines):
+        # Lines look like "import time: <self> | <cumulative> | <indentation><module>"
+        for line in lines.splitlines():
+            fields = line.split('|')
+            if len(fields) == 3 and fields[1].strip().isdigit() and not fields[2][value_one:].startswith(' '):
+                yield fields[2].strip(), int(fields[1])
+
+    interpreter_modules = dict(top_level_modules(baseline))
+    return sum(cumulative for module, cumulative in top_level_modules(report)
+               if module not in interpreter_modules) / 1000.0
+
+
+def benchmark_startup(arguments):
+    """
+    benchmark_startup(): Time spent importing what the command line needs, from the parsing of the arguments to the
+    modules moving the Rovers, against the startup budget.
+    """
+    print("{:>32} {:>12} {:>12}".format("Modules", "Import [ms]", "Budget [ms]"))
+
+    for name, statement in [("project_rover.cli", "import project_rover.cli"),
+                            ("project_rover.cli + main", "import project_rover.cli, project_rover.main")]:
+        import_time = min(measure_import_time(statement) for _ in range(arguments.repeat))
+
+        print("{:>32} {:>12.2f} {:>12.2f}".format(name, import_time, startup_budget))
+        if import_time > startup_budget:
+            print("\t[!!]\tImporting {} is over the startup budget".format(name))
+
+
+def percentile(sorted_values, fraction):
+    """
+    percentile(): Function that will return the value below which the given fraction of the values falls.
+    :param sorted_values: List of values, sorted.
+    :param fraction: Fraction between 0 and 1.
+    :return: Value of the percentile.
+    """
+    return sorted_values[min(len(sorted_values) - value_one, int(len(sorted_values) * fraction))]
+
+
+async def run_load_session(unix_path, mission, latencies):
+    """
+    run_load_session(): Function that will play a mission against the Rover server as an operator would, one request
+    at a time, sending an empty set of instructions when a Rover can not execute its own one.
+    :param unix_path: Path of the Unix socket of the server.
+    :param mission: List of lines of the mission, as built by build_mission.
+    :param latencies: List where the time waited for each reply is appended.
+    :return: Nothing
+    """
+    reader, writer = await asyncio.open_unix_connection(unix_path)
+
+    async def request(line):
+        start_time = time.perf_counter()
+        writer.write("{}\n".format(line).encode('utf-8'))
+        reply = await reader.readuntil(b"\n\n")
+        latencies.append(time.perf_counter() - start_time)
+        return reply
+
+    try:
+        await request(mission[value_zero])
+
+        for position_line, instructions_line in zip(mission[value_one::value_two], mission[value_two::value_two]):
+            await request(position_line)
+
+            if b"final position" not in await request(instructions_line):
+                await request("")
+    finally:
+        writer.close()
+
+
+async def run_load(unix_path, missions):
+    """
+    run_load(): Function that will play every mission at the same time, each one in its own session.
+    :param unix_path: Path of the Unix socket of the server.
+    :param missions: List of missions.
+    :return: Tuple (latencies, number of failed sessions, elapsed time).
+    """
+    latencies = list()
+    start_time = time.perf_counter()
+    results = await asyncio.gather(*[run_load_session(unix_path, mission, latencies) for mission in missions],
+                                   return_exceptions=True)
+
+    return latencies, sum(isinstance(result, Exception) for result in results), time.perf_counter() - start_time
+
+
+def benchmark_server(arguments):
+    """
+    benchmark_server(): Latency of the Rover server under load, from 10 to 10^max_exponent (10^4 at most) concurrent
+    sessions over a local Unix socket, each one deploying 10 Rovers with 100 instructions.
+    """
+    print("{:>10} {:>10} {:>8} {:>12} {:>10} {:>10} {:>10}".format("Sessions", "Requests", "Failed", "Requests/s",
+                                                                   "p50 [ms]", "p99 [ms]", "Max [ms]"))
+
+    generator = random.Random(benchmark_seed)
+    socket_folder = tempfile.mkdtemp()
+    unix_path = os.path.join(socket_folder, "rover.sock")
+    server = subprocess.Popen([sys.executable, '-m', 'project_rover.rover_server', '--unix', unix_path],
+                              cwd=os.path.dirname(os.path.abspath(__file__)))
+    max_sessions = value_zero
+
+    try:
+        while not os.path.exists(unix_path):
+            time.sleep(0.01)
+
+        for exponent in range(value_one, min(arguments.max_exponent, 4) + value_one):
+            number_of_sessions = 10 ** exponent
+            missions = [build_mission(generator, 10, 100) for _ in range(number_of_sessions)]
+            latencies, failed_sessions, elapsed_time = asyncio.run(run_load(unix_path, missions))
+            latencies.sort()
+
+            if not failed_sessions:
+                max_sessions = number_of_sessions
+
+            print("{:>10} {:>10} {:>8} {:>12.0f} {:>10.3f} {:>10.3f} {:>10.3f}".format(
+                number_of_sessions, len(latencies), failed_sessions, len(latencies) / elapsed_time,
+                1000 * percentile(latencies, 0.5), 1000 * percentile(latencies, 0.99), 1000 * latencies[-value_one]))
+    finally:
+        server.terminate()
+        server.wait()
+        shutil.rmtree(socket_folder)
+
+    print("Max sessions served without failures: {}".format(max_sessions))
+
+
+class DictRover:
+    """
+    DictRover Class object, layout Rover had before __slots__, kept as the memory baseline: a per instance dict of
+    known movements and a formatted name, and a copy of the start position for its end position.
+    """
+    def __init__(self, rover_id):
+        self.set_of_known_movements = {'L': -value_one, 'R': value_one, 'M': None}
+        self.rover_number = rover_id
+        self.rover_id = "Rover[{}]".format(rover_id)
+        self.start_position = None
+        self.end_position = None
+        self.requested_list_of_instructions = None
+
+
+def measure_allocated_memory(function):
+    """
+    measure_allocated_memory(): Function that will return the memory still allocated by what function returns.
+    :param function: Function called without arguments.
+    :return: Allocated bytes.
+    """
+    tracemalloc.start()
+    allocated_before = tracemalloc.get_traced_memory()[value_zero]
+    result = function()
+    allocated = tracemalloc.get_traced_memory()[value_zero] - allocated_before
+    tracemalloc.stop()
+    del result
+
+    return allocated
+
+
+def benchmark_memory(arguments):
+    """
+    benchmark_memory(): Memory footprint per Rover, measured with tracemalloc, of fleets from 10^3 to
+    10^max_exponent (10^6 at most) Rovers with their start and end positions and a shared list of instructions, kept as
+    the former dict based Rovers, as __slots__ Rovers and as RoverRecords.
+    """
+    print("{:>10} {:>14} {:>14} {:>14}".format("Rovers", "Dict [B]", "Slots [B]", "Records [B]"))
+
+    generator = random.Random(benchmark_seed)
+    list_of_instructions = ''.join(build_instructions(100))
+
+    for exponent in range(3, min(arguments.max_exponent, 6) + value_one):
+        number_of_rovers = 10 ** exponent
+        positions = [[generator.randint(value_zero, 1000), generator.randint(value_zero, 1000),
+                      generator.choice('NESW')] for _ in range(number_of_rovers)]
+
+        def build_rovers(rover_class):
+            rovers = list()
+            for count, position in enumerate(positions, start=value_one):
+                rover = rover_class(count)
+                rover.start_position = list(position)
+                rover.requested_list_of_instructions = list_of_instructions
+                rover.end_position = list(position)
+                rovers.append(rover)
+            return rovers
+
+        def build_records():
+            records = RoverRecords()
+            for count, position in enumerate(positions, start=value_one):
+                records.append(count, position, list_of_instructions, position)
+            return records
+
+        print("{:>10} {:>14.1f} {:>14.1f} {:>14.1f}".format(
+            number_of_rovers, measure_allocated_memory(lambda: build_rovers(DictRover)) / number_of_rovers,
+            measure_allocated_memory(lambda: build_rovers(Rover)) / number_of_rovers,
+            measure_allocated_memory(build_records) / number_of_rovers))
+
+
+def benchmark_planner(arguments):
+    """
+    benchmark_planner(): Time to plan the shortest set of instructions between random positions of planes from 10^2
+    x 10^2 to 10^max_exponent x 10^max_exponent (10^4 at most), with as many Rovers already deployed as the side of the
+    plane.
+    """
+    print("{:>10} {:>10} {:>10} {:>14} {:>14}".format("Side", "Rovers", "Plans", "Mean length", "Mean time [s]"))
+
+    generator = random.Random(benchmark_seed)
+    number_of_plans = 5
+
+    for exponent in range(value_two, min(arguments.max_exponent, 4) + value_one):
+        side = 10 ** exponent
+        coordinates = myCoordinate()
+        coordinates.set_top_right_coordinates([side - value_one, side - value_one])
+
+        for _ in range(side):
+            coordinates.set_occupied_position([generator.randrange(side), generator.randrange(side), 'N'])
+
+        plans = list()
+        while len(plans) < number_of_plans:
+            start_position = [generator.randrange(side), generator.randrange(side), generator.choice('NESW')]
+            goal_position = [generator.randrange(side), generator.randrange(side), generator.choice('NESW')]
+
+            if not coordinates.is_occupied(goal_position[value_zero], goal_position[value_one]):
+                plans.append((start_position, goal_position))
+
+        total_time = value_zero
+        total_length = value_zero
+        for start_position, goal_position in plans:
+            total_time += time_call(lambda: plan_instructions(coordinates, start_position, goal_position),
+                                    arguments.repeat)
+            total_length += len(plan_instructions(coordinates, start_position, goal_position))
+
+        print("{:>10} {:>10} {:>10} {:>14.1f} {:>14.6f}".format(side, len(coordinates.occupied_positions),
+                                                                number_of_plans, total_length / number_of_plans,
+                                                                total_time / number_of_plans))
+
+
+def benchmark_coverage_planner(arguments):
+    """
+    benchmark_coverage_planner(): Time to generate the sets of instructions of 8 Rovers covering planes from 10 x 10
+    to 10^max_exponent x 10^max_exponent (10^3 at most), with as many Rovers already deployed as the side of the plane,
+    checked with rover.execute_movement.
+    """
+    print("{:>8} {:>12} {:>14} {:>12} {:>12} {:>10} {:>12} {:>12}".format(
+        "Side", "Positions", "Generate [s]", "[ns]/pos", "Check [s]", "Coverage", "Shortest", "Longest"))
+
+    generator = random.Random(benchmark_seed)
+    number_of_rovers = 8
+
+    for exponent in range(value_one, min(arguments.max_exponent, 3) + value_one):
+        side = 10 ** exponent
+        coordinates = myCoordinate()
+        coordinates.set_top_right_coordinates([side - value_one, side - value_one])
+
+        for _ in range(side):
+            coordinates.set_occupied_position([generator.randrange(side), generator.randrange(side), 'N'])
+
+        start_positions = [[generator.randrange(side), generator.randrange(side), generator.choice('NESW')]
+                           for _ in range(number_of_rovers)]
+
+        generate_time = time_call(lambda: generate_coverage_instructions(coordinates, start_positions),
+                                  arguments.repeat)
+        lists_of_instructions = generate_coverage_instructions(coordinates, start_positions)
+        check_time = time_call(lambda: check_coverage_instructions(coordinates, start_positions,
+                                                                   lists_of_instructions), arguments.repeat)
+        coverage = check_coverage_instructions(coordinates, start_positions, lists_of_instructions)
+
+        print("{:>8} {:>12} {:>14.6f} {:>12.1f} {:>12.6f} {:>9.2f}% {:>12} {:>12}".format(
+            side, side * side, generate_time, 1e9 * generate_time / (side * side), check_time,
+            coverage.coverage_percentage(), min(len(instructions) for instructions in lists_of_instructions),
+            max(len(instructions) for instructions in lists_of_instructions)))
+
+
+def benchmark_resumable(arguments):
+    """
+    benchmark_resumable(): Cost of a wrong instruction found at 90% of programs from 10^5 to 10^max_exponent
+    instructions, a move into a Rover already deployed. Without checkpoints the whole corrected program is executed
+    again, with checkpoints only the instructions after the last one are. The overhead of checkpointing a program
+    with no error is shown too. The program effect cache is disabled, so that every execution really moves the Rover.
+    """
+    print("{:>10} {:>14} {:>14} {:>9} {:>14} {:>9}".format("Commands", "Replay [s]", "Resume [s]", "Speed up",
+                                                           "Chunked [s]", "Overhead"))
+
+    checkpoint_folder = tempfile.mkdtemp()
+    checkpoint_path = os.path.join(checkpoint_folder, "rover.checkpoint")
+    cache_size = rover_module.program_effect_cache.maximum_size
+    rover_module.program_effect_cache.set_maximum_size(value_zero)
+
+    try:
+        for exponent in range(5, arguments.max_exponent + value_one):
+            length = 10 ** exponent
+            coordinates, start_position = build_open_plane(length)
+            list_of_instructions = ''.join(build_instructions(length))
+
+            # Wrong instruction at the beginning of a chunk, moving into a Rover the right program never goes through
+            wrong_offset = length * 9 // 10 // resumable_execution.default_chunk_size * \
+                resumable_execution.default_chunk_size
+            x, y, heading = movement_engine.execute_segmented_movement(start_position,
+                                                                       list_of_instructions[:wrong_offset],
+                                                                       coordinates)
+            heading = movement_engine.heading_codes[heading]
+            wrong_instructions = None
+
+            for wrong_heading in range(len(movement_engine.heading_names)):
+                coordinates.set_occupied_position([x + movement_engine.delta_x[wrong_heading],
+                                                   y + movement_engine.delta_y[wrong_heading]])
+                try:
+                    movement_engine.execute_segmented_movement(start_position, list_of_instructions, coordinates)
+                except ExceptionRoverCollision:
+                    coordinates, start_position = build_open_plane(length)
+                    continue
+
+                wrong_instructions = list_of_instructions[:wrong_offset] + \
+                    ('', 'R', 'RR', 'L')[(wrong_heading - heading) % len(movement_engine.heading_names)] + 'M' + \
+                    list_of_instructions[wrong_offset:]
+                break
+
+            if wrong_instructions is None:
+                print("\t[!!]\tNo wrong instruction found for {} commands".format(length))
+                continue
+
+            def build_rover(instructions):
+                rover = Rover(value_one)
+                rover.set_rover_start_position(list(start_position))
+                rover.requested_list_of_instructions = instructions
+                return rover
+
+            def replay():
+                rover = build_rover(wrong_instructions)
+                try:
+                    rover.execute_movement(coordinates)
+                except ExceptionRoverCollision:
+                    rover.set_list_of_instructions(list_of_instructions)
+                    rover.execute_movement(coordinates)
+                return rover.end_position
+
+            def resume():
+                execution = ResumableExecution(build_rover(wrong_instructions), checkpoint_path)
+                try:
+                    execution.execute(coordinates)
+                except ExceptionRoverCollision:
+                    execution.correct_remaining_instructions(list_of_instructions[execution.offset:])
+                    execution.execute(coordinates)
+                return execution.position
+
+            def plain():
+                rover = build_rover(list_of_instructions)
+                rover.execute_movement(coordinates)
+                return rover.end_position
+
+            def chunked():
+                return ResumableExecution(build_rover(list_of_instructions), checkpoint_path).execute(coordinates)
+
+            if not replay() == resume() == plain() == chunked():
+                print("\t[!!]\tEnd positions differ for {} commands".format(length))
+
+            replay_time = time_call(replay, arguments.repeat)
+            resume_time = time_call(resume, arguments.repeat)
+            plain_time = time_call(plain, arguments.repeat)
+            chunked_time = time_call(chunked, arguments.repeat)
+
+            print("{:>10} {:>14.6f} {:>14.6f} {:>8.1f}x {:>14.6f} {:>8.2f}x".format(
+                length, replay_time, resume_time, replay_time / resume_time, chunked_time, chunked_time / plain_time))
+    finally:
+        rover_module.program_effect_cache.set_maximum_size(cache_size)
+        shutil.rmtree(checkpoint_folder)
+
+
+def benchmark_instrumentation(arguments):
+    """
+    benchmark_instrumentation(): Process missions of 10^4 Rovers, with sets of instructions from 10 to 10^3
+    commands, calling the stages without instrumentation hooks, with instrumentation disabled and with it enabled.
+    Short sets of instructions are the worst case, the hooks cost the same whatever the length.
+    """
+    print("{:>10} {:>14} {:>14} {:>9} {:>14} {:>9}".format("Commands", "No hooks [s]", "Disabled [s]", "Overhead",
+                                                           "Enabled [s]", "Overhead"))
+
+    generator = random.Random(benchmark_seed)
+
+    for length in (10, 100, 1000):
+        mission = build_mission(generator, 10 ** 4, length, plane_size=10 ** 4)
+        rover_lines = list(zip(mission[value_one::value_two], mission[value_two::value_two]))
+
+        def process(parse_parameters, parse_instructions, execute):
+            coordinates = myCoordinate()
+            coordinates.set_top_right_coordinates(parse_parameters(mission[value_zero], main_module.first_line_types,
+                                                                   coordinates))
+            for count, (position_line, instructions_line) in enumerate(rover_lines, start=value_one):
+                rover = Rover(count)
+                try:
+                    rover.start_position = parse_parameters(position_line, main_module.second_line_types,
+                                                            coordinates)
+                    rover.requested_list_of_instructions = parse_instructions(rover, instructions_line)
+                    rover.end_position = execute(rover, coordinates)
+                except main_module.rover_exceptions_list:
+                    pass
+
+        def no_hooks():
+            process(main_module._parse_rover_parameters, rover_module._parse_set_of_instructions,
+                    rover_module._execute_movement)
+
+        def hooks():
+            process(main_module.parse_rover_parameters, rover_module.parse_set_of_instructions,
+                    rover_module.execute_movement)
+
+        def enabled():
+            instrumentation.enable_instrumentation()
+            try:
+                hooks()
+            finally:
+                instrumentation.disable_instrumentation()
+
+        # Variants measured in turns, so that the load of the machine changing affects all of them alike
+        no_hooks_time, disabled_time, enabled_time = [min(times) for times in zip(*(
+            [time_call(function, value_one) for function in (no_hooks, hooks, enabled)]
+            for _ in range(arguments.repeat)))]
+
+        print("{:>10} {:>14.6f} {:>14.6f} {:>8.3f}x {:>14.6f} {:>8.3f}x".format(
+            length, no_hooks_time, disabled_time, disabled_time / no_hooks_time, enabled_time,
+            enabled_time / no_hooks_time))
+
+
+def count_commands(mission):
+    """
+    count_commands(): Function that will return the number of Rovers and of commands of a mission.
+    :param mission: List of lines of the mission.
+    :return: Tuple (Rovers, commands).
+    """
+    lines_of_instructions = mission[value_two::value_two]
+    return len(lines_of_instructions), sum(len(line) - line.count(' ') for line in lines_of_instructions)
+
+
+def benchmark_regression(arguments):
+    """
+    benchmark_regression(): Rovers and commands per second of main.run_mission on fixed seeded workloads. Results are
+    stored in the results file, and commands per second lower than the ones of the previous run stored, by more than
+    the tolerance, are flagged as regressions.
+    :return: 1 if any regression is found, None otherwise.
+    """
+    previous_runs = list()
+    if os.path.exists(arguments.results):
+        with open(arguments.results) as results_file:
+            previous_runs = json.load(results_file)
+    previous_results = previous_runs[-value_one]['results'] if previous_runs else dict()
+
+    print("{:>12} {:>12} {:>14} {:>16} {:>10}".format("Workload", "Time [s]", "Rovers/s", "Commands/s", "Change"))
+
+    results = dict()
+    regressions = list()
+
+    for name in sorted(regression_workloads.keys()):
+        plane_sizes, rover_counts, mean_lengths, distributions = regression_workloads[name]
+        missions = list(mission_generator.generate_missions(benchmark_seed, regression_missions, plane_sizes,
+                                                            rover_counts, mean_lengths, distributions, error_rate=0.0))
+        rovers, commands = [sum(counts) for counts in zip(*(count_commands(mission) for mission in missions))]
+
+        def run_all():
+            # Every run starts with no program effect cached, as a new process does
+            rover_module.program_effect_cache.clear()
+            for mission in missions:
+                main_module.run_mission(mission, io.StringIO())
+
+        elapsed_time = time_call(run_all, arguments.repeat)
+        results[name] = {'seconds': elapsed_time, 'rovers_per_second': rovers / elapsed_time,
+                         'commands_per_second': commands / elapsed_time}
+
+        change = ''
+        if name in previous_results:
+            ratio = results[name]['commands_per_second'] / previous_results[name]['commands_per_second']
+            change = "{:+.1f}%".format((ratio - value_one) * 100)
+            if ratio < value_one - arguments.tolerance:
+                regressions.append(name)
+                change += " [!!]"
+
+        print("{:>12} {:>12.4f} {:>14.1f} {:>16.1f} {:>10}".format(name, elapsed_time,
+                                                                  results[name]['rovers_per_second'],
+                                                                  results[name]['commands_per_second'], change))
+
+    previous_runs.append({'time': time.strftime('%Y-%m-%d %H:%M:%S'), 'python': platform.python_version(),
+                          'repeat': arguments.repeat, 'results': results})
+    with open(arguments.results, 'w') as results_file:
+        json.dump(previous_runs, results_file, indent=value_two)
+
+    if regressions:
+        print("\t[!!]\tThroughput dropped more than {:.0f}% for: {}".format(arguments.tolerance * 100,
+                                                                           ', '.join(regressions)))
+        return value_one
+
+
+def benchmark_periodic(arguments):
+    """
+    benchmark_periodic(): Compare the segmented execution against jumping ahead over the cycles of periodic lists of
+    instructions, from 10^3 to 10^max_exponent instructions: a closed patrol that stays in the plane, a patrol
+    drifting one step per cycle that exits the plane at 90% of its instructions, the closed patrol after and before
+    a few other instructions, and random instructions with no period, where only looking for it is paid.
+    """
+    print("{:>10} {:>10} {:>14} {:>14} {:>9}".format("Commands", "Program", "Segments [s]", "Periodic [s]",
+                                                     "Speed up"))
+
+    generator = random.Random(benchmark_seed)
+
+    for exponent in range(3, arguments.max_exponent + value_one):
+        length = 10 ** exponent
+        drifting_cycles = length // len('MMRMMRMMRMMRM')
+        programs = {
+            'closed': (('MMRMMRMMRMMR' * length)[:length], [10, 10], [value_zero, value_zero, 'N']),
+            'drifting': (('MMRMMRMMRMMRM' * length)[:length], [10, drifting_cycles * 9 // 10],
+                         [value_zero, value_zero, 'N']),
+            'prefixed': ('LR' + ('MMRMMRMMRMMR' * length)[:length - 6] + 'MMRL', [10, 10],
+                         [value_zero, value_zero, 'N']),
+            'random': (''.join(generator.choice('LRMM') for _ in range(length)), [value_two * length] * value_two,
+                       [length, length, 'N'])
+        }
+
+        for name in sorted(programs.keys()):
+            instructions, top_right_coordinates, start_position = programs[name]
+            coordinates = myCoordinate()
+            coordinates.set_top_right_coordinates(top_right_coordinates)
+
+            def run(execute):
+                try:
+                    return execute(start_position, instructions, coordinates)
+                except ExceptionRoverAttemptingToExitKnownPlane as e:
+                    return str(e)
+
+            if run(movement_engine.execute_segmented_movement) != run(movement_engine.execute_periodic_movement):
+                print("\t[!!]\tResults differ for {} program of {} commands".format(name, length))
+
+            segments_time = time_call(lambda: run(movement_engine.execute_segmented_movement), arguments.repeat)
+            periodic_time = time_call(lambda: run(movement_engine.execute_periodic_movement), arguments.repeat)
+
+            print("{:>10} {:>10} {:>14.6f} {:>14.6f} {:>8.1f}x".format(length, name, segments_time, periodic_time,
+                                                                       segments_time / periodic_time))
+
+benchmarks = {
+    'coverage': benchmark_coverage,
+    'coverage_planner': benchmark_coverage_planner,
+    'effect_cache': benchmark_effect_cache,
+    'fleet': benchmark_fleet,
+    'instrumentation': benchmark_instrumentation,
+    'memory': benchmark_memory,
+    'mission_runner': benchmark_mission_runner,
+    'parsers': benchmark_parsers,
+    'periodic': benchmark_periodic,
+    'planner': benchmark_planner,
+    'regression': benchmark_regression,
+    'resumable': benchmark_resumable,
+    'movement_engine': benchmark_movement_engine,
+    'segments': benchmark_segments,
+    'server': benchmark_server,
+    'startup': benchmark_startup,
+}
+
+
+def main():
+    """
+    main(): Function that will parse the arguments and run the requested benchmark.
+    :return: Nothing
+    """
+    parser = argparse.ArgumentParser(description="Rover mission benchmarks")
+    parser.add_argument('benchmark', choices=sorted(benchmarks.keys()))
+    parser.add_argument('--max-exponent', type=int, default=7, help="Biggest input size, as a power of ten")
+    parser.add_argument('--repeat', type=int, default=3, help="Times each measure is repeated, best one is kept")
+    parser.add_argument('--results', default=default_results_path,
+                        help="File where the regression benchmark stores its results, to compare with the next run")
+    parser.add_argument('--tolerance', type=float, default=default_tolerance,
+                        help="Throughput drop flagged as a regression by the regression benchmark")
+    arguments = parser.parse_args()
+
+    sys.exit(benchmarks[arguments.benchmark](arguments))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,465 @@
+# Correctness suite of the Rover mission, run before and after every change to the hot paths.
+# Seeded synthetic missions are run through main.run_mission, and its output compared with the one of the reference
+# implementations: token by token parameters, letter by letter instructions and step by step movements. Both the
+# end positions and the exceptions raised, with their messages, must be the same.
+# Usage: python correctness.py [--seed S] [--missions N], exit status is 1 if any check fails.
+
+# Python imports
+import argparse
+import collections
+import os
+import random
+import sys
+import tempfile
+from io import StringIO
+
+# Custom imports
+from project_rover.common_params import value_zero, value_one, value_two
+from project_rover.coordinates import Coordinates as myCoordinate
+from project_rover.rover import Rover
+from project_rover.rover_exceptions import ExceptionIncompleteDataReceived, ExceptionRoverAttemptingToExitKnownPlane, \
+    ExceptionRoverCollision, ExceptionNoPathFound
+from project_rover import rover as rover_module
+from project_rover import main as main_module
+from project_rover import instrumentation
+from project_rover import mission_generator
+from project_rover import fleet_simulator
+from project_rover import trajectory
+from project_rover import movement_engine
+from project_rover.path_planner import plan_instructions
+
+# Missions with values the generator does not build, more digits than int() converts on Python 3.11 or newer, and
+# letters longer once upper cased
+edge_missions = [
+    ["5 5", "1" * 5000 + " 2 N", "M"],
+    ["1" * 5000 + " 5", "1 2 N", "M"],
+    ["5 5", "1 " + "2" * 5000 + " N", "M", "1 2 N", "M"],
+    ["5 5", "1 2 N", "mM\u00df", "3 3 E", "\ufb01M"]
+]
+
+# Planned sets of instructions checked against a breadth first search, on planes up to this size
+planner_checks = 500
+planner_plane_size = 7
+
+# Missions with long sets of instructions, so that movements are split into many segments or periodic ones are
+# fast forwarded, one per this many missions
+long_mission_ratio = 10
+
+
+def run_reference_mission(input_stream, output_stream, paths=None):
+    """
+    run_reference_mission(): Function that will run a mission as main.run_mission does, with the reference
+    implementation of each stage.
+    :param input_stream: File object (or any iterable of lines) containing the mission.
+    :param output_stream: File object where the results will be written.
+    :param paths: Optional list where the path of every Rover moved is appended, as execute_path_step_by_step does.
+    :return: Nothing
+    """
+    mission_coordinates = myCoordinate()
+    mission_lines = main_module.read_mission_lines(input_stream)
+
+    plane_line = next((line for line in mission_lines if line.strip()), None)
+    if plane_line is None:
+        return
+
+    try:
+        mission_coordinates.set_top_right_coordinates(main_module.parse_rover_parameters_token_by_token(
+            plane_line, main_module.first_line_types, mission_coordinates))
+    except main_module.rover_exceptions_list as e:
+        output_stream.write("Top right coordinates:\n{}\n".format(e))
+        return
+
+    for count, (position_line, instructions_line) in enumerate(main_module.read_mission_rovers(mission_lines),
+                                                               start=value_one):
+        rover = Rover(count)
+
+        try:
+            rover.set_rover_start_position(main_module.parse_rover_parameters_token_by_token(
+                position_line, main_module.second_line_types, mission_coordinates), mission_coordinates)
+
+            if instructions_line is None:
+                raise ExceptionIncompleteDataReceived(value_zero, value_one, "Set of instructions not received")
+
+            rover.requested_list_of_instructions = rover_module.parse_set_of_instructions_letter_by_letter(
+                rover, instructions_line)
+            if paths is None:
+                rover.end_position = rover_module.execute_movement_step_by_step(rover, mission_coordinates)
+            else:
+                rover.end_position = execute_path_step_by_step(rover, mission_coordinates, paths)
+            output_stream.write("{} final position: {}\n".format(rover.rover_id, rover.end_position))
+
+            mission_coordinates.set_occupied_position(rover.end_position)
+        except main_module.rover_exceptions_list as e:
+            output_stream.write("{}:\n{}\n".format(rover.rover_id, e))
+
+
+def execute_path_step_by_step(rover, coordinates, paths):
+    """
+    execute_path_step_by_step(): Function that will execute the movements of a Rover one at a time with the step by
+    step reference, keeping every position reached, the first wrong one included, as trajectory files do.
+    :param rover: Rover object.
+    :param coordinates: Coordinates object.
+    :param paths: List where a tuple (Rover number, list of positions, trajectory status) is appended.
+    :return: Last position after having executed all the list of movements.
+    """
+    path = [list(rover.start_position)]
+    step_rover = Rover(rover.rover_number)
+
+    for command in rover.requested_list_of_instructions:
+        step_rover.set_rover_start_position(path[-value_one])
+        step_rover.requested_list_of_instructions = [command]
+
+        try:
+            path.append(rover_module.execute_movement_step_by_step(step_rover, coordinates))
+        except (ExceptionRoverAttemptingToExitKnownPlane, ExceptionRoverCollision) as e:
+            path.append(list(e.first_wrong_position))
+            paths.append((rover.rover_number, path, trajectory.status_rejected))
+            raise
+
+    paths.append((rover.rover_number, path, trajectory.status_finished))
+    return path[-value_one]
+
+
+def run_mission_output(mission, report_coverage=False):
+    """
+    run_mission_output(): Function that will return the lines written by main.run_mission for a mission, without
+    the coverage of the plane.
+    """
+    output_stream = StringIO()
+    main_module.run_mission(mission, output_stream, report_coverage)
+    lines = output_stream.getvalue().splitlines()
+
+    if report_coverage and lines and lines[-value_one].startswith("Plane coverage"):
+        lines.pop()
+
+    return lines
+
+
+def run_instrumented_mission_output(mission):
+    """
+    run_instrumented_mission_output(): Function that will return the lines written by main.run_mission for a
+    mission, with instrumentation enabled.
+    """
+    instrumentation.enable_instrumentation()
+    try:
+        return run_mission_output(mission)
+    finally:
+        instrumentation.disable_instrumentation()
+
+
+# Ways of running a mission checked against the reference one
+mission_variants = {
+    'run_mission': run_mission_output,
+    'run_mission with coverage': lambda mission: run_mission_output(mission, report_coverage=True),
+    'run_mission instrumented': run_instrumented_mission_output
+}
+
+
+def check_classic_mission():
+    """
+    check_classic_mission(): Function that will check the example of the problem statement.
+    :return: True if the output is the expected one.
+    """
+    output = run_mission_output(mission_generator.classic_mission)
+
+    if output != list(mission_generator.classic_mission_output):
+        print("\t[!!]\tClassic mission, expected {} got {}".format(list(mission_generator.classic_mission_output),
+                                                                  output))
+        return False
+
+    return True
+
+
+def check_occupied_start_mission():
+    """
+    check_occupied_start_mission(): Function that will check that Rovers can not be deployed where another Rover
+    finished.
+    :return: True if the output is the expected one.
+    """
+    mission = ["5 5", "1 3 N", "", "1 3 N", "M", "1 3 E", "LM"]
+    message = "Rover can not be deployed where another Rover is placed"
+    expected_output = ["Rover[1] final position: [1, 3, 'N']"]
+    for count, heading in ((2, 'N'), (3, 'E')):
+        expected_output.append("Rover[{}]:".format(count))
+        expected_output.extend(str(ExceptionRoverCollision([value_one, 3, heading], message)).splitlines())
+
+    output = run_mission_output(mission)
+
+    if output != expected_output:
+        print("\t[!!]\tOccupied start mission, expected {} got {}".format(expected_output, output))
+        return False
+
+    return True
+
+
+def check_generated_missions(name, missions):
+    """
+    check_generated_missions(): Function that will run every mission with each variant and with the reference
+    implementation, reporting the first line that differs for each variant.
+    :param name: Name of the group of missions, for the report.
+    :param missions: Iterable of missions, each of them a list of lines.
+    :return: Number of runs failing, one per mission and variant.
+    """
+    failures = value_zero
+
+    for index, mission in enumerate(missions):
+        reference_stream = StringIO()
+        run_reference_mission(mission, reference_stream)
+        reference_output = reference_stream.getvalue().splitlines()
+
+        for variant_name in sorted(mission_variants.keys()):
+            output = mission_variants[variant_name](mission)
+
+            if output != reference_output:
+                failures += value_one
+                first_difference = next((count for count, (line, reference_line)
+                                         in enumerate(zip(output, reference_output)) if line != reference_line),
+                                        min(len(output), len(reference_output)))
+                print("\t[!!]\t{} mission {}, {} differs at line {}:\n\t\t{!r}\n\t\tReference: {!r}".format(
+                    name, index, variant_name, first_difference,
+                    output[first_difference] if first_difference < len(output) else None,
+                    reference_output[first_difference] if first_difference < len(reference_output) else None))
+
+    return failures
+
+
+def check_fleet_missions(missions):
+    """
+    check_fleet_missions(): Function that will move, with the vectorized simulator, the Rovers of even position of
+    each mission on a plane where the ones of odd position are already deployed, and compare every end position and
+    exception with the step by step reference.
+    :param missions: Iterable of missions without wrong lines, each of them a list of lines.
+    :return: Number of Rovers failing, None if NumPy is not installed.
+    """
+    if fleet_simulator.numpy is None:
+        return None
+
+    failures = value_zero
+
+    for index, mission in enumerate(missions):
+        coordinates = myCoordinate()
+        coordinates.set_top_right_coordinates(main_module.parse_rover_parameters(mission[value_zero],
+                                                                                 main_module.first_line_types,
+                                                                                 coordinates))
+        rovers = list()
+        for count, (position_line, instructions_line) in enumerate(zip(mission[value_one::2], mission[2::2])):
+            rover = Rover(count + value_one)
+            rover.set_rover_start_position(main_module.parse_rover_parameters(position_line,
+                                                                              main_module.second_line_types,
+                                                                              coordinates))
+            rover.set_list_of_instructions(instructions_line)
+
+            if count % 2:
+                coordinates.set_occupied_position(rover.start_position)
+            else:
+                rovers.append(rover)
+
+        end_positions, errors = fleet_simulator.simulate_fleet([rover.start_position for rover in rovers],
+                                                               [rover.requested_list_of_instructions
+                                                                for rover in rovers], coordinates)
+
+        for rover, end_position, error in zip(rovers, end_positions, errors):
+            try:
+                reference = rover_module.execute_movement_step_by_step(rover, coordinates)
+            except (ExceptionRoverAttemptingToExitKnownPlane, ExceptionRoverCollision) as e:
+                reference = str(e)
+
+            if (end_position if error is None else str(error)) != reference:
+                failures += value_one
+                print("\t[!!]\tFleet mission {}, {} got {!r}\n\t\tReference: {!r}".format(
+                    index, rover.rover_id, end_position if error is None else str(error), reference))
+
+    return failures
+
+
+def check_trajectory_missions(missions):
+    """
+    check_trajectory_missions(): Function that will run every mission writing a trajectory file, read it back through
+    its memory map, and compare the path of every Rover with the positions reached by the step by step reference.
+    :param missions: Iterable of missions, each of them a list of lines.
+    :return: Number of missions failing.
+    """
+    failures = value_zero
+    trajectory_descriptor, trajectory_path = tempfile.mkstemp(suffix=".trj")
+    os.close(trajectory_descriptor)
+
+    try:
+        for index, mission in enumerate(missions):
+            with trajectory.TrajectoryWriter(trajectory_path) as trajectory_writer:
+                main_module.run_mission(mission, StringIO(), trajectory=trajectory_writer)
+
+            reference_paths = list()
+            run_reference_mission(mission, StringIO(), reference_paths)
+
+            with trajectory.TrajectoryReader(trajectory_path) as trajectory_reader:
+                paths = [(trajectory_reader.rover_entry(count)[value_zero], list(trajectory_reader.positions(count)),
+                          trajectory_reader.rover_entry(count)[3]) for count in range(len(trajectory_reader))]
+
+            if paths != reference_paths:
+                failures += value_one
+                first_difference = next((count for count, (path, reference_path)
+                                         in enumerate(zip(paths, reference_paths)) if path != reference_path),
+                                        min(len(paths), len(reference_paths)))
+                print("\t[!!]\tTrajectory mission {}, path {} differs:\n\t\t{!r}\n\t\tReference: {!r}".format(
+                    index, first_difference, paths[first_difference] if first_difference < len(paths) else None,
+                    reference_paths[first_difference] if first_difference < len(reference_paths) else None))
+    finally:
+        os.remove(trajectory_path)
+
+    return failures
+
+
+def count_shortest_instructions(coordinates, start_position, goal_position):
+    """
+    count_shortest_instructions(): Function that will work out, with a breadth first search over (x, y, heading)
+    states, the length of the shortest set of instructions taking a Rover from the start position to the goal one.
+    :param coordinates: Coordinates object, with Rovers already deployed if any.
+    :param start_position: Rover start position [x, y, orientation].
+    :param goal_position: Goal position [x, y, orientation].
+    :return: Number of instructions, None if the goal can not be reached.
+    """
+    max_x, max_y = coordinates.top_right_coordinates
+    start_state = (start_position[value_zero], start_position[value_one],
+                   movement_engine.heading_codes[start_position[value_two]])
+    goal_state = (goal_position[value_zero], goal_position[value_one],
+                  movement_engine.heading_codes[goal_position[value_two]])
+    distances = {start_state: value_zero}
+    states = collections.deque([start_state])
+
+    while states:
+        x, y, heading = states.popleft()
+        if (x, y, heading) == goal_state:
+            return distances[goal_state]
+
+        next_x, next_y = x + movement_engine.delta_x[heading], y + movement_engine.delta_y[heading]
+        next_states = [(x, y, movement_engine.turn_table[code][heading])
+                       for code in (movement_engine.instruction_left, movement_engine.instruction_right)]
+        if value_zero <= next_x <= max_x and value_zero <= next_y <= max_y and \
+                not coordinates.is_occupied(next_x, next_y):
+            next_states.append((next_x, next_y, heading))
+
+        for state in next_states:
+            if state not in distances:
+                distances[state] = distances[(x, y, heading)] + value_one
+                states.append(state)
+
+    return None
+
+
+def check_planned_instructions(seed):
+    """
+    check_planned_instructions(): Function that will plan instructions between random positions of small planes with
+    Rovers already deployed, execute them with the step by step reference, and check they reach the goal with as
+    few instructions as a breadth first search needs. Goals that can not be reached must raise ExceptionNoPathFound.
+    :param seed: Seed of the random generator.
+    :return: Number of plans failing.
+    """
+    generator = random.Random(seed)
+    failures = value_zero
+
+    # Goal walled in by Rovers in a corner, the search of a path has to give up
+    plans = [([value_two, value_two], [(value_one, value_zero), (value_zero, value_one)], [value_two, value_two, 'N'],
+              [value_zero, value_zero, 'S'])]
+
+    for _ in range(planner_checks):
+        top_right_coordinates = [generator.randint(value_zero, planner_plane_size) for _ in range(value_two)]
+        cells = [(x, y) for x in range(top_right_coordinates[value_zero] + value_one)
+                 for y in range(top_right_coordinates[value_one] + value_one)]
+        generator.shuffle(cells)
+        start_cell, goal_cell = cells[value_zero], cells[-value_one]
+        occupied_positions = cells[value_one:generator.randint(value_one, max(value_one, len(cells) // value_two))]
+        plans.append((top_right_coordinates, occupied_positions,
+                      [start_cell[value_zero], start_cell[value_one], generator.choice('NESW')],
+                      [goal_cell[value_zero], goal_cell[value_one], generator.choice('NESW')]))
+
+    for top_right_coordinates, occupied_positions, start_position, goal_position in plans:
+        coordinates = myCoordinate()
+        coordinates.set_top_right_coordinates(top_right_coordinates)
+        for position in occupied_positions:
+            coordinates.set_occupied_position(position)
+
+        shortest_length = count_shortest_instructions(coordinates, start_position, goal_position)
+
+        try:
+            rover = Rover(value_one)
+            rover.set_rover_start_position(start_position)
+            rover.requested_list_of_instructions = plan_instructions(coordinates, start_position, goal_position)
+            result = (len(rover.requested_list_of_instructions),
+                      rover_module.execute_movement_step_by_step(rover, coordinates))
+        except (ExceptionNoPathFound, ExceptionRoverAttemptingToExitKnownPlane, ExceptionRoverCollision) as e:
+            result = (None, type(e).__name__)
+
+        expected_result = (shortest_length, goal_position) if shortest_length is not None else \
+            (None, ExceptionNoPathFound.__name__)
+
+        if result != expected_result:
+            failures += value_one
+            print("\t[!!]\tPlan from {} to {} on {} with Rovers at {}, got {} expected {}".format(
+                start_position, goal_position, top_right_coordinates, occupied_positions, result, expected_result))
+
+    return failures
+
+
+def main():
+    """
+    main(): Function that will run every check and exit with status 1 if any of them fails.
+    :return: Nothing
+    """
+    parser = argparse.ArgumentParser(description="Rover mission correctness suite")
+    parser.add_argument('--seed', type=int, default=value_zero, help="Seed of the synthetic missions")
+    parser.add_argument('--missions', type=int, default=1000, help="Number of synthetic missions")
+    arguments = parser.parse_args()
+
+    failures = value_zero
+
+    if not check_classic_mission():
+        failures += value_one
+    print("{:>40} {}".format("Classic mission", "[!!]" if failures else "OK"))
+
+    occupied_start_correct = check_occupied_start_mission()
+    print("{:>40} {}".format("Occupied start mission", "OK" if occupied_start_correct else "[!!]"))
+    failures += value_zero if occupied_start_correct else value_one
+
+    groups = [
+        ("Edge", edge_missions),
+        ("Generated", mission_generator.generate_missions(arguments.seed, arguments.missions)),
+        ("Long", mission_generator.generate_missions(arguments.seed, arguments.missions // long_mission_ratio,
+                                                     plane_sizes=(1000, 10 ** 5), rover_counts=(value_one, 5),
+                                                     mean_lengths=(10 ** 4,))),
+        ("Patrol", mission_generator.generate_missions(arguments.seed, arguments.missions // long_mission_ratio,
+                                                       plane_sizes=(10, 1000, 10 ** 5), rover_counts=(value_one, 5),
+                                                       mean_lengths=(1000, 10 ** 4), patrol_rate=0.8))
+    ]
+
+    for name, missions in groups:
+        group_failures = check_generated_missions(name, missions)
+        print("{:>40} {}".format("{} missions (seed {})".format(name, arguments.seed),
+                                 "{} failing".format(group_failures) if group_failures else "OK"))
+        failures += group_failures
+
+    # Rovers already deployed on the plane, the vectorized simulator looks for them with NumPy
+    fleet_failures = check_fleet_missions(mission_generator.generate_missions(
+        arguments.seed, arguments.missions // long_mission_ratio, rover_counts=(5, 20), error_rate=0.0))
+    print("{:>40} {}".format("Fleet missions (seed {})".format(arguments.seed),
+                             "skipped, NumPy not installed" if fleet_failures is None else
+                             "{} failing".format(fleet_failures) if fleet_failures else "OK"))
+    failures += fleet_failures or value_zero
+
+    # Paths written to trajectory files and read back, so that a change of the record format is noticed
+    trajectory_failures = check_trajectory_missions(mission_generator.generate_missions(
+        arguments.seed, arguments.missions // long_mission_ratio))
+    print("{:>40} {}".format("Trajectory missions (seed {})".format(arguments.seed),
+                             "{} failing".format(trajectory_failures) if trajectory_failures else "OK"))
+    failures += trajectory_failures
+
+    planner_failures = check_planned_instructions(arguments.seed)
+    print("{:>40} {}".format("Planned instructions (seed {})".format(arguments.seed),
+                             "{} failing".format(planner_failures) if planner_failures else "OK"))
+    failures += planner_failures
+
+    if failures:
+        sys.exit(value_one)
+
+
+if __name__ == "__main__":
+    main()
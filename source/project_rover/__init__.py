@@ -0,0 +1,4 @@
+# Project Rover: deploy and move Rovers on a rectangular plateau.
+# Nothing is imported here, so that starting the command line only loads the modules it really needs.
+
+__version__ = "2.0.0"
@@ -0,0 +1,6 @@
+# Allows running the command line as "python -m project_rover"
+
+# Custom imports
+from .cli import main
+
+main()
@@ -0,0 +1,59 @@
+# Command line entry point. Kept apart from main.py so that parsing the arguments, or asking for help, does not
+# load any of the modules moving the Rovers; those are imported once it is known which mode is going to run.
+
+# Python imports
+import argparse
+
+
+def build_argument_parser():
+    """
+    build_argument_parser(): function that will create the parser of the command line arguments.
+    :return: argparse.ArgumentParser object.
+    """
+    parser = argparse.ArgumentParser(prog="project-rover", description="Deploy and move Rovers on the plateau")
+    parser.add_argument('missions', nargs='*', help="Mission files, \"-\" for stdin, keyboard is used if none")
+    parser.add_argument('--coverage', action='store_true', help="Write the coverage of the plane of each mission")
+    parser.add_argument('--trajectory', default=None, help="Binary file where every step of every Rover is written")
+    parser.add_argument('--metrics-json', default=None, help="File where the timings and counters of every stage "
+                                                             "are written as JSON")
+    parser.add_argument('--metrics-prometheus', default=None, help="File where the timings and counters of every "
+                                                                   "stage are written in the Prometheus text format")
+
+    return parser
+
+
+def main(argv=None):
+    """
+    main(): Ye ye here we go! Function that will read the command line and run either the batch or the interactive
+    mode.
+    :param argv: List of arguments, the ones of the command line by default.
+    :return: Nothing
+    """
+    arguments = build_argument_parser().parse_args(argv)
+
+    # Rover modules are only loaded once the arguments are known to be correct
+    from . import main as main_module
+
+    if arguments.metrics_json is not None or arguments.metrics_prometheus is not None:
+        # Instrumentation is optional, its module is only loaded when requested
+        from .instrumentation import enable_instrumentation
+        recorder = enable_instrumentation()
+    else:
+        recorder = None
+
+    try:
+        if arguments.missions:
+            # Mission files received, no need to ask for keyboard inputs
+            main_module.batch_main(arguments.missions, arguments.coverage, arguments.trajectory)
+        else:
+            main_module.main()
+    finally:
+        if recorder is not None:
+            if arguments.metrics_json is not None:
+                recorder.write_json(arguments.metrics_json)
+            if arguments.metrics_prometheus is not None:
+                recorder.write_prometheus(arguments.metrics_prometheus)
+
+
+if __name__ == "__main__":
+    main()
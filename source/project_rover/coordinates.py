@@ -0,0 +1,112 @@
+# Python imports
+import bisect
+import types
+
+# Custom imports
+from .common_params import value_zero, value_one
+
+
+# Tables shared by every plane, read only
+coordinates_definition = ('X', 'Y')
+bottom_left_coordinates = (value_zero, value_zero)
+sorted_cardinal_points_list = ('N', 'E', 'S', 'W')
+cardinal_points = types.MappingProxyType({
+    'N': types.MappingProxyType({'Coordinate': 'Y', 'Movement': value_one}),
+    'E': types.MappingProxyType({'Coordinate': 'X', 'Movement': value_one}),
+    'S': types.MappingProxyType({'Coordinate': 'Y', 'Movement': -value_one}),
+    'W': types.MappingProxyType({'Coordinate': 'X', 'Movement': -value_one})
+})
+
+
+class Coordinates:
+    # Only the plane edge and the Rovers already deployed belong to each plane, tables are shared
+    __slots__ = ('top_right_coordinates', 'occupied_positions', 'occupied_by_column', 'occupied_by_row')
+
+    coordinates_definition = coordinates_definition
+    bottom_left_coordinates = bottom_left_coordinates
+    sorted_cardinal_points_list = sorted_cardinal_points_list
+    cardinal_points = cardinal_points
+
+    def __init__(self):
+        self.top_right_coordinates = None
+        # Final positions of Rovers already deployed, sparse so that huge planes don't need a grid
+        self.occupied_positions = set()
+        # Same positions indexed by column (X -> sorted Ys) and by row (Y -> sorted Xs), for checking whole segments
+        self.occupied_by_column = dict()
+        self.occupied_by_row = dict()
+
+    def set_top_right_coordinates(self, top_right_coordinates):
+        self.top_right_coordinates = top_right_coordinates
+
+    def set_occupied_position(self, position):
+        """
+        Setter for the final position of a Rover that finished moving, no other Rover can go through it.
+        """
+        x, y = position[value_zero], position[value_one]
+
+        if (x, y) not in self.occupied_positions:
+            self.occupied_positions.add((x, y))
+            bisect.insort(self.occupied_by_column.setdefault(x, list()), y)
+            bisect.insort(self.occupied_by_row.setdefault(y, list()), x)
+
+    def is_occupied(self, x, y):
+        """
+        Coordinates's function that will return whether a Rover is already placed at (x, y) or not.
+        """
+        return (x, y) in self.occupied_positions
+
+    def is_area_occupied(self, min_x, min_y, max_x, max_y):
+        """
+        Coordinates's function that will return whether a Rover is already placed inside the given box or not.
+        Either the rows of the box or the rows with Rovers are visited, whatever is smaller.
+        """
+        if not self.occupied_positions:
+            return False
+
+        if max_y - min_y < len(self.occupied_by_row):
+            rows = (self.occupied_by_row.get(y) for y in range(min_y, max_y + value_one))
+        else:
+            rows = (line for y, line in self.occupied_by_row.items() if min_y <= y <= max_y)
+
+        for line in rows:
+            if line:
+                index = bisect.bisect_left(line, min_x)
+                if index < len(line) and line[index] <= max_x:
+                    return True
+
+        return False
+
+    def find_first_occupied_step(self, x, y, delta_x, delta_y, movements):
+        """
+        Coordinates's function that will look for the first occupied position found whilst moving straight from
+        (x, y), one of delta_x and delta_y being zero.
+        :param x: X coordinate where the movement starts, not checked.
+        :param y: Y coordinate where the movement starts, not checked.
+        :param delta_x: Movement done on X axis per step.
+        :param delta_y: Movement done on Y axis per step.
+        :param movements: Number of steps.
+        :return: Number of steps until reaching the first occupied position, None if there is no one.
+        """
+        if not self.occupied_positions:
+            return None
+
+        if delta_x:
+            line, start, delta = self.occupied_by_row.get(y), x, delta_x
+        else:
+            line, start, delta = self.occupied_by_column.get(x), y, delta_y
+
+        if not line:
+            return None
+
+        if delta > value_zero:
+            # First occupied position after start
+            index = bisect.bisect_right(line, start)
+            if index < len(line) and line[index] - start <= movements:
+                return line[index] - start
+        else:
+            # Last occupied position before start
+            index = bisect.bisect_left(line, start) - value_one
+            if index >= value_zero and start - line[index] <= movements:
+                return start - line[index]
+
+        return None
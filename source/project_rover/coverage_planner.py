@@ -0,0 +1,440 @@
+# Generator of sets of instructions for a fleet of Rovers which, together, visit every position of the plane.
+# The plane is swept in boustrophedon: lanes along its longest axis, run one way and the next one back, so that only
+# two rotations are needed per lane. The sweep of each region of the plane Rovers already deployed do not wall off is
+# split into as many consecutive parts of the same length as Rovers starting in it, and each Rover gets the part
+# closest to it in sweep order. Where the position a Rover finishes at walls off the part of a Rover moving later,
+# the Rovers moving first get the parts farthest along the sweep instead. Positions of Rovers already deployed are
+# skipped, going around them with the path planner, which also takes each Rover to the beginning of its part.
+
+# Python imports
+import bisect
+
+# Custom imports
+from .common_params import value_zero, value_one, value_two
+from .coordinates import Coordinates as myCoordinate
+from .movement_engine import heading_names, heading_codes, delta_x, delta_y
+from .path_planner import plan_instructions
+from .plane_coverage import CoverageMap
+from .rover import Rover
+from .rover_exceptions import ExceptionNoPathFound
+
+# Rotations taking a Rover from a heading to another one, indexed by (other heading - heading) % 4
+rotation_instructions = ('', 'R', 'RR', 'L')
+
+
+class SweepLanes:
+    """
+    SweepLanes Class object, the order in which the boustrophedon visits the positions of a plane. Lanes follow the
+    longest axis, each position has a sweep index, from 0 to the number of positions of the plane.
+    """
+    def __init__(self, coordinates):
+        self.min_x, self.min_y = coordinates.bottom_left_coordinates
+        max_x, max_y = coordinates.top_right_coordinates
+        width = max_x - self.min_x + value_one
+        height = max_y - self.min_y + value_one
+
+        # Lanes are columns run North then South, or rows run East then West, whatever needs less lanes
+        self.lanes_are_columns = height >= width
+        self.number_of_lanes, self.lane_length = (width, height) if self.lanes_are_columns else (height, width)
+        forward_heading = heading_codes['N' if self.lanes_are_columns else 'E']
+        self.lane_headings = (forward_heading, (forward_heading + value_two) % len(heading_names))
+
+    def __len__(self):
+        return self.number_of_lanes * self.lane_length
+
+    def position(self, lane, offset):
+        """
+        SweepLanes's function that will return the (x, y) position of an offset along a lane, counted from the
+        bottom or left edge.
+        """
+        if self.lanes_are_columns:
+            return self.min_x + lane, self.min_y + offset
+        return self.min_x + offset, self.min_y + lane
+
+    def lane_and_offset(self, x, y):
+        """
+        SweepLanes's function that will return the lane and the offset along it of an (x, y) position.
+        """
+        if self.lanes_are_columns:
+            return x - self.min_x, y - self.min_y
+        return y - self.min_y, x - self.min_x
+
+    def sweep_index(self, x, y):
+        """
+        SweepLanes's function that will return the sweep index of an (x, y) position.
+        """
+        lane, offset = self.lane_and_offset(x, y)
+        if lane % value_two:
+            offset = self.lane_length - value_one - offset
+        return lane * self.lane_length + offset
+
+    def lane_runs(self, first_index, last_index):
+        """
+        SweepLanes's function that will split a range of sweep indexes into the runs done along each lane.
+        :param first_index: First sweep index, included.
+        :param last_index: Last sweep index, excluded.
+        :return: Yields tuples (lane, first offset, last offset, heading code), offsets in the order they are visited.
+        """
+        while first_index < last_index:
+            lane, first_step = divmod(first_index, self.lane_length)
+            last_step = min(self.lane_length, first_step + last_index - first_index) - value_one
+
+            if lane % value_two:
+                yield lane, self.lane_length - value_one - first_step, self.lane_length - value_one - last_step, \
+                    self.lane_headings[value_one]
+            else:
+                yield lane, first_step, last_step, self.lane_headings[value_zero]
+
+            first_index += last_step - first_step + value_one
+
+
+def generate_coverage_instructions(coordinates, start_positions):
+    """
+    generate_coverage_instructions(): Function that will build, for each Rover, the set of instructions that makes
+    the fleet visit every position of the plane, Rovers being moved one after the other as in a mission.
+    Rovers already deployed can split the plane into regions, each one is shared among the Rovers starting in it.
+    Positions of Rovers already deployed, and regions with no Rover, are left unvisited. Each Rover gets the part
+    closest to it in sweep order. If a Rover is walled off from its part by the Rovers moving before it, the parts
+    of its region go to the Rovers in the order they move, farthest along the sweep first. If one is still walled
+    off, the last Rover to move in the region stays where it is and the region is split again among the other ones:
+    a single Rover moving visits its whole region.
+    :param coordinates: Coordinates object, with Rovers already deployed if any.
+    :param start_positions: List of start positions [x, y, orientation], one per Rover, in the order they will move.
+    :return: List of strings of instructions, one per Rover.
+    """
+    lanes = SweepLanes(coordinates)
+
+    # Offsets of the Rovers already deployed along each lane, sorted
+    deployed_offsets = dict()
+    for x, y in coordinates.occupied_positions:
+        lane, offset = lanes.lane_and_offset(x, y)
+        if value_zero <= lane < lanes.number_of_lanes and value_zero <= offset < lanes.lane_length:
+            bisect.insort(deployed_offsets.setdefault(lane, list()), offset)
+
+    region_intervals, find_region = _find_sweep_regions(lanes, deployed_offsets)
+    rover_regions = list()
+
+    for x, y, _ in start_positions:
+        region = find_region(*lanes.lane_and_offset(x, y))
+
+        if region is None and (x, y) in coordinates.occupied_positions:
+            # Rovers placed on a Rover already deployed can still leave it, towards the first free position next to it
+            region = next((next_region for next_region in (find_region(*lanes.lane_and_offset(x + step_x, y + step_y))
+                                                           for step_x, step_y in zip(delta_x, delta_y))
+                           if next_region is not None), None)
+
+        rover_regions.append(region)
+
+    # Rovers starting out of the plane, or walled in, stay where they are
+    moving_rovers = [rover for rover, region in enumerate(rover_regions) if region is not None]
+    farthest_first_regions = set()
+
+    while True:
+        lists_of_instructions, blocked_rover = _plan_parts(coordinates, lanes, deployed_offsets, region_intervals,
+                                                           rover_regions, start_positions, moving_rovers,
+                                                           farthest_first_regions)
+        if blocked_rover is None:
+            return lists_of_instructions
+
+        blocked_region = rover_regions[blocked_rover]
+        if blocked_region not in farthest_first_regions:
+            farthest_first_regions.add(blocked_region)
+        else:
+            moving_rovers.remove(max(rover for rover in moving_rovers if rover_regions[rover] == blocked_region))
+
+
+def _find_sweep_regions(lanes, deployed_offsets):
+    """
+    _find_sweep_regions(): Function that will split the positions not occupied by Rovers already deployed into
+    regions, positions of different regions can not reach each other. Runs of free positions along each lane are
+    joined with the ones they touch on the next lane.
+    :param lanes: SweepLanes object of the plane.
+    :param deployed_offsets: Dictionary of the sorted offsets of the Rovers already deployed, by lane.
+    :return: Tuple (list of the ranges of sweep indexes (first included, last excluded) of each region, in sweep
+    order, function returning the region of a lane and offset, None if the position is not free).
+    """
+    runs = list()
+    first_run_of_lane = list()
+
+    for lane in range(lanes.number_of_lanes):
+        first_run_of_lane.append(len(runs))
+        low_offset = value_zero
+        for offset in deployed_offsets.get(lane, list()) + [lanes.lane_length]:
+            if offset > low_offset:
+                runs.append((lane, low_offset, offset - value_one))
+            low_offset = offset + value_one
+    first_run_of_lane.append(len(runs))
+
+    # Union find of the runs touching each other on consecutive lanes
+    parents = list(range(len(runs)))
+
+    def find(run):
+        while parents[run] != run:
+            parents[run] = parents[parents[run]]
+            run = parents[run]
+        return run
+
+    for lane in range(lanes.number_of_lanes - value_one):
+        run, next_run = first_run_of_lane[lane], first_run_of_lane[lane + value_one]
+        last_run, last_next_run = first_run_of_lane[lane + value_one], first_run_of_lane[lane + value_two]
+
+        while run < last_run and next_run < last_next_run:
+            _, low_offset, high_offset = runs[run]
+            _, next_low_offset, next_high_offset = runs[next_run]
+
+            if low_offset <= next_high_offset and next_low_offset <= high_offset:
+                parents[find(run)] = find(next_run)
+
+            if high_offset < next_high_offset:
+                run += value_one
+            else:
+                next_run += value_one
+
+    # Regions numbered in sweep order, odd lanes are run the other way
+    region_numbers = dict()
+    region_intervals = list()
+    run_regions = [None] * len(runs)
+
+    for lane in range(lanes.number_of_lanes):
+        lane_runs = range(first_run_of_lane[lane], first_run_of_lane[lane + value_one])
+        for run in (reversed(lane_runs) if lane % value_two else lane_runs):
+            _, low_offset, high_offset = runs[run]
+            run_regions[run] = region_numbers.setdefault(find(run), len(region_numbers))
+            if run_regions[run] == len(region_intervals):
+                region_intervals.append(list())
+
+            first_index = lanes.sweep_index(*lanes.position(lane, high_offset if lane % value_two else low_offset))
+            region_intervals[run_regions[run]].append((first_index, first_index + high_offset - low_offset +
+                                                       value_one))
+
+    def find_region(lane, offset):
+        if not (value_zero <= lane < lanes.number_of_lanes and value_zero <= offset < lanes.lane_length):
+            return None
+
+        lane_runs = runs[first_run_of_lane[lane]:first_run_of_lane[lane + value_one]]
+        run = bisect.bisect_right([low_offset for _, low_offset, _ in lane_runs], offset) - value_one
+        if run < value_zero or offset > lane_runs[run][value_two]:
+            return None
+
+        return run_regions[first_run_of_lane[lane] + run]
+
+    return region_intervals, find_region
+
+
+def _split_intervals(intervals, number_of_parts):
+    """
+    _split_intervals(): Function that will split ranges of sweep indexes into consecutive parts with the same number
+    of positions.
+    :param intervals: List of ranges (first included, last excluded), in sweep order.
+    :param number_of_parts: Number of parts.
+    :return: List of parts, each one a list of ranges.
+    """
+    number_of_positions = sum(last_index - first_index for first_index, last_index in intervals)
+    parts = [list() for _ in range(number_of_parts)]
+    part = value_zero
+    positions_before = value_zero
+
+    for first_index, last_index in intervals:
+        while first_index < last_index:
+            # Positions of the sweep, counted from the beginning of the region, where the part ends
+            part_end = number_of_positions * (part + value_one) // number_of_parts
+            taken = min(last_index - first_index, part_end - positions_before)
+
+            if taken:
+                parts[part].append((first_index, first_index + taken))
+                first_index += taken
+                positions_before += taken
+            if positions_before == part_end:
+                part += value_one
+
+    return parts
+
+
+def _plan_parts(coordinates, lanes, deployed_offsets, region_intervals, rover_regions, start_positions,
+                moving_rovers, farthest_first_regions):
+    """
+    _plan_parts(): Function that will split each region into as many parts as moving Rovers it has and build their
+    sets of instructions. Rovers sorted by sweep index of their start position take the parts in order, but on the
+    regions given, parts farthest along the sweep go to the Rovers moving first, so that the positions where Rovers
+    finish, at the end of their parts, are behind the parts still to be visited.
+    :param coordinates: Coordinates object, with Rovers already deployed if any.
+    :param lanes: SweepLanes object of the plane.
+    :param deployed_offsets: Dictionary of the sorted offsets of the Rovers already deployed, by lane.
+    :param region_intervals: List of the ranges of sweep indexes of each region.
+    :param rover_regions: List of the region of each Rover.
+    :param start_positions: List of start positions [x, y, orientation], one per Rover, in the order they will move.
+    :param moving_rovers: Indexes of the Rovers given a part, in the order they will move, the other ones stay.
+    :param farthest_first_regions: Set of the regions whose parts are given in the order Rovers move.
+    :return: Tuple (list of strings of instructions, first Rover not reaching a position of its part, or None).
+    """
+    # Positions no Rover can go through, Rovers that finish moving are added
+    occupied_positions = set(coordinates.occupied_positions)
+    occupied_offsets = dict((lane, list(offsets)) for lane, offsets in deployed_offsets.items())
+
+    region_rovers = dict()
+    for rover in moving_rovers:
+        region_rovers.setdefault(rover_regions[rover], list()).append(rover)
+
+    parts = [list() for _ in start_positions]
+    for region, rovers in region_rovers.items():
+        if region in farthest_first_regions:
+            rovers = rovers[::-1]
+        else:
+            rovers = sorted(rovers, key=lambda rover: lanes.sweep_index(start_positions[rover][value_zero],
+                                                                        start_positions[rover][value_one]))
+
+        for rover, part in zip(rovers, _split_intervals(region_intervals[region], len(rovers))):
+            parts[rover] = part
+
+    lists_of_instructions = list()
+    blocked_rover = None
+
+    for rover, start_position in enumerate(start_positions):
+        position = list(start_position)
+        instructions = list()
+
+        for first_index, last_index in parts[rover]:
+            for lane, first_offset, last_offset, heading in lanes.lane_runs(first_index, last_index):
+                for first_step, last_step in _free_steps(occupied_offsets.get(lane, ()), first_offset, last_offset):
+                    x, y = lanes.position(lane, first_step)
+                    if not _travel(coordinates, position, x, y, heading, occupied_positions, instructions):
+                        # Region reachable from the start position, only Rovers moved before can wall it off
+                        if blocked_rover is None:
+                            blocked_rover = rover
+                        continue
+
+                    if last_step != first_step:
+                        instructions.append('M' * abs(last_step - first_step))
+                        position[value_zero], position[value_one] = lanes.position(lane, last_step)
+
+        lists_of_instructions.append(''.join(instructions))
+
+        # Next Rovers can not go through this one
+        if (position[value_zero], position[value_one]) not in occupied_positions:
+            occupied_positions.add((position[value_zero], position[value_one]))
+            lane, offset = lanes.lane_and_offset(position[value_zero], position[value_one])
+            bisect.insort(occupied_offsets.setdefault(lane, list()), offset)
+
+    return lists_of_instructions, blocked_rover
+
+
+def _free_steps(occupied_offsets, first_offset, last_offset):
+    """
+    _free_steps(): Function that will split a run along a lane into the runs with no occupied position.
+    :param occupied_offsets: Sorted list of the occupied offsets of the lane.
+    :param first_offset: First offset of the run, in the order it is visited.
+    :param last_offset: Last offset of the run, in the order it is visited.
+    :return: Yields tuples (first offset, last offset), in the order they are visited.
+    """
+    step = value_one if last_offset >= first_offset else -value_one
+    low, high = min(first_offset, last_offset), max(first_offset, last_offset)
+    blocked = occupied_offsets[bisect.bisect_left(occupied_offsets, low):bisect.bisect_right(occupied_offsets, high)]
+
+    if step < value_zero:
+        blocked = blocked[::-1]
+
+    for offset in blocked:
+        if offset != first_offset:
+            yield first_offset, offset - step
+        first_offset = offset + step
+
+    if (last_offset - first_offset) * step >= value_zero:
+        yield first_offset, last_offset
+
+
+def _travel(coordinates, position, x, y, heading, occupied_positions, instructions):
+    """
+    _travel(): Function that will append the instructions taking a Rover from its position to (x, y), facing heading,
+    next to it going straight, otherwise through the path planner. position is updated.
+    :return: False if no path reaches (x, y), nothing is appended then.
+    """
+    current_heading = heading_codes[position[value_two]]
+    step_x, step_y = x - position[value_zero], y - position[value_one]
+
+    if (step_x, step_y) == (value_zero, value_zero):
+        instructions.append(rotation_instructions[(heading - current_heading) % len(heading_names)])
+    elif abs(step_x) + abs(step_y) == value_one:
+        step_heading = delta_x.index(step_x) if step_x else delta_y.index(step_y)
+        instructions.append(rotation_instructions[(step_heading - current_heading) % len(heading_names)])
+        instructions.append('M')
+        instructions.append(rotation_instructions[(heading - step_heading) % len(heading_names)])
+    else:
+        straight_instructions = _straight_instructions(position, x, y, heading, occupied_positions)
+        if straight_instructions is not None:
+            instructions.append(straight_instructions)
+        else:
+            try:
+                instructions.append(plan_instructions(coordinates, position, [x, y, heading_names[heading]],
+                                                      occupied_positions))
+            except ExceptionNoPathFound:
+                return False
+
+    position[:] = [x, y, heading_names[heading]]
+    return True
+
+
+def _straight_instructions(position, x, y, heading, occupied_positions):
+    """
+    _straight_instructions(): Function that will return the instructions taking a Rover from its position to (x, y),
+    facing heading, along one axis and then the other one, the order needing less rotations. Moves and rotations are
+    the fewest possible, as the path planner would find, if no occupied position is on the way.
+    :return: String of instructions, None if an occupied position is on the way.
+    """
+    number_of_headings = len(heading_names)
+    start_x, start_y = position[value_zero], position[value_one]
+    legs = list()
+
+    if x != start_x:
+        legs.append((delta_x.index(value_one if x > start_x else -value_one), abs(x - start_x)))
+    if y != start_y:
+        legs.append((delta_y.index(value_one if y > start_y else -value_one), abs(y - start_y)))
+
+    # Order of the legs needing less rotations, the other one may need more than the path planner finds
+    legs = min(legs, legs[::-1], key=lambda order: sum(
+        len(rotation_instructions[(next_heading - previous_heading) % number_of_headings])
+        for previous_heading, next_heading in zip([heading_codes[position[value_two]]] +
+                                                  [leg_heading for leg_heading, _ in order],
+                                                  [leg_heading for leg_heading, _ in order] + [heading])))
+
+    instructions = list()
+    current_heading = heading_codes[position[value_two]]
+    for leg_heading, leg_length in legs:
+        for step in range(value_one, leg_length + value_one):
+            if (start_x + delta_x[leg_heading] * step, start_y + delta_y[leg_heading] * step) in occupied_positions:
+                return None
+
+        instructions.append(rotation_instructions[(leg_heading - current_heading) % number_of_headings])
+        instructions.append('M' * leg_length)
+        start_x += delta_x[leg_heading] * leg_length
+        start_y += delta_y[leg_heading] * leg_length
+        current_heading = leg_heading
+
+    instructions.append(rotation_instructions[(heading - current_heading) % number_of_headings])
+    return ''.join(instructions)
+
+
+def check_coverage_instructions(coordinates, start_positions, lists_of_instructions):
+    """
+    check_coverage_instructions(): Function that will move every Rover with rover.execute_movement, one after the
+    other as in a mission, on a copy of the plane, recording the positions they visit.
+    :param coordinates: Coordinates object, with Rovers already deployed if any, it is not modified.
+    :param start_positions: List of start positions [x, y, orientation], one per Rover.
+    :param lists_of_instructions: List of strings of instructions, one per Rover.
+    :return: CoverageMap object with the positions visited, the exception of the first Rover failing is raised.
+    """
+    mission_coordinates = myCoordinate()
+    mission_coordinates.set_top_right_coordinates(list(coordinates.top_right_coordinates))
+    for x, y in coordinates.occupied_positions:
+        mission_coordinates.set_occupied_position([x, y])
+
+    coverage = CoverageMap(mission_coordinates)
+
+    for count, (start_position, list_of_instructions) in enumerate(zip(start_positions, lists_of_instructions),
+                                                                   start=value_one):
+        rover = Rover(count)
+        rover.set_rover_start_position(list(start_position))
+        rover.set_list_of_instructions(list_of_instructions)
+        rover.execute_movement(mission_coordinates, coverage)
+        mission_coordinates.set_occupied_position(rover.end_position)
+
+    return coverage
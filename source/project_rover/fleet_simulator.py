@@ -0,0 +1,171 @@
+# Vectorized simulator that moves a whole fleet of Rovers in lockstep on the same plane.
+# NumPy is an optional dependency, only needed when this module is used.
+
+# Python imports
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Custom imports
+from .common_params import value_zero, value_one, value_two
+from .rover_exceptions import ExceptionRoverAttemptingToExitKnownPlane, ExceptionRoverCollision
+from . import movement_engine
+
+# Padding used for Rovers whose list of instructions is shorter than the longest one, it does nothing
+instruction_padding = ' '
+instruction_none = 3
+
+
+def _build_tables():
+    """
+    _build_tables(): Function that will build the NumPy lookup tables from the movement engine ones.
+    :return: Tuple (instruction codes by character, heading rotation by instruction code, delta x, delta y).
+    """
+    instruction_codes = numpy.full(256, instruction_none, dtype=numpy.uint8)
+    instruction_codes[ord('M')] = movement_engine.instruction_move
+    instruction_codes[ord('L')] = movement_engine.instruction_left
+    instruction_codes[ord('R')] = movement_engine.instruction_right
+
+    number_of_headings = len(movement_engine.heading_names)
+    rotations = numpy.zeros(instruction_none + value_one, dtype=numpy.int8)
+    rotations[movement_engine.instruction_left] = number_of_headings - value_one
+    rotations[movement_engine.instruction_right] = value_one
+
+    return (instruction_codes, rotations, numpy.array(movement_engine.delta_x, dtype=numpy.int64),
+            numpy.array(movement_engine.delta_y, dtype=numpy.int64))
+
+
+def simulate_fleet(start_positions, lists_of_instructions, coordinates):
+    """
+    simulate_fleet(): Function that will pre-execute the list of instructions of N Rovers at the same time, one step
+    of every Rover per iteration. Positions and headings are kept in NumPy arrays, Rovers that finished their list of
+    instructions or tried to exit the plane are masked out with an instruction doing nothing. Results and errors are
+    the same ones the scalar rover.execute_movement returns for each Rover.
+    :param start_positions: List of N start positions [x, y, orientation], as set by set_rover_start_position.
+    :param lists_of_instructions: List of N parsed lists (or strings) of known movements.
+    :param coordinates: Coordinates object.
+    Rovers already deployed on the plane block the fleet, but fleet Rovers don't block each other.
+    :return: Tuple (end positions, errors), for each Rover either its end position or its
+    ExceptionRoverAttemptingToExitKnownPlane or ExceptionRoverCollision is set, the other one is None.
+    """
+    if numpy is None:
+        raise ImportError("NumPy is required for simulating a fleet of Rovers")
+
+    if len(start_positions) != len(lists_of_instructions):
+        raise ValueError("Every Rover needs a start position and a list of instructions")
+
+    number_of_rovers = len(start_positions)
+    end_positions = [None] * number_of_rovers
+    errors = [None] * number_of_rovers
+
+    if not number_of_rovers:
+        return end_positions, errors
+
+    instruction_codes, rotations, delta_x, delta_y = _build_tables()
+    number_of_headings = len(movement_engine.heading_names)
+    min_x, min_y = coordinates.bottom_left_coordinates
+    max_x, max_y = coordinates.top_right_coordinates
+
+    x = numpy.array([position[value_zero] for position in start_positions], dtype=numpy.int64)
+    y = numpy.array([position[value_one] for position in start_positions], dtype=numpy.int64)
+    heading = numpy.array([movement_engine.heading_codes[position[value_two]] for position in start_positions],
+                          dtype=numpy.int8)
+
+    # Rovers not starting in the plane have every single step checked by the scalar path, as the original does
+    in_plane = (x >= min_x) & (x <= max_x) & (y >= min_y) & (y <= max_y)
+
+    # One row per step, one column per Rover, padded with instructions doing nothing
+    instructions = [''.join(list_of_instructions) for list_of_instructions in lists_of_instructions]
+    number_of_steps = max(len(list_of_instructions) for list_of_instructions in instructions)
+
+    if number_of_steps:
+        padded_instructions = ''.join(list_of_instructions.ljust(number_of_steps, instruction_padding)
+                                      for list_of_instructions in instructions)
+        program = instruction_codes[numpy.frombuffer(padded_instructions.encode('ascii'), dtype=numpy.uint8)]
+        program = numpy.ascontiguousarray(program.reshape(number_of_rovers, number_of_steps).T)
+
+        # Rovers not starting in the plane are left to the scalar path
+        program[:, ~in_plane] = instruction_none
+        move_x = numpy.empty(number_of_rovers, dtype=numpy.int64)
+        move_y = numpy.empty(number_of_rovers, dtype=numpy.int64)
+
+        # Rovers already deployed on the plane, as sorted keys of their positions, fleet Rovers don't block each other
+        row_length = max_y - min_y + value_one
+        occupied_keys = numpy.array(sorted((occupied_x - min_x) * row_length + occupied_y - min_y
+                                           for occupied_x, occupied_y in coordinates.occupied_positions
+                                           if min_x <= occupied_x <= max_x and min_y <= occupied_y <= max_y),
+                                    dtype=numpy.int64)
+
+        for step, step_codes in enumerate(program):
+            heading += rotations[step_codes]
+            heading &= number_of_headings - value_one
+
+            moving = step_codes == movement_engine.instruction_move
+            numpy.multiply(delta_x[heading], moving, out=move_x)
+            numpy.multiply(delta_y[heading], moving, out=move_y)
+            x += move_x
+            y += move_y
+
+            exiting = moving & ((x < min_x) | (x > max_x) | (y < min_y) | (y > max_y))
+            if exiting.any():
+                for index in numpy.flatnonzero(exiting):
+                    errors[index] = movement_engine.build_exit_known_plane_exception(int(x[index]), int(y[index]),
+                                                                                     int(heading[index]),
+                                                                                     coordinates)
+                # Rover stops there, the rest of its list of instructions is masked out
+                program[step + value_one:, exiting] = instruction_none
+
+            if len(occupied_keys):
+                colliding = moving & ~exiting & numpy.isin((x - min_x) * row_length + y - min_y, occupied_keys)
+                if colliding.any():
+                    for index in numpy.flatnonzero(colliding):
+                        errors[index] = ExceptionRoverCollision([int(x[index]), int(y[index]),
+                                                                 movement_engine.heading_names[heading[index]]])
+                    program[step + value_one:, colliding] = instruction_none
+
+    for index in range(number_of_rovers):
+        if not in_plane[index]:
+            try:
+                end_positions[index] = movement_engine.execute_segmented_movement(start_positions[index],
+                                                                                  instructions[index], coordinates)
+            except (ExceptionRoverAttemptingToExitKnownPlane, ExceptionRoverCollision) as e:
+                errors[index] = e
+        elif errors[index] is None:
+            end_positions[index] = [int(x[index]), int(y[index]), movement_engine.heading_names[heading[index]]]
+
+    return end_positions, errors
+
+
+def execute_fleet_movement(rovers, coordinates):
+    """
+    execute_fleet_movement(): Function that will update the end position of every Rover of the fleet, moving all of
+    them at the same time.
+    :param rovers: List of Rover objects, with start position and list of instructions already set.
+    :param coordinates: Coordinates object.
+    :return: List of errors, None for Rovers that finished their list of instructions in the plane.
+    """
+    end_positions, errors = simulate_fleet([rover.start_position for rover in rovers],
+                                           [rover.requested_list_of_instructions for rover in rovers], coordinates)
+
+    for rover, end_position in zip(rovers, end_positions):
+        rover.end_position = end_position
+
+    return errors
+
+
+def execute_fleet_records(records, coordinates):
+    """
+    execute_fleet_records(): Function that will update the end position of every record of a RoverRecords object,
+    moving all of the Rovers at the same time, without building one Rover object per record.
+    :param records: RoverRecords object, with start positions and lists of instructions already set.
+    :param coordinates: Coordinates object.
+    :return: List of errors, None for Rovers that finished their list of instructions in the plane.
+    """
+    end_positions, errors = simulate_fleet([records.start_position(index) for index in range(len(records))],
+                                           records.instructions, coordinates)
+
+    for index, end_position in enumerate(end_positions):
+        records.set_end_position(index, end_position)
+
+    return errors
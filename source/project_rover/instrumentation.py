@@ -0,0 +1,44 @@
+# Optional instrumentation of the stages every Rover goes through: reading its parameters, reading its set of
+# instructions and executing its movement. Disabled by default, each stage only checks that no recorder is active,
+# so that the cost of having it is close to zero. This module is imported on every run, so it only holds that check;
+# the recorder, in instrumentation_recorder, is loaded once instrumentation is enabled. Once enabled, it keeps:
+#   - Wall time and number of calls of each stage.
+#   - Commands executed, and commands executed per second while executing movements.
+#   - Exceptions raised by each stage, by type.
+#   - Histogram of the lengths of the sets of instructions read.
+# Results can be exported as a JSON summary or in the Prometheus text format.
+
+stage_read_rover_parameters = 'read_rover_parameters'
+stage_read_set_of_instructions = 'read_set_of_instructions'
+stage_execute_movement = 'execute_movement'
+stages = (stage_read_rover_parameters, stage_read_set_of_instructions, stage_execute_movement)
+
+# Recorder in use, None while instrumentation is disabled
+active_recorder = None
+
+
+def enable_instrumentation(recorder=None):
+    """
+    enable_instrumentation(): Function that will start recording every stage from now on.
+    :param recorder: Instrumentation object to record to, a new one by default.
+    :return: Instrumentation object in use.
+    """
+    global active_recorder
+
+    if recorder is None:
+        # Recorder and the modules it needs are only loaded when instrumentation is enabled
+        from .instrumentation_recorder import Instrumentation
+        recorder = Instrumentation()
+
+    active_recorder = recorder
+    return active_recorder
+
+
+def disable_instrumentation():
+    """
+    disable_instrumentation(): Function that will stop recording.
+    :return: Instrumentation object that was in use, None if instrumentation was disabled.
+    """
+    global active_recorder
+    recorder, active_recorder = active_recorder, None
+    return recorder
@@ -0,0 +1,171 @@
+# Recorder of the optional instrumentation, the timings and counters of the stages every Rover goes through.
+# Only loaded by instrumentation.enable_instrumentation, so that runs without instrumentation do not pay for it.
+
+# Python imports
+import bisect
+import collections
+import os
+import threading
+import time
+
+# Custom imports
+from .common_params import value_zero, value_one, value_two
+from .instrumentation import stage_execute_movement, stages
+
+# Upper bounds of the buckets of the histogram of instruction lengths, powers of two up to 16M
+length_bucket_bounds = (value_zero,) + tuple(value_two ** exponent for exponent in range(25))
+
+metrics_prefix = 'project_rover'
+
+
+class Instrumentation:
+    """
+    Instrumentation Class object, the timings and counters recorded while Rovers are processed. It can be shared by
+    the threads of the server.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stage_calls = collections.Counter()
+        self.stage_seconds = collections.Counter()
+        self.exception_counts = collections.Counter()
+        self.commands_executed = value_zero
+        self.length_buckets = [value_zero] * (len(length_bucket_bounds) + value_one)
+        self.length_count = value_zero
+        self.length_sum = value_zero
+
+    def measure(self, stage, function, *arguments):
+        """
+        Instrumentation's function that will call function, recording its wall time and the exception it raises, if
+        any, under the given stage.
+        :param stage: Name of the stage.
+        :param function: Function to be called.
+        :param arguments: Arguments of the function.
+        :return: Value returned by the function.
+        """
+        start_time = time.perf_counter()
+        try:
+            return function(*arguments)
+        except Exception as e:
+            with self.lock:
+                self.exception_counts[stage, type(e).__name__] += value_one
+            raise
+        finally:
+            elapsed_time = time.perf_counter() - start_time
+            with self.lock:
+                self.stage_calls[stage] += value_one
+                self.stage_seconds[stage] += elapsed_time
+
+    def record_instructions_length(self, length):
+        """
+        Instrumentation's function that will add the length of a set of instructions read to the histogram.
+        """
+        with self.lock:
+            self.length_buckets[bisect.bisect_left(length_bucket_bounds, length)] += value_one
+            self.length_count += value_one
+            self.length_sum += length
+
+    def record_commands_executed(self, commands):
+        """
+        Instrumentation's function that will add the commands of a set of instructions fully executed.
+        """
+        with self.lock:
+            self.commands_executed += commands
+
+    def commands_per_second(self):
+        """
+        Instrumentation's function that will return the commands executed per second spent executing movements.
+        """
+        execution_seconds = self.stage_seconds[stage_execute_movement]
+        return self.commands_executed / execution_seconds if execution_seconds else 0.0
+
+    def summary(self):
+        """
+        Instrumentation's function that will return every value recorded as a dictionary, ready to be written as
+        JSON.
+        """
+        with self.lock:
+            return {
+                'stages': {stage: {
+                    'calls': self.stage_calls[stage],
+                    'seconds': self.stage_seconds[stage],
+                    'exceptions': {exception_type: count
+                                   for (exception_stage, exception_type), count in sorted(self.exception_counts.items())
+                                   if exception_stage == stage}
+                } for stage in stages},
+                'commands_executed': self.commands_executed,
+                'commands_per_second': self.commands_per_second(),
+                'instructions_length': {
+                    'buckets': {str(bound): count for bound, count in zip(length_bucket_bounds + ('+Inf',),
+                                                                          self.length_buckets)},
+                    'count': self.length_count,
+                    'sum': self.length_sum
+                }
+            }
+
+    def prometheus_text(self):
+        """
+        Instrumentation's function that will return every value recorded in the Prometheus text exposition format.
+        """
+        summary = self.summary()
+        lines = list()
+
+        def add_metric(name, metric_type, help_text, samples):
+            lines.append("# HELP {}_{} {}".format(metrics_prefix, name, help_text))
+            lines.append("# TYPE {}_{} {}".format(metrics_prefix, name, metric_type))
+            for suffix, labels, value in samples:
+                label_text = ','.join('{}="{}"'.format(label, label_value) for label, label_value in labels)
+                lines.append("{}_{}{}{} {}".format(metrics_prefix, name, suffix,
+                                                   "{{{}}}".format(label_text) if label_text else '', value))
+
+        add_metric('stage_calls_total', 'counter', "Calls of each stage.",
+                   [('', [('stage', stage)], values['calls']) for stage, values in summary['stages'].items()])
+        add_metric('stage_seconds_total', 'counter', "Wall time spent in each stage.",
+                   [('', [('stage', stage)], repr(values['seconds'])) for stage, values in summary['stages'].items()])
+        add_metric('exceptions_total', 'counter', "Exceptions raised by each stage, by type.",
+                   [('', [('stage', stage), ('type', exception_type)], count)
+                    for stage, values in summary['stages'].items()
+                    for exception_type, count in values['exceptions'].items()])
+        add_metric('commands_executed_total', 'counter', "Commands of the sets of instructions fully executed.",
+                   [('', [], summary['commands_executed'])])
+        add_metric('commands_per_second', 'gauge', "Commands executed per second spent executing movements.",
+                   [('', [], repr(summary['commands_per_second']))])
+
+        # Prometheus buckets are cumulative
+        samples = list()
+        cumulative_count = value_zero
+        for bound, count in summary['instructions_length']['buckets'].items():
+            cumulative_count += count
+            samples.append(('_bucket', [('le', bound)], cumulative_count))
+        samples.append(('_sum', [], summary['instructions_length']['sum']))
+        samples.append(('_count', [], summary['instructions_length']['count']))
+        add_metric('instructions_length', 'histogram', "Length of the sets of instructions read.", samples)
+
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path):
+        """
+        Instrumentation's function that will write the JSON summary to a file.
+        """
+        # Only needed when exporting, not loaded on start up
+        import json
+
+        _write_at_once(path, json.dumps(self.summary(), indent=value_two) + "\n")
+
+    def write_prometheus(self, path):
+        """
+        Instrumentation's function that will write the Prometheus text to a file, e.g. for the textfile collector of
+        node_exporter, which must never read half a file.
+        """
+        _write_at_once(path, self.prometheus_text())
+
+
+def _write_at_once(path, text):
+    """
+    _write_at_once(): Function that will write a text to a temporary file and move it in place of path.
+    """
+    temporary_path = "{}.tmp".format(path)
+
+    with open(temporary_path, 'w') as output_file:
+        output_file.write(text)
+
+    os.replace(temporary_path, path)
@@ -0,0 +1,434 @@
+# coding=utf-8
+# A squad of robotic rovers are to be landed by NASA on a plateau on Mars.
+# This plateau, which is curiously rectangular, must be navigated by the rovers so that their on-board
+# cameras can get a complete view of the surrounding terrain to send back to Earth.
+# A rover’s position and location is represented by a combination of x and y coordinates and a letter
+# representing one of the four cardinal compass points.
+# The plateau is divided up into a grid to simplify navigation.
+# An example position might be 0, 0, N, which means the rover is in the bottom left corner and facing North.
+# In order to control a rover, NASA sends a simple string of letters.
+# The possible letters are ‘L’, ‘R’ and ‘M’. ‘L’ and ‘R’ makes the rover spin 90 degrees left or right
+# respectively, without moving from its current spot. ‘M’ means move forward one grid point, and maintain the same
+# heading. Assume that the square directly North from (x, y) is (x, y+1).
+# INPUT:
+# The first line of input is the upper-right coordinates of the plateau, the lower- left coordinates
+# are assumed to be 0,0.
+# The rest of the input is information pertaining to the rovers that have been deployed. Each
+# rover has two lines of input.
+# The first line gives the rover’s position, and the second line is a series of instructions telling the
+# rover how to explore the plateau.
+# The position is made up of two integers and a letter separated by spaces, corresponding to the
+# x and y co-ordinates and the rover’s orientation.
+# Each rover will be finished sequentially, which means that the second rover won’t start to
+# move until the first one has finished moving.
+
+# Python imports
+import re
+import sys
+
+# Self imports
+from . import instrumentation
+from .common_params import value_zero, value_one
+from .rover import Rover
+from .coordinates import Coordinates as myCoordinate
+from .rover_exceptions import ExceptionIncompleteDataReceived, ExceptionExtraValuesReceived, ExceptionWrongTypeVar, \
+    ExceptionValueLessThanZero, ExceptionRoverPlacedOutOfPlane, ExceptionOrientationNotKnown, \
+    ExceptionInstructionParameterNotKnown, ExceptionRoverAttemptingToExitKnownPlane, ExceptionRoverCollision
+
+first_line_types = [int, int]
+second_line_types = [int, int, str]
+
+# Regular expression of each type of value, a whole line is validated at once by joining them
+type_patterns = {
+    int: r'(\d+)',
+    str: r'([^ ]+)'
+}
+line_patterns = dict()
+
+# Exceptions that can be raised while processing a single Rover, reported per Rover in batch mode
+rover_exceptions_list = (ExceptionIncompleteDataReceived, ExceptionExtraValuesReceived, ExceptionWrongTypeVar,
+                         ExceptionValueLessThanZero, ExceptionRoverPlacedOutOfPlane, ExceptionOrientationNotKnown,
+                         ExceptionInstructionParameterNotKnown, ExceptionRoverAttemptingToExitKnownPlane,
+                         ExceptionRoverCollision)
+
+
+def read_rover_parameters(reading_message, types_input_list, coordinates):
+    """
+    read_rover_parameters(): function which will read input parameters and process them accordingly, those values
+    can be:
+        - First coordinates which will refer to top right coordinates of the plane
+        - Rover start coordinates: Known point where Rover will be deployed. That known point must be
+        inside the known plane, for obvious reasons: known plane is secure, not known plane may result with
+        undiscovered threatening harmful events.
+    :param reading_message: Text that will be displayed whilst asking for keyboard inputs.
+    :param types_input_list: List of types we are expecting to read.
+    :param coordinates: Coordinates object the values will be checked against.
+    :return: Return parameters read without extra spaces and parsed with known data.
+    """
+    # Read input, cast it to known type str
+    line_input = str(input("{}: ".format(reading_message)))
+
+    return parse_rover_parameters(line_input, types_input_list, coordinates)
+
+
+def get_line_pattern(types_input_list):
+    """
+    get_line_pattern(): function that will return the compiled regular expression matching a whole correct line of
+    the types expected, compiled only once per list of types.
+    :param types_input_list: List of types we are expecting to read.
+    :return: Compiled regular expression, None if some of the types has no known pattern.
+    """
+    types_key = tuple(types_input_list)
+
+    if types_key not in line_patterns:
+        if all(expected_type in type_patterns for expected_type in types_key):
+            line_patterns[types_key] = re.compile(r' *{} *\Z'.format(' +'.join(type_patterns[expected_type]
+                                                                                for expected_type in types_key)))
+        else:
+            line_patterns[types_key] = None
+
+    return line_patterns[types_key]
+
+
+def parse_rover_parameters(line_input, types_input_list, coordinates):
+    """
+    parse_rover_parameters(): function which will process an input line already read, either from keyboard or from
+    a mission file, and validate it against the types expected and the known plane.
+    Lines are validated in one single pass with a precompiled regular expression, lines not matching it are left to
+    parse_rover_parameters_token_by_token so that the same exception is raised for the same token.
+    Timed as the read_rover_parameters stage while instrumentation is enabled.
+    :param line_input: Line of text to be processed.
+    :param types_input_list: List of types we are expecting to read.
+    :param coordinates: Coordinates object the values will be checked against.
+    :return: Return parameters read without extra spaces and parsed with known data.
+    """
+    recorder = instrumentation.active_recorder
+    if recorder is not None:
+        return recorder.measure(instrumentation.stage_read_rover_parameters, _parse_rover_parameters, line_input,
+                                types_input_list, coordinates)
+
+    return _parse_rover_parameters(line_input, types_input_list, coordinates)
+
+
+def _parse_rover_parameters(line_input, types_input_list, coordinates):
+    """
+    _parse_rover_parameters(): function that will do the work of parse_rover_parameters, not instrumented.
+    """
+    line_pattern = get_line_pattern(types_input_list)
+    line_match = line_pattern.match(line_input) if line_pattern is not None else None
+
+    if line_match is None:
+        return parse_rover_parameters_token_by_token(line_input, types_input_list, coordinates)
+
+    # List that will be returned
+    final_values = list()
+    top_right_coordinates = coordinates.top_right_coordinates
+
+    # Values matched are well typed and can not be less than zero, just check the plane and the orientation
+    for count, element in enumerate(line_match.groups()):
+        if types_input_list[count] is int:
+            try:
+                value = int(element)
+            except ValueError:
+                # Too many digits to be converted, the reference implementation reports it
+                return parse_rover_parameters_token_by_token(line_input, types_input_list, coordinates)
+
+            if top_right_coordinates is not None and value > top_right_coordinates[count]:
+                raise ExceptionRoverPlacedOutOfPlane(count + value_one, element,
+                                                     coordinates.coordinates_definition[count],
+                                                     [str(coordinate) for coordinate in top_right_coordinates])
+        else:
+            value = element.upper()
+
+            if value not in coordinates.cardinal_points:
+                raise ExceptionOrientationNotKnown(count + value_one, element,
+                                                   ', '.join([x for x in coordinates.cardinal_points.keys()]))
+
+        final_values.append(value)
+
+    return final_values
+
+
+def parse_rover_parameters_token_by_token(line_input, types_input_list, coordinates):
+    """
+    parse_rover_parameters_token_by_token(): reference implementation of parse_rover_parameters, casting each token
+    and reporting the first one which is not correct.
+    :param line_input: Line of text to be processed.
+    :param types_input_list: List of types we are expecting to read.
+    :param coordinates: Coordinates object the values will be checked against.
+    :return: Return parameters read without extra spaces and parsed with known data.
+    """
+
+    # List that will be returned
+    final_values = list()
+
+    # Gather all values which are not blank spaces, put them into a list
+    values = [param for param in line_input.split(' ') if param != '']
+
+    # Check for incomplete data
+    if len(values) < (len(types_input_list)):
+        # Raise Incomplete Data Received Exception
+        raise ExceptionIncompleteDataReceived(len(values), len(types_input_list))
+    else:
+        # Process length of values
+        if len(values) > len(types_input_list):
+            # Raise Extra Values Received incorrect input Exception
+            raise ExceptionExtraValuesReceived(len(values), len(types_input_list), [value for value in values])
+
+        # Input must be aligned with types passed over parameter to this function
+        for count, (element, expected_type) in enumerate(zip(values, types_input_list), start=value_zero):
+            # Try forcing cast on each element depending on type provided, if exception ask for new values
+            try:
+                # Force the casting on element and wait if accepted or exception is raised
+                expected_type(element)
+
+                if expected_type is str:
+                    # If here, there is no exception store value in final_value
+                    # Corrected issue with lower case for letter when storing string
+                    final_values.insert(count, expected_type(element).upper())
+                else:
+                    # If here, there is no exception store value in final_value
+                    final_values.insert(count, expected_type(element))
+
+                # If int in any case the value provided can be less than 0
+                if expected_type is int and expected_type(element) < value_zero:
+                    # Check that coordinates are not less than [0, 0] coordinates
+                    raise ExceptionValueLessThanZero(count + value_one, element)
+
+                # Check whether top_right_coordinates have been set or not, if so, check if over exceeding them
+                if expected_type is int and coordinates.top_right_coordinates is not None:
+                    # Split if to avoid NoneType error for None in top_right_coordinates list
+                    # Use final_values, for correct type check
+                    if expected_type(element) > coordinates.top_right_coordinates[count]:
+                        # Check that introduced coordinates are not greater than coordinates introduced
+                        raise ExceptionRoverPlacedOutOfPlane(count + value_one, element,
+                                                             coordinates.coordinates_definition[count],
+                                                             [str(coordinate) for coordinate in
+                                                              coordinates.top_right_coordinates])
+
+                # If string check whether it is present in cardinal_points or not
+                if expected_type is str and element.upper() not in coordinates.cardinal_points.keys():
+                    raise ExceptionOrientationNotKnown(count + value_one, element,
+                                                       ', '.join([x for x in coordinates.cardinal_points.keys()]))
+
+            except ValueError:
+                # Raise custom Wrong Type Var exception
+                raise ExceptionWrongTypeVar(count + value_one, element, expected_type, type(element))
+
+    return final_values
+
+
+def read_mission_lines(input_stream):
+    """
+    read_mission_lines(): Generator that will stream the lines of a mission, one at a time, removing the end of line
+    characters the same way input does.
+    :param input_stream: File object (or any iterable of lines) containing the mission.
+    :return: Yields each line of the mission.
+    """
+    for line in input_stream:
+        yield line.rstrip("\r\n")
+
+
+def read_mission_rovers(mission_lines):
+    """
+    read_mission_rovers(): Generator that will pair the lines of a mission after the plane definition, each Rover
+    has two lines: start position and set of instructions. Blank lines where a start position is expected are skipped,
+    an empty set of instructions is still a valid one.
+    :param mission_lines: Iterator over the lines of the mission, already positioned after the plane definition.
+    :return: Yields a tuple (start position line, instructions line), instructions line is None if input ended.
+    """
+    for position_line in mission_lines:
+        if not position_line.strip():
+            continue
+
+        yield position_line, next(mission_lines, None)
+
+
+def run_mission(input_stream, output_stream, report_coverage=False, trajectory=None):
+    """
+    run_mission(): Function that will handle all the steps to deploy and move Rovers of a full mission read from a
+    stream instead of keyboard. Rovers are processed one at a time, and their result is written as soon as they
+    finish. Errors are reported per Rover instead of asking for new values, the mission stops at the end of input.
+    :param input_stream: File object containing the mission.
+    :param output_stream: File object where the results will be written.
+    :param report_coverage: If True, positions visited by the Rovers are recorded and the coverage of the plane is
+    written at the end of the mission.
+    :param trajectory: Optional TrajectoryWriter object where every step of every Rover will be written.
+    :return: Number of Rovers processed.
+    """
+    # Each mission has its own plane
+    mission_coordinates = myCoordinate()
+    mission_lines = read_mission_lines(input_stream)
+
+    # First non blank line is the plane definition
+    plane_line = next((line for line in mission_lines if line.strip()), None)
+    if plane_line is None:
+        return value_zero
+
+    try:
+        mission_coordinates.set_top_right_coordinates(parse_rover_parameters(plane_line, first_line_types,
+                                                                             mission_coordinates))
+    except rover_exceptions_list as e:
+        # Without a plane no Rover can be deployed
+        output_stream.write("Top right coordinates:\n{}\n".format(e))
+        return value_zero
+
+    if report_coverage:
+        # Coverage is optional, its module is only loaded when requested
+        from .plane_coverage import CoverageMap
+        coverage = CoverageMap(mission_coordinates)
+    else:
+        coverage = None
+
+    # Rover's counter
+    count = value_zero
+
+    for count, (position_line, instructions_line) in enumerate(read_mission_rovers(mission_lines), start=value_one):
+        # Init rover Class object
+        rover = Rover(count)
+
+        try:
+            rover.set_rover_start_position(parse_rover_parameters(position_line, second_line_types,
+                                                                  mission_coordinates), mission_coordinates)
+
+            if instructions_line is None:
+                # Input ended before receiving the set of instructions
+                raise ExceptionIncompleteDataReceived(value_zero, value_one, "Set of instructions not received")
+
+            rover.set_list_of_instructions(instructions_line)
+            rover.execute_movement(mission_coordinates, coverage, trajectory)
+            output_stream.write("{} final position: {}\n".format(rover.rover_id, rover.end_position))
+
+            # Next Rovers can not go through this one
+            mission_coordinates.set_occupied_position(rover.end_position)
+        except rover_exceptions_list as e:
+            output_stream.write("{}:\n{}\n".format(rover.rover_id, e))
+
+    if coverage is not None:
+        output_stream.write("Plane coverage: {:.2f}% ({} positions visited)\n".format(coverage.coverage_percentage(),
+                                                                                 coverage.visited_positions()))
+
+    return count
+
+
+def batch_main(mission_paths, report_coverage=False, trajectory_path=None):
+    """
+    batch_main(): Function that will run, one after another, the missions stored in the given files.
+    :param mission_paths: List of paths to mission files, "-" stands for standard input.
+    :param report_coverage: If True, the coverage of the plane is written at the end of each mission.
+    :param trajectory_path: Optional path of the binary file where every step of every Rover will be written.
+    :return: Nothing
+    """
+    if trajectory_path is not None:
+        # Trajectory recording is optional, its module is only loaded when requested
+        from .trajectory import TrajectoryWriter
+        trajectory = TrajectoryWriter(trajectory_path)
+    else:
+        trajectory = None
+
+    try:
+        for mission_path in mission_paths:
+            if mission_path == "-":
+                run_mission(sys.stdin, sys.stdout, report_coverage, trajectory)
+            else:
+                with open(mission_path) as mission_file:
+                    run_mission(mission_file, sys.stdout, report_coverage, trajectory)
+    finally:
+        if trajectory is not None:
+            trajectory.close()
+
+
+def main():
+    """
+    main(): Function that will handle all the steps to deploy and move Rovers accordingly.
+    :return: Nothing
+    """
+    not_correct_input = True
+
+    # Init coordinates Class object, one plane per run
+    coordinates = myCoordinate()
+
+    # Keep reading until correct data to be fully received
+    while not_correct_input:
+        try:
+            # Keep reading input until receive correct data
+            coordinates.set_top_right_coordinates(read_rover_parameters("Top right coordinates", first_line_types,
+                                                                        coordinates))
+            # If here, break the loop, input is correct
+            not_correct_input = False
+        except ExceptionIncompleteDataReceived as e:
+            print(e)
+        except ExceptionExtraValuesReceived as e:
+            print(e)
+        except ExceptionWrongTypeVar as e:
+            print(e)
+        except ExceptionValueLessThanZero as e:
+            print(e)
+
+    # Rover's counter
+    count = value_zero
+
+    # Keep iterating until end
+    # TODO: An end
+    no_end = True
+
+    while no_end:
+        count += value_one
+
+        # Init rover Class object
+        rover = Rover(count)
+
+        # Set loop flags
+        not_correct_position_input = True
+        not_correct_instruction_input = True
+
+        while not_correct_position_input:
+            try:
+                # Read second line, process it accordingly
+                rover.set_rover_start_position(read_rover_parameters("\n{} start position".format(rover.rover_id),
+                                                                     second_line_types, coordinates), coordinates)
+
+                # If correct break while
+                not_correct_position_input = False
+
+            except ExceptionIncompleteDataReceived as e:
+                print(e)
+            except ExceptionExtraValuesReceived as e:
+                print(e)
+            except ExceptionWrongTypeVar as e:
+                print(e)
+            except ExceptionValueLessThanZero as e:
+                print(e)
+            except ExceptionRoverPlacedOutOfPlane as e:
+                print('\t[!!]\tOops... Rover, the fearless explorer, should better not to be placed there.')
+                print(e)
+            except ExceptionOrientationNotKnown as e:
+                print(e)
+            except ExceptionRoverCollision as e:
+                print("\t[!!]\tOops... Another Rover is already there, better not to deploy it on top of it!")
+                print(e)
+
+        while not_correct_instruction_input:
+            try:
+                # Try to read set of instructions
+                rover.request_list_of_instructions()
+
+                # Try to execute received instruction
+                rover.execute_movement(coordinates)
+                print("{} final position: {}".format(rover.rover_id, rover.end_position))
+
+                # Next Rovers can not go through this one
+                coordinates.set_occupied_position(rover.end_position)
+
+                # If here break the while
+                not_correct_instruction_input = False
+            except ExceptionInstructionParameterNotKnown as e:
+                print(e)
+            except ExceptionRoverAttemptingToExitKnownPlane as e:
+                print("\t[!!]\tOops... We do know Rover is a fearless explorer but it is better for its own "
+                      "security not letting it going through there!")
+                print(e)
+            except ExceptionRoverCollision as e:
+                print("\t[!!]\tOops... Another Rover is already there, better not to crash into it!")
+                print(e)
+
@@ -0,0 +1,208 @@
+# Generator of synthetic missions, the same seed always gives the same missions so that runs can be compared.
+# Each mission picks its plane size, its number of Rovers and the mean length of their sets of instructions from the
+# ones given, lengths follow a fixed, uniform or long tail distribution. Some lines can be made wrong on purpose, so
+# that every exception is raised, some sets of instructions are reused, as survey patterns are, and some can be a
+# short block repeated, as patrols are.
+# Missions are written separated by blank lines, the format read by project-rover-missions.
+
+# Python imports
+import argparse
+import random
+import sys
+
+# Custom imports
+from .common_params import value_zero, value_one, value_two
+
+# Example of the problem statement and the output expected for it
+classic_mission = ("5 5", "1 2 N", "LMLMLMLMM", "3 3 E", "MMRMMRMRRM")
+classic_mission_output = ("Rover[1] final position: [1, 3, 'N']", "Rover[2] final position: [5, 1, 'E']")
+
+default_plane_sizes = (value_zero, value_one, 5, 10, 100, 1000)
+default_rover_counts = (value_one, value_two, 5, 20)
+default_mean_lengths = (value_zero, 5, 10, 50, 200)
+
+# Chances of a line being wrong on purpose, and of a set of instructions being one already used
+default_error_rate = 0.05
+default_reuse_rate = 0.2
+
+
+def fixed_length(generator, mean_length):
+    """
+    fixed_length(): Every set of instructions has the mean length.
+    """
+    return mean_length
+
+
+def uniform_length(generator, mean_length):
+    """
+    uniform_length(): Lengths spread evenly between zero and twice the mean length.
+    """
+    return generator.randint(value_zero, value_two * mean_length)
+
+
+def long_tail_length(generator, mean_length):
+    """
+    long_tail_length(): Most sets of instructions are short, a few of them are many times the mean length.
+    """
+    return int(generator.expovariate(1.0 / mean_length)) if mean_length else value_zero
+
+
+length_distributions = {
+    'fixed': fixed_length,
+    'uniform': uniform_length,
+    'long_tail': long_tail_length
+}
+
+
+def generate_wrong_plane_line(generator, width, height):
+    """
+    generate_wrong_plane_line(): Function that will build a plane definition raising one of the exceptions.
+    """
+    return generator.choice(["{}".format(width), "{} {} {}".format(width, height, height),
+                             "-{} {}".format(width + value_one, height), "{} a".format(width),
+                             "{}.5 {}".format(width, height)])
+
+
+def generate_wrong_position_line(generator, width, height):
+    """
+    generate_wrong_position_line(): Function that will build a start position raising one of the exceptions.
+    """
+    x, y = generator.randint(value_zero, width), generator.randint(value_zero, height)
+    heading = generator.choice('NESW')
+
+    return generator.choice(["{} {}".format(x, y), "{} {} {} {}".format(x, y, heading, heading),
+                             "{} {} {}".format(width + value_one, y, heading),
+                             "{} {} {}".format(x, height + value_one, heading), "{} {} X".format(x, y),
+                             "{} -{} {}".format(x, y + value_one, heading), "a {} {}".format(y, heading),
+                             "{} {} {}".format(x, y, heading * value_two)])
+
+
+def generate_instructions_line(generator, length, error_rate, patrol_rate=value_zero):
+    """
+    generate_instructions_line(): Function that will build a set of instructions, moving forward half of the time.
+    With patrol_rate chance, a short block is repeated instead, as patrols are, after and before a few other
+    instructions. Lower case letters and spaces, which are accepted, are mixed in now and then, and an unknown letter
+    is put somewhere with error_rate chance.
+    """
+    if patrol_rate and generator.random() < patrol_rate:
+        block = ''.join(generator.choice('LRMM') for _ in range(generator.randint(value_one, 12)))
+        # Instructions going to the patrol and coming back from it
+        prefix, suffix = [''.join(generator.choice('LRMM') for _ in range(generator.randint(value_zero, 12)))
+                          for _ in range(value_two)]
+        instructions = (prefix + block * (length // len(block) + value_one))[:max(length - len(suffix), value_zero)]
+        instructions = (instructions + suffix)[:length]
+    else:
+        instructions = ''.join(generator.choice('LRMM') for _ in range(length))
+
+    if generator.random() < error_rate:
+        position = generator.randint(value_zero, length)
+        instructions = instructions[:position] + generator.choice('XQ1?') + instructions[position:]
+
+    if generator.random() < 0.1:
+        instructions = ' '.join(generator.choice((letter, letter.lower())) for letter in instructions)
+
+    return instructions
+
+
+def generate_mission(generator, width, height, number_of_rovers, mean_length, length_distribution=uniform_length,
+                     error_rate=default_error_rate, reuse_rate=default_reuse_rate, patrol_rate=value_zero):
+    """
+    generate_mission(): Function that will build the lines of a synthetic mission.
+    :param generator: Random object.
+    :param width: Top right x coordinate of the plane.
+    :param height: Top right y coordinate of the plane.
+    :param number_of_rovers: Number of Rovers deployed.
+    :param mean_length: Mean number of instructions of each Rover.
+    :param length_distribution: Function returning the length of a set of instructions from the mean length.
+    :param error_rate: Chance of each line being wrong on purpose.
+    :param reuse_rate: Chance of a set of instructions being one already used in the mission.
+    :param patrol_rate: Chance of a set of instructions being a short block repeated.
+    :return: List of lines of the mission.
+    """
+    if generator.random() < error_rate:
+        mission = [generate_wrong_plane_line(generator, width, height)]
+    else:
+        mission = ["{} {}".format(width, height)]
+
+    lines_of_instructions = list()
+
+    for _ in range(number_of_rovers):
+        if generator.random() < error_rate:
+            mission.append(generate_wrong_position_line(generator, width, height))
+        else:
+            mission.append("{} {} {}".format(generator.randint(value_zero, width),
+                                             generator.randint(value_zero, height), generator.choice('NESW')))
+
+        if lines_of_instructions and generator.random() < reuse_rate:
+            mission.append(generator.choice(lines_of_instructions))
+        else:
+            lines_of_instructions.append(generate_instructions_line(generator,
+                                                                    length_distribution(generator, mean_length),
+                                                                    error_rate, patrol_rate))
+            mission.append(lines_of_instructions[-value_one])
+
+    return mission
+
+
+def generate_missions(seed, number_of_missions, plane_sizes=default_plane_sizes, rover_counts=default_rover_counts,
+                      mean_lengths=default_mean_lengths, distributions=tuple(sorted(length_distributions.keys())),
+                      error_rate=default_error_rate, reuse_rate=default_reuse_rate, patrol_rate=value_zero):
+    """
+    generate_missions(): Generator that will build synthetic missions, each one with its plane size, number of Rovers,
+    mean length and distribution of lengths picked among the ones given.
+    :param seed: Seed of the random generator, the same seed gives the same missions.
+    :param number_of_missions: Number of missions built.
+    :param plane_sizes: Top right coordinates picked for each axis.
+    :param rover_counts: Numbers of Rovers picked.
+    :param mean_lengths: Mean numbers of instructions picked.
+    :param distributions: Names of the length distributions picked.
+    :param error_rate: Chance of each line being wrong on purpose.
+    :param reuse_rate: Chance of a set of instructions being one already used in the mission.
+    :param patrol_rate: Chance of a set of instructions being a short block repeated.
+    :return: Yields the list of lines of each mission.
+    """
+    generator = random.Random(seed)
+
+    for _ in range(number_of_missions):
+        yield generate_mission(generator, generator.choice(plane_sizes), generator.choice(plane_sizes),
+                               generator.choice(rover_counts), generator.choice(mean_lengths),
+                               length_distributions[generator.choice(distributions)], error_rate, reuse_rate,
+                               patrol_rate)
+
+
+def main():
+    """
+    main(): Function that will write synthetic missions, separated by blank lines, to standard output.
+    :return: Nothing
+    """
+    parser = argparse.ArgumentParser(description="Write seeded synthetic Rover missions")
+    parser.add_argument('--seed', type=int, default=value_zero, help="Seed, the same seed gives the same missions")
+    parser.add_argument('--missions', type=int, default=10, help="Number of missions")
+    parser.add_argument('--plane-sizes', type=int, nargs='+', default=default_plane_sizes,
+                        help="Top right coordinates picked for each axis")
+    parser.add_argument('--rovers', type=int, nargs='+', default=default_rover_counts,
+                        help="Numbers of Rovers picked for each mission")
+    parser.add_argument('--lengths', type=int, nargs='+', default=default_mean_lengths,
+                        help="Mean numbers of instructions picked for each mission")
+    parser.add_argument('--distributions', nargs='+', choices=sorted(length_distributions.keys()),
+                        default=sorted(length_distributions.keys()), help="Distributions of the lengths picked")
+    parser.add_argument('--error-rate', type=float, default=default_error_rate,
+                        help="Chance of each line being wrong on purpose")
+    parser.add_argument('--reuse-rate', type=float, default=default_reuse_rate,
+                        help="Chance of a set of instructions being one already used in the mission")
+    parser.add_argument('--patrol-rate', type=float, default=value_zero,
+                        help="Chance of a set of instructions being a short block repeated")
+    parser.add_argument('--classic', action='store_true', help="Write the example of the problem statement first")
+    arguments = parser.parse_args()
+
+    if arguments.classic:
+        sys.stdout.write("\n".join(classic_mission) + "\n\n")
+
+    for mission in generate_missions(arguments.seed, arguments.missions, arguments.plane_sizes, arguments.rovers,
+                                     arguments.lengths, arguments.distributions, arguments.error_rate,
+                                     arguments.reuse_rate, arguments.patrol_rate):
+        sys.stdout.write("\n".join(mission) + "\n\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# Runner that splits an input with many independent missions across a pool of processes.
+# Missions are separated by a blank line where a Rover start position is expected, each mission starts with its own
+# plane definition.
+
+# Python imports
+import argparse
+import collections
+import itertools
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from io import StringIO
+
+# Custom imports
+from .common_params import value_two
+from .main import read_mission_lines, run_mission
+
+# Number of missions sent to a worker at once, so that per task overhead does not dominate
+default_chunk_size = 64
+
+
+def read_missions(input_stream):
+    """
+    read_missions(): Generator that will split an input with several missions into missions. A mission is the plane
+    definition followed by the lines of its Rovers, a blank line where a start position is expected ends it.
+    :param input_stream: File object (or any iterable of lines) containing the missions.
+    :return: Yields the list of lines of each mission.
+    """
+    mission = None
+    expecting_instructions = False
+
+    for line in read_mission_lines(input_stream):
+        if expecting_instructions:
+            # Instructions line, even an empty one
+            mission.append(line)
+            expecting_instructions = False
+        elif not line.strip():
+            if mission is not None:
+                yield mission
+                mission = None
+        elif mission is None:
+            # Plane definition of a new mission
+            mission = [line]
+        else:
+            # Rover start position
+            mission.append(line)
+            expecting_instructions = True
+
+    if mission is not None:
+        yield mission
+
+
+def run_missions_chunk(missions):
+    """
+    run_missions_chunk(): Function executed by the workers, it will run a chunk of missions one after another. Each
+    mission is run on its own Coordinates object.
+    :param missions: List of missions, each of them a list of lines.
+    :return: List with the output of each mission.
+    """
+    outputs = list()
+
+    for mission in missions:
+        output_stream = StringIO()
+        run_mission(mission, output_stream)
+        outputs.append(output_stream.getvalue())
+
+    return outputs
+
+
+def run_missions_in_parallel(missions, workers=None, chunk_size=default_chunk_size):
+    """
+    run_missions_in_parallel(): Generator that will run the missions across a pool of processes, chunks of missions
+    are sent to the workers and only a few of them are in flight at a time, so that memory stays bounded.
+    :param missions: Iterable of missions, each of them a list of lines.
+    :param workers: Number of processes, number of CPUs if None.
+    :param chunk_size: Number of missions sent to a worker at once.
+    :return: Yields the output of each mission, in input order.
+    """
+    workers = workers or multiprocessing.cpu_count()
+    missions = iter(missions)
+    chunks = iter(lambda: list(itertools.islice(missions, chunk_size)), list())
+    pending_chunks = collections.deque()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in chunks:
+            pending_chunks.append(executor.submit(run_missions_chunk, chunk))
+
+            # Keep every worker busy, but don't read the whole input ahead
+            if len(pending_chunks) > value_two * workers:
+                for output in pending_chunks.popleft().result():
+                    yield output
+
+        while pending_chunks:
+            for output in pending_chunks.popleft().result():
+                yield output
+
+
+def main():
+    """
+    main(): Function that will run every mission of the files received, writing their outputs in input order.
+    :return: Nothing
+    """
+    parser = argparse.ArgumentParser(description="Run independent Rover missions in parallel")
+    parser.add_argument('missions', nargs='+', help="Files with missions separated by blank lines, \"-\" for stdin")
+    parser.add_argument('--workers', type=int, default=None, help="Number of processes, number of CPUs by default")
+    parser.add_argument('--chunk-size', type=int, default=default_chunk_size,
+                        help="Number of missions sent to a worker at once")
+    arguments = parser.parse_args()
+
+    def read_all_missions():
+        for mission_path in arguments.missions:
+            if mission_path == "-":
+                for mission in read_missions(sys.stdin):
+                    yield mission
+            else:
+                with open(mission_path) as mission_file:
+                    for mission in read_missions(mission_file):
+                        yield mission
+
+    for count, output in enumerate(run_missions_in_parallel(read_all_missions(), arguments.workers,
+                                                            arguments.chunk_size)):
+        if count:
+            sys.stdout.write("\n")
+        sys.stdout.write(output)
+
+
+if __name__ == "__main__":
+    main()
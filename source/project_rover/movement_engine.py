@@ -0,0 +1,508 @@
+# Python imports
+import re
+
+# Custom imports
+from .common_params import value_zero, value_one, value_two
+from .rover_exceptions import ExceptionRoverAttemptingToExitKnownPlane, ExceptionRoverCollision
+
+# Headings encoded as small ints, following Coordinates.sorted_cardinal_points_list order
+heading_names = ('N', 'E', 'S', 'W')
+heading_codes = dict((heading, code) for code, heading in enumerate(heading_names))
+
+# Movement done on each axis when moving forward, indexed by heading code
+delta_x = (value_zero, value_one, value_zero, -value_one)
+delta_y = (value_one, value_zero, -value_one, value_zero)
+
+# Instructions encoded as small ints, 'M' is the only one that is not a rotation
+instruction_move = 0
+instruction_left = 1
+instruction_right = 2
+instruction_codes_table = bytes.maketrans(b'MLR', bytes((instruction_move, instruction_left, instruction_right)))
+
+# Heading reached after a rotation, indexed by [instruction code][heading code]
+turn_table = (
+    None,
+    tuple((heading - value_one) % len(heading_names) for heading in range(len(heading_names))),
+    tuple((heading + value_one) % len(heading_names) for heading in range(len(heading_names)))
+)
+
+# A segment is a group of rotations followed by a run of forward movements
+segment_pattern = re.compile(r'([LR]*)(M*)')
+
+# Lists of instructions shorter than this are not looked for a period, executing them is cheap enough
+periodic_instructions_threshold = 256
+
+# Candidate periods checked before deciding a list of instructions is not periodic
+period_candidates_limit = 4
+
+
+def compile_instructions(list_of_instructions):
+    """
+    compile_instructions(): Function that will encode a parsed list of instructions into a buffer of small ints,
+    ready to be consumed by execute_compiled_movement.
+    :param list_of_instructions: Parsed list (or string) of known movements, already upper case.
+    :return: bytearray with one instruction code per movement.
+    """
+    return bytearray(''.join(list_of_instructions).encode('ascii').translate(instruction_codes_table))
+
+
+def execute_compiled_movement(start_position, compiled_instructions, coordinates):
+    """
+    execute_compiled_movement(): Table driven equivalent of rover.execute_movement. It will pre-execute the compiled
+    instructions and raise an exception at the same step, and with the same position, as the original function.
+    :param start_position: Rover start position [x, y, orientation].
+    :param compiled_instructions: Buffer returned by compile_instructions.
+    :param coordinates: Coordinates object.
+    :return: Last position after having executed all the list of movements.
+    """
+    x, y = start_position[value_zero], start_position[value_one]
+    heading = heading_codes[start_position[value_two]]
+    min_x, min_y = coordinates.bottom_left_coordinates
+    max_x, max_y = coordinates.top_right_coordinates
+    occupied_positions = coordinates.occupied_positions
+
+    if not (min_x <= x <= max_x and min_y <= y <= max_y):
+        # Start position is not in the plane, every single step has to be checked, not only forward movements
+        return _execute_checking_every_step(x, y, heading, compiled_instructions, coordinates)
+
+    for code in compiled_instructions:
+        if code:
+            heading = turn_table[code][heading]
+        else:
+            x += delta_x[heading]
+            y += delta_y[heading]
+
+            if x < min_x or x > max_x or y < min_y or y > max_y:
+                raise_exit_known_plane(x, y, heading, coordinates)
+
+            if occupied_positions and (x, y) in occupied_positions:
+                raise ExceptionRoverCollision([x, y, heading_names[heading]])
+
+    return [x, y, heading_names[heading]]
+
+
+def _execute_checking_every_step(x, y, heading, compiled_instructions, coordinates):
+    """
+    _execute_checking_every_step(): Slow path of execute_compiled_movement for Rovers not starting in the plane,
+    rotations are checked as well as the original function does.
+    """
+    min_x, min_y = coordinates.bottom_left_coordinates
+    max_x, max_y = coordinates.top_right_coordinates
+
+    for code in compiled_instructions:
+        if code:
+            heading = turn_table[code][heading]
+        else:
+            x += delta_x[heading]
+            y += delta_y[heading]
+
+        if x < min_x or x > max_x or y < min_y or y > max_y:
+            raise_exit_known_plane(x, y, heading, coordinates)
+
+        if not code and coordinates.is_occupied(x, y):
+            raise ExceptionRoverCollision([x, y, heading_names[heading]])
+
+    return [x, y, heading_names[heading]]
+
+
+def compress_instructions(list_of_instructions):
+    """
+    compress_instructions(): Function that will compress a parsed list of instructions into segments. Rotations are
+    normalized modulo 4, 'LR' or 'LLLL' spins vanish, and consecutive forward movements are collapsed into one
+    segment move.
+    :param list_of_instructions: Parsed list (or string) of known movements, already upper case.
+    :return: List of tuples (heading rotation to the right, number of forward movements).
+    """
+    number_of_headings = len(heading_names)
+    segments = list()
+
+    for rotations, movements in segment_pattern.findall(''.join(list_of_instructions)):
+        if rotations or movements:
+            segments.append(((rotations.count('R') - rotations.count('L')) % number_of_headings, len(movements)))
+
+    return segments
+
+
+def execute_segmented_movement(start_position, list_of_instructions, coordinates, coverage=None):
+    """
+    execute_segmented_movement(): Equivalent of the step by step execution working on compressed segments. The plane
+    is checked once per segment comparing its end point against the plane box, the first wrong position is then
+    worked out from the edge broken, so the exception raised is the same one the step by step check raises. Rovers
+    already deployed are looked for along the whole segment at once too.
+    :param start_position: Rover start position [x, y, orientation].
+    :param list_of_instructions: Parsed list (or string) of known movements, already upper case.
+    :param coordinates: Coordinates object.
+    :return: Last position after having executed all the list of movements.
+    """
+    x, y = start_position[value_zero], start_position[value_one]
+    heading = heading_codes[start_position[value_two]]
+    min_x, min_y = coordinates.bottom_left_coordinates
+    max_x, max_y = coordinates.top_right_coordinates
+
+    if not (min_x <= x <= max_x and min_y <= y <= max_y):
+        # Start position is not in the plane, every single step has to be checked, not only forward movements
+        end_position = _execute_checking_every_step(x, y, heading, compile_instructions(list_of_instructions),
+                                                    coordinates)
+        if coverage is not None:
+            coverage.mark_path(start_position, compress_instructions(list_of_instructions))
+        return end_position
+
+    segments = compress_instructions(list_of_instructions)
+    x, y, heading, _, _, _, _ = _execute_segments(x, y, heading, segments, coordinates)
+
+    if coverage is not None:
+        coverage.mark_path(start_position, segments)
+
+    return [x, y, heading_names[heading]]
+
+
+def _execute_segments(x, y, heading, segments, coordinates):
+    """
+    _execute_segments(): Function that will execute compressed segments from a position in the plane, for
+    execute_segmented_movement and execute_recorded_movement.
+    :return: Tuple (x, y, heading code, min x, min y, max x, max y) of the last position and the box of the path.
+    """
+    number_of_headings = len(heading_names)
+    min_x, min_y = coordinates.bottom_left_coordinates
+    max_x, max_y = coordinates.top_right_coordinates
+    low_x = high_x = x
+    low_y = high_y = y
+
+    for rotation, movements in segments:
+        heading = (heading + rotation) % number_of_headings
+
+        if movements:
+            # Rovers already deployed are only looked for in the part of the segment which is in the plane
+            steps_to_edge = (max_y - y, max_x - x, y - min_y, x - min_x)[heading]
+            occupied_step = coordinates.find_first_occupied_step(x, y, delta_x[heading], delta_y[heading],
+                                                                 min(movements, steps_to_edge))
+            if occupied_step is not None:
+                raise ExceptionRoverCollision([x + delta_x[heading] * occupied_step,
+                                               y + delta_y[heading] * occupied_step, heading_names[heading]])
+
+            x += delta_x[heading] * movements
+            y += delta_y[heading] * movements
+
+            if x < min_x or x > max_x or y < min_y or y > max_y:
+                # Segment started in the plane, the first step out of it is just one step beyond the edge broken
+                raise_exit_known_plane(max(min_x - value_one, min(x, max_x + value_one)),
+                                       max(min_y - value_one, min(y, max_y + value_one)), heading, coordinates)
+
+            # Only one axis changes along a segment
+            if x < low_x:
+                low_x = x
+            elif x > high_x:
+                high_x = x
+            if y < low_y:
+                low_y = y
+            elif y > high_y:
+                high_y = y
+
+    return x, y, heading, low_x, low_y, high_x, high_y
+
+
+def compute_program_effect(list_of_instructions, heading):
+    """
+    compute_program_effect(): Function that will work out the net effect of a list of instructions, which only
+    depends on the starting heading, together with the bounding box of the path relative to the start position.
+    :param list_of_instructions: Parsed list (or string) of known movements, already upper case.
+    :param heading: Heading code the Rover starts with.
+    :return: Tuple (dx, dy, end heading code, min dx, min dy, max dx, max dy).
+    """
+    x = y = min_x = min_y = max_x = max_y = value_zero
+    number_of_headings = len(heading_names)
+
+    for rotation, movements in compress_instructions(list_of_instructions):
+        heading = (heading + rotation) % number_of_headings
+
+        if movements:
+            x += delta_x[heading] * movements
+            y += delta_y[heading] * movements
+            min_x, min_y, max_x, max_y = min(min_x, x), min(min_y, y), max(max_x, x), max(max_y, y)
+
+    return x, y, heading, min_x, min_y, max_x, max_y
+
+
+def join_instructions(list_of_instructions):
+    """
+    join_instructions(): Function that will return a parsed list of instructions as a string, strings are returned
+    as they are instead of being joined letter by letter.
+    """
+    if isinstance(list_of_instructions, str):
+        return list_of_instructions
+
+    return ''.join(list_of_instructions)
+
+
+def find_instructions_period(list_of_instructions):
+    """
+    find_instructions_period(): Function that will look for the longest run of instructions repeating a block, e.g. a
+    patrol sent thousands of times, which may come after and before a few other instructions. The run is anchored on
+    a piece of the list a quarter of the way into it and has to cover half of the list at least. The first and last
+    repetitions may be cut short.
+    :param list_of_instructions: Parsed list (or string) of known movements, already upper case.
+    :return: Tuple (start of the run, end of the run, length of the block), None if the list of instructions is
+    short or there is no such run.
+    """
+    instructions = join_instructions(list_of_instructions)
+    length = len(instructions)
+
+    if length < periodic_instructions_threshold:
+        return None
+
+    # The anchor is found again one block after itself, candidates are checked extending the run both ways
+    anchor = length // 4
+    anchor_instructions = instructions[anchor:anchor + length // 8]
+    position = instructions.find(anchor_instructions, anchor + value_one)
+
+    for _ in range(period_candidates_limit):
+        if position == -value_one:
+            return None
+
+        period = position - anchor
+        start, end = _find_periodic_run(instructions, anchor, period)
+        if end - start >= length // value_two and end - start >= value_two * period:
+            return start, end, period
+
+        position = instructions.find(anchor_instructions, position + value_one)
+
+    return None
+
+
+def _find_periodic_run(instructions, anchor, period):
+    """
+    _find_periodic_run(): Function that will extend, both ways, the run of instructions equal to the ones a block
+    later from the anchor. Slices as long as possible are compared, halved when they differ.
+    :return: Tuple (start, end) of the run, instructions from start to end repeat the block.
+    """
+    length = len(instructions)
+    end = anchor
+    size = period
+
+    while size and end + period < length:
+        size = min(size, length - period - end)
+        if instructions[end:end + size] == instructions[end + period:end + period + size]:
+            end += size
+            size *= value_two
+        else:
+            size //= value_two
+
+    start = anchor
+    size = period
+
+    while size and start > value_zero:
+        size = min(size, start)
+        if instructions[start - size:start] == instructions[start - size + period:start + period]:
+            start -= size
+            size *= value_two
+        else:
+            size //= value_two
+
+    return start, end + period
+
+
+def combine_program_effects(effect, next_effect):
+    """
+    combine_program_effects(): Function that will work out the net effect of a list of instructions followed by
+    another one, as returned by compute_program_effect.
+    :param effect: Effect of the first list of instructions.
+    :param next_effect: Effect of the second one, starting with the end heading of the first one.
+    :return: Tuple (dx, dy, end heading code, min dx, min dy, max dx, max dy).
+    """
+    dx, dy, _, min_dx, min_dy, max_dx, max_dy = effect
+    next_dx, next_dy, heading, next_min_dx, next_min_dy, next_max_dx, next_max_dy = next_effect
+
+    return (dx + next_dx, dy + next_dy, heading, min(min_dx, dx + next_min_dx), min(min_dy, dy + next_min_dy),
+            max(max_dx, dx + next_max_dx), max(max_dy, dy + next_max_dy))
+
+
+def repeat_program_effect(effect, repetitions):
+    """
+    repeat_program_effect(): Function that will work out, in closed form, the net effect of a list of instructions
+    ending with the heading it starts with, executed several times in a row. Each repetition moves the path by the
+    same amount, so the bounding box only grows towards it.
+    :param effect: Effect of the list of instructions, end heading must be the start one.
+    :param repetitions: Times it is executed.
+    :return: Tuple (dx, dy, end heading code, min dx, min dy, max dx, max dy).
+    """
+    dx, dy, heading, min_dx, min_dy, max_dx, max_dy = effect
+
+    if repetitions <= value_zero:
+        return value_zero, value_zero, heading, value_zero, value_zero, value_zero, value_zero
+
+    last_x, last_y = dx * (repetitions - value_one), dy * (repetitions - value_one)
+
+    return (dx * repetitions, dy * repetitions, heading, min(min_dx, min_dx + last_x), min(min_dy, min_dy + last_y),
+            max(max_dx, max_dx + last_x), max(max_dy, max_dy + last_y))
+
+
+def split_periodic_instructions(instructions, heading):
+    """
+    split_periodic_instructions(): Function that will split the longest periodic run of a list of instructions into
+    cycles, a cycle being the block repeated as many times as needed for the Rover to face again the heading it
+    starts the run with, at most 4.
+    :param instructions: String of known movements, already upper case.
+    :param heading: Heading code the Rover starts with.
+    :return: Tuple (length of the instructions before the first cycle, effect of a cycle, length of a cycle, number
+    of cycles), None if there are not two cycles. The instructions after the last cycle start with the heading the
+    first one does.
+    """
+    periodic_run = find_instructions_period(instructions)
+
+    if periodic_run is None:
+        return None
+
+    start, end, period = periodic_run
+    heading = compute_program_effect(instructions[:start], heading)[value_two]
+    block = instructions[start:start + period]
+    cycle_effect = compute_program_effect(block, heading)
+    cycle_length = period
+
+    while cycle_effect[value_two] != heading:
+        cycle_effect = combine_program_effects(cycle_effect, compute_program_effect(block, cycle_effect[value_two]))
+        cycle_length += period
+
+    if (end - start) // cycle_length < value_two:
+        return None
+
+    return start, cycle_effect, cycle_length, (end - start) // cycle_length
+
+
+def compute_periodic_program_effect(list_of_instructions, heading):
+    """
+    compute_periodic_program_effect(): Equivalent of compute_program_effect which, for lists of instructions with a
+    periodic run, only executes one cycle and the instructions before and after the cycles, the rest is worked out in
+    closed form.
+    :param list_of_instructions: Parsed list (or string) of known movements, already upper case.
+    :param heading: Heading code the Rover starts with.
+    :return: Tuple (dx, dy, end heading code, min dx, min dy, max dx, max dy).
+    """
+    instructions = join_instructions(list_of_instructions)
+    cycles = split_periodic_instructions(instructions, heading)
+
+    if cycles is None:
+        return compute_program_effect(instructions, heading)
+
+    start, cycle_effect, cycle_length, number_of_cycles = cycles
+    prefix_effect = compute_program_effect(instructions[:start], heading)
+    rest_effect = compute_program_effect(instructions[start + number_of_cycles * cycle_length:],
+                                         prefix_effect[value_two])
+    return combine_program_effects(combine_program_effects(prefix_effect, repeat_program_effect(cycle_effect,
+                                                                                                number_of_cycles)),
+                                   rest_effect)
+
+
+def execute_periodic_movement(start_position, list_of_instructions, coordinates):
+    """
+    execute_periodic_movement(): Equivalent of execute_segmented_movement jumping ahead over the cycles of lists of
+    instructions with a periodic run. The instructions before the cycles are executed first. The bounding box of the
+    rest of the path is checked once against the plane and the Rovers already deployed, if it is not clear, the
+    cycles before the first one whose path may not be clear are skipped at once, found by bisection, and the rest of
+    the instructions are executed, raising the same exception with the same position.
+    :param start_position: Rover start position [x, y, orientation].
+    :param list_of_instructions: Parsed list (or string) of known movements, already upper case.
+    :param coordinates: Coordinates object.
+    :return: Last position after having executed all the list of movements.
+    """
+    instructions = join_instructions(list_of_instructions)
+    cycles = split_periodic_instructions(instructions, heading_codes[start_position[value_two]])
+
+    if cycles is None:
+        return execute_segmented_movement(start_position, instructions, coordinates)
+
+    start, cycle_effect, cycle_length, number_of_cycles = cycles
+    if start:
+        start_position = execute_segmented_movement(start_position, instructions[:start], coordinates)
+        instructions = instructions[start:]
+
+    x, y = start_position[value_zero], start_position[value_one]
+    heading = heading_codes[start_position[value_two]]
+    min_x, min_y = coordinates.bottom_left_coordinates
+    max_x, max_y = coordinates.top_right_coordinates
+
+    def is_path_clear(effect):
+        _, _, _, min_dx, min_dy, max_dx, max_dy = effect
+        return min_x <= x + min_dx and x + max_dx <= max_x and min_y <= y + min_dy and y + max_dy <= max_y and \
+            not coordinates.is_area_occupied(x + min_dx, y + min_dy, x + max_dx, y + max_dy)
+
+    effect = combine_program_effects(repeat_program_effect(cycle_effect, number_of_cycles),
+                                     compute_program_effect(instructions[number_of_cycles * cycle_length:], heading))
+    if is_path_clear(effect):
+        return [x + effect[value_zero], y + effect[value_one], heading_names[effect[value_two]]]
+
+    # Bounding box of the first cycles only grows with their number, the clear ones can be found by bisection
+    clear_cycles, unclear_cycles = value_zero, number_of_cycles + value_one
+    while unclear_cycles - clear_cycles > value_one:
+        middle = (clear_cycles + unclear_cycles) // value_two
+        if is_path_clear(repeat_program_effect(cycle_effect, middle)):
+            clear_cycles = middle
+        else:
+            unclear_cycles = middle
+
+    return execute_segmented_movement([x + cycle_effect[value_zero] * clear_cycles,
+                                       y + cycle_effect[value_one] * clear_cycles, heading_names[heading]],
+                                      instructions[clear_cycles * cycle_length:], coordinates)
+
+
+def execute_recorded_movement(start_position, list_of_instructions, coordinates):
+    """
+    execute_recorded_movement(): Equivalent of execute_periodic_movement returning the effect of the list of
+    instructions instead of the last position, so that it can be kept without working it out again. Non periodic
+    lists of instructions are executed and recorded in a single segmented pass.
+    :param start_position: Rover start position [x, y, orientation].
+    :param list_of_instructions: Parsed list (or string) of known movements, already upper case.
+    :param coordinates: Coordinates object.
+    :return: Tuple (dx, dy, end heading code, min dx, min dy, max dx, max dy), the last position is the start one
+    moved by (dx, dy).
+    """
+    instructions = join_instructions(list_of_instructions)
+    x, y = start_position[value_zero], start_position[value_one]
+    heading = heading_codes[start_position[value_two]]
+    min_x, min_y = coordinates.bottom_left_coordinates
+    max_x, max_y = coordinates.top_right_coordinates
+
+    if not (min_x <= x <= max_x and min_y <= y <= max_y) or \
+            split_periodic_instructions(instructions, heading) is not None:
+        # Cycles are skipped executing the movements, their effect is worked out in closed form on its own
+        execute_periodic_movement(start_position, instructions, coordinates)
+        return compute_periodic_program_effect(instructions, heading)
+
+    end_x, end_y, heading, low_x, low_y, high_x, high_y = _execute_segments(x, y, heading,
+                                                                            compress_instructions(instructions),
+                                                                            coordinates)
+
+    return end_x - x, end_y - y, heading, low_x - x, low_y - y, high_x - x, high_y - y
+
+
+def raise_exit_known_plane(x, y, heading, coordinates):
+    """
+    raise_exit_known_plane(): Function that will raise ExceptionRoverAttemptingToExitKnownPlane for a position out of
+    the plane.
+    :param x: X coordinate of the wrong position.
+    :param y: Y coordinate of the wrong position.
+    :param heading: Heading code of the wrong position.
+    :param coordinates: Coordinates object.
+    :return: Nothing, it always raises.
+    """
+    raise build_exit_known_plane_exception(x, y, heading, coordinates)
+
+
+def build_exit_known_plane_exception(x, y, heading, coordinates):
+    """
+    build_exit_known_plane_exception(): Function that will build ExceptionRoverAttemptingToExitKnownPlane for a
+    position out of the plane, reporting the first axis broken in the same order the original bounds check does.
+    :param x: X coordinate of the wrong position.
+    :param y: Y coordinate of the wrong position.
+    :param heading: Heading code of the wrong position.
+    :param coordinates: Coordinates object.
+    :return: Exception object, None if the position is in the plane.
+    """
+    wrong_position = [x, y, heading_names[heading]]
+
+    for index, axis in enumerate(coordinates.coordinates_definition):
+        if not coordinates.bottom_left_coordinates[index] <= wrong_position[index] <= \
+                coordinates.top_right_coordinates[index]:
+            return ExceptionRoverAttemptingToExitKnownPlane(wrong_position, axis,
+                                                            coordinates.top_right_coordinates[index],
+                                                            coordinates.bottom_left_coordinates[index])
+    return None
@@ -0,0 +1,177 @@
+# Planner of the shortest set of instructions taking a Rover from a start position to a goal position, without
+# exceeding the plane edge nor going through a Rover already deployed.
+# A* search over (x, y, heading) states, each instruction costing one. States are encoded as a single int,
+# cell * 4 + heading, so that huge planes need no grid, only the states reached are stored.
+
+# Python imports
+import heapq
+
+# Custom imports
+from .common_params import value_zero, value_one, value_two
+from .movement_engine import heading_names, heading_codes, delta_x, delta_y, turn_table, instruction_move, \
+    instruction_left, instruction_right
+from .rover_exceptions import ExceptionNoPathFound
+
+# Letter of each instruction code, plus a code for the start state which is reached by no instruction
+instruction_letters = 'MLR'
+instruction_none = 3
+instruction_bits = 2
+instruction_mask = (value_one << instruction_bits) - value_one
+
+
+def turns_between(heading, other_heading):
+    """
+    turns_between(): Function that will return the number of rotations needed to go from a heading to another one.
+    :param heading: Heading code.
+    :param other_heading: Heading code.
+    :return: 0, 1 or 2.
+    """
+    number_of_headings = len(heading_names)
+    return min((heading - other_heading) % number_of_headings, (other_heading - heading) % number_of_headings)
+
+
+def build_turn_heuristic(goal_heading):
+    """
+    build_turn_heuristic(): Function that will build the table of the fewest rotations needed to reach the goal
+    heading, having to face on the way every direction the goal is at. It is the exact number of rotations on a plane
+    with no edges nor Rovers, so it never overestimates.
+    :param goal_heading: Heading code of the goal position.
+    :return: Tuple indexed by heading * 9 + (sign of dx + 1) * 3 + (sign of dy + 1).
+    """
+    table = list()
+
+    for heading in range(len(heading_names)):
+        for sign_x in (-value_one, value_zero, value_one):
+            for sign_y in (-value_one, value_zero, value_one):
+                directions = [delta_x.index(sign_x)] if sign_x else []
+                directions += [delta_y.index(sign_y)] if sign_y else []
+                table.append(min(turns_between(heading, order[value_zero]) +
+                                 sum(turns_between(order[index], order[index + value_one])
+                                     for index in range(len(order) - value_one))
+                                 for order in ([heading] + directions + [goal_heading],
+                                               [heading] + directions[::-1] + [goal_heading])))
+
+    return tuple(table)
+
+
+def plan_instructions(coordinates, start_position, goal_position, occupied_positions=None):
+    """
+    plan_instructions(): Function that will work out the shortest set of instructions taking a Rover from its start
+    position to the goal position, staying in the plane and not going through any occupied position.
+    :param coordinates: Coordinates object.
+    :param start_position: Rover start position [x, y, orientation].
+    :param goal_position: Goal position [x, y, orientation].
+    :param occupied_positions: Iterable of (x, y) positions of Rovers already deployed, the ones of coordinates by
+    default.
+    :return: String of instructions, as short as possible.
+    """
+    min_x, min_y = coordinates.bottom_left_coordinates
+    max_x, max_y = coordinates.top_right_coordinates
+    number_of_headings = len(heading_names)
+
+    for position in (start_position, goal_position):
+        if not (min_x <= position[value_zero] <= max_x and min_y <= position[value_one] <= max_y):
+            raise ExceptionNoPathFound(start_position, goal_position, "Start and goal positions must be in the plane")
+
+    if occupied_positions is None:
+        occupied_positions = coordinates.occupied_positions
+
+    # Cells numbered column by column, moving forward adds a constant to the cell
+    rows = max_y - min_y + value_one
+    number_of_cells = (max_x - min_x + value_one) * rows
+    number_of_states = number_of_cells * number_of_headings
+    cell_deltas = tuple(delta_x[heading] * rows + delta_y[heading] for heading in range(number_of_headings))
+    blocked_cells = set((x - min_x) * rows + y - min_y for x, y in occupied_positions
+                        if min_x <= x <= max_x and min_y <= y <= max_y)
+
+    start_cell = (start_position[value_zero] - min_x) * rows + start_position[value_one] - min_y
+    start_state = start_cell * number_of_headings + heading_codes[start_position[value_two]]
+    goal_x, goal_y = goal_position[value_zero] - min_x, goal_position[value_one] - min_y
+    goal_heading = heading_codes[goal_position[value_two]]
+    goal_cell = goal_x * rows + goal_y
+    goal_state = goal_cell * number_of_headings + goal_heading
+
+    if goal_cell in blocked_cells and goal_cell != start_cell:
+        raise ExceptionNoPathFound(start_position, goal_position, "Goal position is occupied by another Rover")
+
+    turn_heuristic = build_turn_heuristic(goal_heading)
+    # Heuristic is never higher than this, so that heap entries can be encoded as a single int
+    heuristic_bound = number_of_cells + value_two * number_of_headings
+
+    def heuristic(cell, heading):
+        x, y = divmod(cell, rows)
+        sign_x, sign_y = (goal_x > x) - (goal_x < x), (goal_y > y) - (goal_y < y)
+        return abs(goal_x - x) + abs(goal_y - y) + \
+            turn_heuristic[heading * 9 + (sign_x + value_one) * 3 + sign_y + value_one]
+
+    # Cost and last instruction of every state reached, encoded as cost << instruction_bits | instruction code
+    reached = {start_state: instruction_none}
+    start_heuristic = heuristic(start_cell, start_state % number_of_headings)
+    # Entries ordered by estimated total cost, then by estimated remaining cost, encoded as a single int too
+    frontier = [(start_heuristic * heuristic_bound + start_heuristic) * number_of_states + start_state]
+
+    while frontier:
+        rest, state = divmod(heapq.heappop(frontier), number_of_states)
+        total_cost, remaining_cost = divmod(rest, heuristic_bound)
+        cost = total_cost - remaining_cost
+
+        if cost != reached[state] >> instruction_bits:
+            # A shorter way to this state was found after pushing this entry
+            continue
+
+        if state == goal_state:
+            return _rebuild_instructions(reached, start_state, goal_state, cell_deltas)
+
+        cell, heading = divmod(state, number_of_headings)
+        next_cost = cost + value_one
+
+        for instruction in (instruction_move, instruction_left, instruction_right):
+            if instruction == instruction_move:
+                next_cell = cell + cell_deltas[heading]
+                next_heading = heading
+
+                # Moving forward must not exceed the plane edge, nor go through a Rover already deployed
+                if delta_y[heading] and not value_zero <= cell % rows + delta_y[heading] < rows:
+                    continue
+                if not value_zero <= next_cell < number_of_cells or next_cell in blocked_cells:
+                    continue
+            else:
+                next_cell = cell
+                next_heading = turn_table[instruction][heading]
+
+            next_state = next_cell * number_of_headings + next_heading
+            previous = reached.get(next_state)
+
+            if previous is None or previous >> instruction_bits > next_cost:
+                reached[next_state] = next_cost << instruction_bits | instruction
+                next_heuristic = heuristic(next_cell, next_heading)
+                heapq.heappush(frontier, ((next_cost + next_heuristic) * heuristic_bound + next_heuristic) *
+                               number_of_states + next_state)
+
+    raise ExceptionNoPathFound(start_position, goal_position)
+
+
+def _rebuild_instructions(reached, start_state, goal_state, cell_deltas):
+    """
+    _rebuild_instructions(): Function that will walk back from the goal state to the start state following the last
+    instruction of each state.
+    :return: String of instructions.
+    """
+    number_of_headings = len(heading_names)
+    instructions = list()
+    state = goal_state
+
+    while state != start_state:
+        instruction = reached[state] & instruction_mask
+        instructions.append(instruction_letters[instruction])
+        cell, heading = divmod(state, number_of_headings)
+
+        if instruction == instruction_move:
+            cell -= cell_deltas[heading]
+        else:
+            # Undo the rotation, the opposite one
+            heading = turn_table[instruction_right if instruction == instruction_left else instruction_left][heading]
+
+        state = cell * number_of_headings + heading
+
+    return ''.join(reversed(instructions))
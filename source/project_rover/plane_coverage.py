@@ -0,0 +1,209 @@
+# Python imports
+import binascii
+import re
+
+# Custom imports
+from .common_params import value_zero, value_one, value_two
+from . import movement_engine
+
+# Biggest bitset kept in memory for the whole plane, in bytes, bigger planes switch to sparse tiles
+dense_size_limit = 2 ** 24
+
+# Positions per side of a tile, tiles are only allocated once a Rover visits them
+tile_size = 256
+tile_row_size = tile_size // 8
+
+# Bits of a byte, most significant one first, so that a row read as a bit string follows X axis
+bit_masks = tuple(0x80 >> bit for bit in range(8))
+
+# Tables setting one bit on every byte of a bytearray at once, indexed by bit
+set_bit_tables = tuple(bytes(bytearray((byte | mask) for byte in range(256))) for mask in bit_masks)
+
+unvisited_pattern = re.compile('0+')
+
+
+class CoverageMap:
+    """
+    CoverageMap Class object, it records every position of the plane visited by the Rovers.
+    Positions are kept as a bitset, one bit per position and one byte aligned row per Y. Planes whose bitset would be
+    bigger than dense_size_limit are split into square tiles, only the tiles visited are kept in memory.
+    """
+    def __init__(self, coordinates, size_limit=dense_size_limit):
+        self.min_x, self.min_y = coordinates.bottom_left_coordinates
+        self.max_x, self.max_y = coordinates.top_right_coordinates
+        self.width = self.max_x - self.min_x + value_one
+        self.height = self.max_y - self.min_y + value_one
+        self.row_size = (self.width + 7) // 8
+
+        if self.row_size * self.height <= size_limit:
+            self.bits = bytearray(self.row_size * self.height)
+            self.tiles = None
+        else:
+            # (tile column, tile row) -> bitset of the tile
+            self.bits = None
+            self.tiles = dict()
+
+    def is_dense(self):
+        """
+        CoverageMap's function that will return whether the whole plane is kept as one bitset or as sparse tiles.
+        """
+        return self.bits is not None
+
+    def mark_path(self, start_position, segments):
+        """
+        CoverageMap's function that will mark as visited every position of a path that finished in the plane.
+        :param start_position: Rover start position [x, y, orientation].
+        :param segments: Segments of the path, as returned by movement_engine.compress_instructions.
+        :return: Nothing
+        """
+        x, y = start_position[value_zero], start_position[value_one]
+        heading = movement_engine.heading_codes[start_position[value_two]]
+        number_of_headings = len(movement_engine.heading_names)
+
+        self.mark_run(x, y, x, y)
+
+        for rotation, movements in segments:
+            heading = (heading + rotation) % number_of_headings
+
+            if movements:
+                end_x = x + movement_engine.delta_x[heading] * movements
+                end_y = y + movement_engine.delta_y[heading] * movements
+                self.mark_run(x, y, end_x, end_y)
+                x, y = end_x, end_y
+
+    def mark_run(self, first_x, first_y, last_x, last_y):
+        """
+        CoverageMap's function that will mark as visited a straight run of positions, horizontal or vertical. Positions
+        out of the plane are ignored.
+        """
+        first_column = max(min(first_x, last_x), self.min_x) - self.min_x
+        last_column = min(max(first_x, last_x), self.max_x) - self.min_x
+        first_row = max(min(first_y, last_y), self.min_y) - self.min_y
+        last_row = min(max(first_y, last_y), self.max_y) - self.min_y
+
+        if first_column > last_column or first_row > last_row:
+            return
+
+        if self.bits is not None:
+            _set_run(self.bits, self.row_size, first_column, first_row, last_column, last_row)
+            return
+
+        for tile_row in range(first_row // tile_size, last_row // tile_size + value_one):
+            for tile_column in range(first_column // tile_size, last_column // tile_size + value_one):
+                tile = self.tiles.get((tile_column, tile_row))
+                if tile is None:
+                    tile = self.tiles[(tile_column, tile_row)] = bytearray(tile_row_size * tile_size)
+
+                column_offset, row_offset = tile_column * tile_size, tile_row * tile_size
+                _set_run(tile, tile_row_size,
+                         max(first_column - column_offset, value_zero), max(first_row - row_offset, value_zero),
+                         min(last_column - column_offset, tile_size - value_one),
+                         min(last_row - row_offset, tile_size - value_one))
+
+    def visited_positions(self):
+        """
+        CoverageMap's function that will return the number of positions visited.
+        """
+        if self.bits is not None:
+            return _count_bits(self.bits)
+
+        return sum(_count_bits(tile) for tile in self.tiles.values())
+
+    def coverage_percentage(self):
+        """
+        CoverageMap's function that will return the percentage of the plane visited.
+        """
+        return 100.0 * self.visited_positions() / (self.width * self.height)
+
+    def unvisited_regions(self):
+        """
+        CoverageMap's generator that will return the positions not visited yet, as runs of the same row.
+        :return: Yields tuples (y, first x, last x), sorted by Y and X.
+        """
+        if self.bits is not None:
+            for row in range(self.height):
+                for first, last in _unvisited_runs(self.bits, self.row_size, row, self.width):
+                    yield row + self.min_y, first + self.min_x, last + self.min_x
+            return
+
+        # Sorted tile columns allocated on each tile row
+        tile_columns = dict()
+        for tile_column, tile_row in sorted(self.tiles.keys()):
+            tile_columns.setdefault(tile_row, list()).append(tile_column)
+
+        for row in range(self.height):
+            tile_row, row_in_tile = divmod(row, tile_size)
+            runs = list()
+            next_column = value_zero
+
+            for tile_column in tile_columns.get(tile_row, list()):
+                column_offset = tile_column * tile_size
+                tile_width = min(tile_size, self.width - column_offset)
+
+                # Tiles not allocated are not visited at all
+                if column_offset > next_column:
+                    _append_run(runs, next_column, column_offset - value_one)
+
+                for first, last in _unvisited_runs(self.tiles[(tile_column, tile_row)], tile_row_size, row_in_tile,
+                                                   tile_width):
+                    _append_run(runs, first + column_offset, last + column_offset)
+                next_column = column_offset + tile_width
+
+            if next_column < self.width:
+                _append_run(runs, next_column, self.width - value_one)
+
+            for first, last in runs:
+                yield row + self.min_y, first + self.min_x, last + self.min_x
+
+
+def _set_run(bits, row_size, first_column, first_row, last_column, last_row):
+    """
+    _set_run(): Set the bits of a straight run of positions of a bitset, either first_row is last_row or
+    first_column is last_column.
+    """
+    if first_row == last_row:
+        offset = first_row * row_size
+        first_byte, last_byte = offset + first_column // 8, offset + last_column // 8
+        first_mask = 0xff >> (first_column % 8)
+        last_mask = (0xff << (7 - last_column % 8)) & 0xff
+
+        if first_byte == last_byte:
+            bits[first_byte] |= first_mask & last_mask
+        else:
+            bits[first_byte] |= first_mask
+            bits[first_byte + value_one:last_byte] = b'\xff' * (last_byte - first_byte - value_one)
+            bits[last_byte] |= last_mask
+    else:
+        # Same bit of consecutive rows, set at once with a translation table
+        start = first_row * row_size + first_column // 8
+        stop = last_row * row_size + first_column // 8 + value_one
+        bits[start:stop:row_size] = bits[start:stop:row_size].translate(set_bit_tables[first_column % 8])
+
+
+def _count_bits(bits):
+    """
+    _count_bits(): Number of bits set in a bitset, counted by chunks so that the bit string built is kept small.
+    """
+    chunk_size = 2 ** 16
+    return sum(bin(int(binascii.hexlify(bits[start:start + chunk_size]), 16)).count('1')
+               for start in range(value_zero, len(bits), chunk_size))
+
+
+def _append_run(runs, first, last):
+    """
+    _append_run(): Append a run to a sorted list of runs, merging it with the last one if they are contiguous.
+    """
+    if runs and runs[-value_one][value_one] + value_one == first:
+        runs[-value_one] = (runs[-value_one][value_zero], last)
+    else:
+        runs.append((first, last))
+
+
+def _unvisited_runs(bits, row_size, row, width):
+    """
+    _unvisited_runs(): Runs of positions not set on a row of a bitset.
+    :return: List of tuples (first column, last column).
+    """
+    row_bytes = bits[row * row_size:(row + value_one) * row_size]
+    row_bit_string = '{:0{}b}'.format(int(binascii.hexlify(row_bytes), 16), row_size * 8)[:width]
+    return [(match.start(), match.end() - value_one) for match in unvisited_pattern.finditer(row_bit_string)]
@@ -0,0 +1,139 @@
+# Execution of very long sets of instructions in chunks, checkpointing the state of the Rover to a small file after
+# each chunk. A wrong position only throws away the chunk it is found in: the Rover stays at the last checkpoint, the
+# remaining instructions can be corrected and the execution resumed, from the same object or from the checkpoint file.
+# Checkpoint layout, little endian: magic, version, Rover number, x, y, heading code, instructions executed and CRC-32
+# of the instructions executed, so that a resumed program is known to share them.
+
+# Python imports
+import os
+import struct
+import zlib
+
+# Custom imports
+from .common_params import value_zero, value_one, value_two
+from .movement_engine import execute_segmented_movement, heading_codes, heading_names
+from .rover import parse_set_of_instructions
+
+checkpoint_magic = b'RCKP'
+checkpoint_version = 1
+checkpoint_struct = struct.Struct('<4sIqqqBqI')
+
+# Instructions executed between two checkpoints
+default_chunk_size = 2 ** 16
+
+
+class ResumableExecution:
+    """
+    ResumableExecution Class object, the execution of the set of instructions of a Rover, chunk by chunk.
+    """
+    def __init__(self, rover, checkpoint_path=None, chunk_size=default_chunk_size):
+        self.rover = rover
+        self.checkpoint_path = checkpoint_path
+        self.chunk_size = chunk_size
+        self.list_of_instructions = ''.join(rover.requested_list_of_instructions)
+        # State at the last checkpoint
+        self.position = list(rover.start_position)
+        self.offset = value_zero
+        self.executed_checksum = value_zero
+
+    def is_finished(self):
+        """
+        ResumableExecution's function that will return whether every instruction has been executed or not.
+        """
+        return self.offset >= len(self.list_of_instructions)
+
+    def execute_chunk(self, coordinates):
+        """
+        ResumableExecution's function that will execute the next chunk of instructions and checkpoint the new state.
+        If the chunk makes the Rover exit the plane or collide, the exception is raised and the state stays the one of
+        the last checkpoint.
+        :param coordinates: Coordinates object.
+        :return: Position reached.
+        """
+        chunk = self.list_of_instructions[self.offset:self.offset + self.chunk_size]
+        self.position = execute_segmented_movement(self.position, chunk, coordinates)
+        self.offset += len(chunk)
+        self.executed_checksum = zlib.crc32(chunk.encode('ascii'), self.executed_checksum)
+
+        if self.checkpoint_path is not None:
+            self.save_checkpoint()
+
+        if self.is_finished():
+            self.rover.end_position = list(self.position)
+
+        return self.position
+
+    def execute(self, coordinates):
+        """
+        ResumableExecution's function that will execute every chunk left.
+        :param coordinates: Coordinates object.
+        :return: Last position after having executed all the list of movements.
+        """
+        while not self.is_finished():
+            self.execute_chunk(coordinates)
+
+        self.rover.end_position = list(self.position)
+        return self.position
+
+    def correct_remaining_instructions(self, line_input):
+        """
+        ResumableExecution's function that will replace the instructions not executed yet, the ones already executed
+        are kept. If the instruction read is not known an exception will be raised and nothing is replaced.
+        :param line_input: Line of text containing the new remaining instructions.
+        :return: Nothing
+        """
+        remaining_instructions = parse_set_of_instructions(self.rover, line_input)
+
+        self.list_of_instructions = self.list_of_instructions[:self.offset] + remaining_instructions
+        self.rover.requested_list_of_instructions = self.list_of_instructions
+
+    def save_checkpoint(self):
+        """
+        ResumableExecution's function that will write the state of the last checkpoint to the checkpoint file,
+        replacing it at once so that a crash never leaves half a checkpoint.
+        """
+        temporary_path = "{}.tmp".format(self.checkpoint_path)
+
+        with open(temporary_path, 'wb') as checkpoint_file:
+            checkpoint_file.write(checkpoint_struct.pack(checkpoint_magic, checkpoint_version, self.rover.rover_number,
+                                                         self.position[value_zero], self.position[value_one],
+                                                         heading_codes[self.position[value_two]], self.offset,
+                                                         self.executed_checksum))
+
+        os.replace(temporary_path, self.checkpoint_path)
+
+
+def resume_execution(rover, checkpoint_path, chunk_size=default_chunk_size):
+    """
+    resume_execution(): Function that will continue the execution of a Rover from its checkpoint file. The set of
+    instructions of the Rover must start with the instructions already executed, the rest may have been corrected.
+    :param rover: Rover object, with start position and list of instructions set.
+    :param checkpoint_path: Path of the checkpoint file.
+    :param chunk_size: Instructions executed between two checkpoints.
+    :return: ResumableExecution object, at the state of the checkpoint.
+    """
+    with open(checkpoint_path, 'rb') as checkpoint_file:
+        data = checkpoint_file.read(checkpoint_struct.size)
+
+    if len(data) != checkpoint_struct.size:
+        raise ValueError("{} is not a checkpoint file of version {}".format(checkpoint_path, checkpoint_version))
+
+    magic, version, rover_number, x, y, heading, offset, executed_checksum = checkpoint_struct.unpack(data)
+
+    if magic != checkpoint_magic or version != checkpoint_version:
+        raise ValueError("{} is not a checkpoint file of version {}".format(checkpoint_path, checkpoint_version))
+
+    execution = ResumableExecution(rover, checkpoint_path, chunk_size)
+
+    if rover_number != rover.rover_number or offset > len(execution.list_of_instructions) or \
+            zlib.crc32(execution.list_of_instructions[:offset].encode('ascii')) != executed_checksum:
+        raise ValueError("{} is not a checkpoint of the instructions of {}".format(checkpoint_path, rover.rover_id))
+
+    execution.position = [x, y, heading_names[heading]]
+    execution.offset = offset
+    execution.executed_checksum = executed_checksum
+
+    if execution.is_finished():
+        rover.end_position = list(execution.position)
+
+    return execution
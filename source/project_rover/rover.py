@@ -0,0 +1,436 @@
+# Python imports
+import collections
+import re
+import threading
+import types
+
+# Custom imports
+from . import instrumentation
+from .common_params import value_zero, value_one, value_two
+from .movement_engine import execute_segmented_movement, execute_periodic_movement, execute_recorded_movement, \
+    join_instructions, heading_codes, heading_names
+from .rover_exceptions import ExceptionInstructionParameterNotKnown, ExceptionRoverAttemptingToExitKnownPlane, \
+    ExceptionRoverCollision
+
+# Any character which is not a known movement, whatever its case
+unknown_instruction_pattern = re.compile('[^LRM]', re.IGNORECASE)
+
+# Number of program effects kept by default in the cache
+default_program_effect_cache_size = 1024
+
+# Keys hold whole lists of instructions, total characters kept by default and length of the longest one cached
+default_program_effect_cache_characters = 2 ** 22
+default_program_effect_cache_key_length = 2 ** 16
+
+# Lists of instructions shorter than this are executed, a lookup would cost too much compared with what it saves
+program_effect_cache_minimum_length = 64
+
+# Rotation done by each known movement, shared by every Rover, read only
+set_of_known_movements = types.MappingProxyType({
+    'L': -value_one,
+    'R': value_one,
+    'M': None
+})
+
+
+class Rover:
+    """
+    Rover Class object.
+    """
+    # Millions of Rovers may be kept at once, only their own values are stored, tables are shared
+    __slots__ = ('rover_number', 'start_position', 'end_position', 'requested_list_of_instructions')
+
+    set_of_known_movements = set_of_known_movements
+
+    def __init__(self, rover_id):
+        self.rover_number = rover_id
+        self.start_position = None
+        self.end_position = None
+        self.requested_list_of_instructions = None
+
+    @property
+    def rover_id(self):
+        """
+        Getter for the name of the Rover, built when needed instead of being stored.
+        """
+        return "Rover[{}]".format(self.rover_number)
+
+    def set_rover_start_position(self, start_position, coordinates=None):
+        """
+        Setter for Rover's start position. If coordinates are given, Rover can not be deployed where another Rover is
+        already placed.
+        """
+        if coordinates is not None and coordinates.is_occupied(start_position[value_zero], start_position[value_one]):
+            raise ExceptionRoverCollision(start_position, "Rover can not be deployed where another Rover is placed")
+
+        self.start_position = start_position
+
+    def request_list_of_instructions(self):
+        """
+        Rover's function that will call read_set_of_instructions for requesting for instructions to be execute
+        lately.
+        """
+        self.requested_list_of_instructions = read_set_of_instructions(self)
+
+    def set_list_of_instructions(self, line_input):
+        """
+        Rover's function that will parse an instruction line already read, e.g. from a mission file, and store it
+        to be executed lately.
+        """
+        self.requested_list_of_instructions = parse_set_of_instructions(self, line_input)
+
+    def execute_movement(self, coordinates, coverage=None, trajectory=None):
+        """
+        Rover's function that will update Rover's end position accordingly with instructions received and
+        current coordinates defined. If a CoverageMap is given, the path followed is marked on it, if a
+        TrajectoryWriter is given, every step of the path is written to it.
+        """
+        self.end_position = execute_movement(self, coordinates, coverage, trajectory)
+
+
+class ProgramEffectCache:
+    """
+    ProgramEffectCache Class object, a least recently used cache of the net effect of the lists of instructions
+    executed, keyed by list of instructions and starting heading. It can be shared by Rovers moved from several
+    threads, effects are recorded by the caller outside of the lock. An effect is only kept the second time its
+    list of instructions is seen. Memory is bounded by the characters held by the keys too, lists of instructions
+    longer than maximum_key_length are never kept.
+    """
+    def __init__(self, maximum_size=default_program_effect_cache_size,
+                 maximum_characters=default_program_effect_cache_characters,
+                 maximum_key_length=default_program_effect_cache_key_length):
+        self.maximum_size = maximum_size
+        self.maximum_characters = maximum_characters
+        self.maximum_key_length = maximum_key_length
+        self.characters = value_zero
+        self.effects = collections.OrderedDict()
+        self.sightings = set()
+        self.lock = threading.Lock()
+        self.hits = value_zero
+        self.misses = value_zero
+
+    def __len__(self):
+        return len(self.effects)
+
+    def get_effect(self, list_of_instructions, heading):
+        """
+        ProgramEffectCache's function that will return the effect of a list of instructions from the cache, and
+        whether it should be recorded if it is not there. Effects are only worth being kept from the second time their
+        list of instructions is seen on, missions where every Rover has its own one would work them out for nothing.
+        :param list_of_instructions: Parsed string of known movements.
+        :param heading: Heading code the Rover starts with.
+        :return: Tuple (effect, True if it is seen again), effect being a tuple (dx, dy, end heading code, min dx,
+        min dy, max dx, max dy) or None if it is not cached.
+        """
+        key = (list_of_instructions, heading)
+
+        with self.lock:
+            effect = self.effects.get(key)
+
+            if effect is not None:
+                # Latest used effect goes to the end
+                self.effects.move_to_end(key)
+                self.hits += value_one
+                return effect, False
+
+            self.misses += value_one
+
+            if len(list_of_instructions) > min(self.maximum_key_length, self.maximum_characters):
+                # Keeping it would only fill the cache with a single key
+                return None, False
+
+            # Only hashes of the lists of instructions seen once are kept, all forgotten when there are too many
+            sighting = hash(key)
+            if sighting in self.sightings:
+                self.sightings.discard(sighting)
+                return None, True
+
+            if len(self.sightings) >= self.maximum_size:
+                self.sightings.clear()
+            self.sightings.add(sighting)
+
+        return None, False
+
+    def set_effect(self, list_of_instructions, heading, effect):
+        """
+        ProgramEffectCache's function that will keep the effect of a list of instructions, evicting the least
+        recently used ones if needed.
+        :param list_of_instructions: Parsed string of known movements.
+        :param heading: Heading code the Rover starts with.
+        :param effect: Tuple (dx, dy, end heading code, min dx, min dy, max dx, max dy).
+        """
+        key = (list_of_instructions, heading)
+
+        with self.lock:
+            if self.effects.pop(key, None) is not None:
+                # Added by another thread meanwhile
+                self.characters -= len(list_of_instructions)
+
+            if self.maximum_size > value_zero and len(list_of_instructions) <= self.maximum_characters:
+                self._evict(self.maximum_size - value_one, self.maximum_characters - len(list_of_instructions))
+
+                # Latest used effect goes to the end
+                self.effects[key] = effect
+                self.characters += len(list_of_instructions)
+
+    def set_maximum_size(self, maximum_size):
+        """
+        Setter for the number of effects kept, least recently used ones are evicted if needed.
+        """
+        with self.lock:
+            self.maximum_size = maximum_size
+            self._evict(maximum_size, self.maximum_characters)
+
+    def _evict(self, maximum_size, maximum_characters):
+        """
+        _evict(): Remove least recently used effects until no more than maximum_size effects and maximum_characters
+        characters are kept. The lock must be held.
+        """
+        while self.effects and (len(self.effects) > max(maximum_size, value_zero) or
+                                self.characters > max(maximum_characters, value_zero)):
+            # Least recently used effect is the first one
+            (list_of_instructions, _), _ = self.effects.popitem(last=False)
+            self.characters -= len(list_of_instructions)
+
+    def clear(self):
+        """
+        ProgramEffectCache's function that will remove every effect and reset the counters.
+        """
+        with self.lock:
+            self.effects.clear()
+            self.sightings.clear()
+            self.characters = value_zero
+            self.hits = value_zero
+            self.misses = value_zero
+
+    def statistics(self):
+        """
+        ProgramEffectCache's function that will return the size and the counters of the cache.
+        """
+        return {
+            'size': len(self.effects),
+            'maximum_size': self.maximum_size,
+            'characters': self.characters,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+# Cache shared by every Rover
+program_effect_cache = ProgramEffectCache()
+
+
+def read_set_of_instructions(rover):
+    """
+    read_set_of_instructions(): Function that will read an instruction that we want Rover to execute.
+    If the instruction read is not known an exception will be raised.
+    :param rover: Rover object.
+    :return: Parsed list of known movements, removing additional spaces.
+    """
+    # Read instruction
+    line_input = str(input("{} is waiting for instruction: ".format(rover.rover_id)))
+
+    return parse_set_of_instructions(rover, line_input)
+
+
+def parse_set_of_instructions(rover, line_input):
+    """
+    parse_set_of_instructions(): Function that will process an instruction line already read, in one single pass
+    whatever its length. If the instruction read is not known an exception will be raised.
+    Timed as the read_set_of_instructions stage while instrumentation is enabled.
+    :param rover: Rover object.
+    :param line_input: Line of text containing the instructions.
+    :return: Parsed string of known movements, removing additional spaces.
+    """
+    recorder = instrumentation.active_recorder
+    if recorder is not None:
+        list_of_instructions = recorder.measure(instrumentation.stage_read_set_of_instructions,
+                                                _parse_set_of_instructions, rover, line_input)
+        recorder.record_instructions_length(len(list_of_instructions))
+        return list_of_instructions
+
+    return _parse_set_of_instructions(rover, line_input)
+
+
+def _parse_set_of_instructions(rover, line_input):
+    """
+    _parse_set_of_instructions(): Function that will do the work of parse_set_of_instructions, not instrumented.
+    """
+    line_input = line_input.replace("\n", "").replace(" ", "")
+
+    # Look for the first command not known, if any, before upper casing, which may change the length of the line
+    unknown_instruction = unknown_instruction_pattern.search(line_input)
+    if unknown_instruction is not None:
+        raise ExceptionInstructionParameterNotKnown(unknown_instruction.start(), unknown_instruction.group().upper(),
+                                                    ', '.join([x for x in rover.set_of_known_movements.keys()]))
+    return line_input.upper()
+
+
+def parse_set_of_instructions_letter_by_letter(rover, line_input):
+    """
+    parse_set_of_instructions_letter_by_letter(): Reference implementation of parse_set_of_instructions, checking
+    the instruction line letter by letter.
+    :param rover: Rover object.
+    :param line_input: Line of text containing the instructions.
+    :return: Parsed list of known movements, removing additional spaces.
+    """
+    # Process line_input make sure that all commands are known, otherwise ask for them again
+    line_input = line_input.replace("\n", "").replace(" ", "")
+
+    # Define list again making sure we are not writing extra values of old requests
+    final_set_of_movements = list()
+
+    # Iterate over all commands received
+    for count, letter in enumerate(line_input, start=value_zero):
+        final_set_of_movements.insert(count, letter.upper())
+        # Check whether command is or not known
+        if letter.upper() not in rover.set_of_known_movements.keys():
+            raise ExceptionInstructionParameterNotKnown(count, letter.upper(),
+                                                        ', '.join([x for x in rover.set_of_known_movements.keys()]))
+    return final_set_of_movements
+
+
+def execute_movement(rover, coordinates, coverage=None, trajectory=None):
+    """
+    execute_movement(): Function that will pre-execute and execute the full list of movements processed lately.
+    Whilst pre processing, if Rover gets out of the known plane an exception will be raised.
+    Instructions are compressed into segments so the plane is checked once per segment instead of once per step.
+    Periodic lists of instructions are worked out in closed form, one cycle at a time being executed.
+    Timed as the execute_movement stage while instrumentation is enabled.
+    :param rover: Rover object.
+    :param coordinates: Coordinates object.
+    :param coverage: Optional CoverageMap object where the path followed will be marked.
+    :param trajectory: Optional TrajectoryWriter object where every step of the path will be written, until the
+    first wrong position if the Rover can not finish its movements.
+    :return: Last position after having executed all the list of movements.
+    """
+    recorder = instrumentation.active_recorder
+    if recorder is not None:
+        end_position = recorder.measure(instrumentation.stage_execute_movement, _execute_movement, rover, coordinates,
+                                        coverage, trajectory)
+        recorder.record_commands_executed(len(rover.requested_list_of_instructions))
+        return end_position
+
+    return _execute_movement(rover, coordinates, coverage, trajectory)
+
+
+def _execute_movement(rover, coordinates, coverage=None, trajectory=None):
+    """
+    _execute_movement(): Function that will do the work of execute_movement, not instrumented.
+    """
+    if coverage is None and trajectory is None:
+        # Only the net effect is needed, repeated lists of instructions are applied at once
+        end_position = execute_cached_movement(rover.start_position, rover.requested_list_of_instructions,
+                                               coordinates)
+        if end_position is not None:
+            return end_position
+
+        # Not cached yet or path not clear, movements are executed skipping the cycles of periodic instructions
+        return execute_periodic_movement(rover.start_position, rover.requested_list_of_instructions, coordinates)
+
+    try:
+        end_position = execute_segmented_movement(rover.start_position, rover.requested_list_of_instructions,
+                                                  coordinates, coverage)
+    except (ExceptionRoverAttemptingToExitKnownPlane, ExceptionRoverCollision) as e:
+        if trajectory is not None:
+            trajectory.write_path(rover.rover_number, rover.start_position, rover.requested_list_of_instructions, e)
+        raise
+
+    if trajectory is not None:
+        trajectory.write_path(rover.rover_number, rover.start_position, rover.requested_list_of_instructions)
+
+    return end_position
+
+
+def execute_cached_movement(start_position, list_of_instructions, coordinates, cache=program_effect_cache):
+    """
+    execute_cached_movement(): Function that will apply the net effect of a list of instructions, taken from the
+    cache, if the bounding box of the whole path is in the plane and there is no other Rover inside it. Lists of
+    instructions seen for the second time are executed, recording the effect kept for the next times.
+    :param start_position: Rover start position [x, y, orientation].
+    :param list_of_instructions: Parsed list (or string) of known movements.
+    :param coordinates: Coordinates object.
+    :param cache: ProgramEffectCache object.
+    :return: Last position after having executed all the list of movements, None if the list of instructions is seen
+    for the first time, or if the path is not fully in the plane or may collide, the movements have to be executed
+    then.
+    """
+    if cache.maximum_size <= value_zero or len(list_of_instructions) < program_effect_cache_minimum_length:
+        return None
+
+    x, y, heading = start_position[value_zero], start_position[value_one], heading_codes[start_position[value_two]]
+    instructions = join_instructions(list_of_instructions)
+    effect, is_seen_again = cache.get_effect(instructions, heading)
+
+    if effect is None:
+        if not is_seen_again:
+            return None
+
+        # Movements are executed once, recording the effect kept for the next times
+        effect = execute_recorded_movement(start_position, instructions, coordinates)
+        cache.set_effect(instructions, heading, effect)
+        return [x + effect[value_zero], y + effect[value_one], heading_names[effect[value_two]]]
+
+    delta_x, delta_y, heading, min_dx, min_dy, max_dx, max_dy = effect
+    min_x, min_y = coordinates.bottom_left_coordinates
+    max_x, max_y = coordinates.top_right_coordinates
+
+    if min_x <= x + min_dx and x + max_dx <= max_x and min_y <= y + min_dy and y + max_dy <= max_y and \
+            not coordinates.is_area_occupied(x + min_dx, y + min_dy, x + max_dx, y + max_dy):
+        return [x + delta_x, y + delta_y, heading_names[heading]]
+
+    return None
+
+
+def execute_movement_step_by_step(rover, coordinates):
+    """
+    execute_movement_step_by_step(): Reference implementation of execute_movement, checking the plane after every
+    single step. Function that will pre-execute and execute the full list of movements processed lately.
+    Whilst pre processing, if Rover gets out of the known plane an exception will be raised.
+    :param rover: Rover object.
+    :param coordinates: Coordinates object.
+    :return: Last position after having executed all the list of movements.
+    """
+    # Get initial position of rover, set is as current ending one, a flat list of ints and a str
+    estimated_end_position = list(rover.start_position)
+
+    # Don't return the complete set of movements till make sure we are not over exceeding the edges of plane
+    for command in rover.requested_list_of_instructions:
+        if command == 'M':
+            # Execute forward movement command
+            # It will take current letter on rovers position (parameter [2]), according with this and taking as a
+            # reference the mapping of cardinal_points, it will execute the movement incrementing accordingly the value
+            estimated_end_position[
+                coordinates.coordinates_definition.index(
+                    coordinates.cardinal_points[estimated_end_position[value_two]]['Coordinate'])] += \
+                coordinates.cardinal_points[estimated_end_position[value_two]]['Movement']
+        else:
+            # Other possible command will be rotate
+            estimated_end_position[value_two] = coordinates.sorted_cardinal_points_list[
+                (coordinates.sorted_cardinal_points_list.index(estimated_end_position[value_two]) +
+                 rover.set_of_known_movements[str(command).upper()]) % len(coordinates.sorted_cardinal_points_list)]
+
+        # After having performed the action just check whether we are over exceeding the edges of the plane
+        for axis in coordinates.coordinates_definition:
+            if coordinates.bottom_left_coordinates[coordinates.coordinates_definition.index(axis)] > \
+                    estimated_end_position[coordinates.coordinates_definition.index(axis)] or \
+                    estimated_end_position[coordinates.coordinates_definition.index(axis)] > \
+                    coordinates.top_right_coordinates[coordinates.coordinates_definition.index(axis)]:
+
+                # Rover is not in the plane raise exception
+                raise ExceptionRoverAttemptingToExitKnownPlane(estimated_end_position, axis,
+                                                               coordinates.top_right_coordinates[
+                                                                   coordinates.coordinates_definition.index(axis)
+                                                               ],
+                                                               coordinates.bottom_left_coordinates[
+                                                                   coordinates.coordinates_definition.index(axis)
+                                                               ])
+            else:
+                # Rover is still in the plane
+                pass
+
+        # Check whether another Rover is already placed there or not
+        if command == 'M' and coordinates.is_occupied(estimated_end_position[value_zero],
+                                                      estimated_end_position[value_one]):
+            raise ExceptionRoverCollision(estimated_end_position)
+    return estimated_end_position
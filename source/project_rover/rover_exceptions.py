@@ -138,3 +138,41 @@ class ExceptionRoverAttemptingToExitKnownPlane(Exception):
 
         super(ExceptionRoverAttemptingToExitKnownPlane, self).__init__(self.message)
 
+
+class ExceptionRoverCollision(Exception):
+    """
+    Exception raised when Rover is attempting to go through a position where another Rover is placed.
+    """
+    def __init__(self, first_wrong_position, default_message=
+                 "Pre-processed instructions may result in Rover colliding with another Rover"):
+        self.first_wrong_position = first_wrong_position
+        self.message = "\t\t[ERROR] - {}. Rover already placed at point {}. " \
+                       "{}".format(default_message, self.first_wrong_position, try_it_again)
+
+        super(ExceptionRoverCollision, self).__init__(self.message)
+
+
+class ExceptionNoPathFound(Exception):
+    """
+    Exception raised when no set of instructions can take Rover from its start position to the goal position.
+    """
+    def __init__(self, start_position, goal_position, default_message=
+                 "No set of instructions reaches goal position without exceeding plane edge or colliding"):
+        self.start_position = start_position
+        self.goal_position = goal_position
+        self.message = "\t\t[ERROR] - {}. Start position {}, goal position {}. " \
+                       "{}".format(default_message, self.start_position, self.goal_position, try_it_again)
+
+        super(ExceptionNoPathFound, self).__init__(self.message)
+
+
+class ExceptionLineTooLong(Exception):
+    """
+    Exception raised when a line received is longer than the limit, nothing else can be read after it.
+    """
+    def __init__(self, line_limit, default_message="Line received is too long"):
+        self.line_limit = line_limit
+        self.message = "\t\t[ERROR] - {}. Lines can not be longer than {} bytes, " \
+                       "session closed.".format(default_message, self.line_limit)
+
+        super(ExceptionLineTooLong, self).__init__(self.message)
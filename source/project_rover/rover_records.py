@@ -0,0 +1,113 @@
+# Compact records of many Rovers, for keeping whole fleets in memory whilst replaying them.
+# Instead of one Rover object (and two position lists) per Rover, every field is stored in its own array: numbers take
+# 8 bytes each, headings 1 byte, and sets of instructions are kept as they are, so that repeated ones are shared.
+
+# Python imports
+from array import array
+
+# Custom imports
+from .common_params import value_zero, value_one, value_two
+from .movement_engine import heading_codes, heading_names
+from .rover import Rover
+
+# Heading code stored for Rovers that have not finished moving yet
+heading_unknown = 255
+
+
+class RoverRecords:
+    """
+    RoverRecords Class object, number, start position, end position and set of instructions of many Rovers, one array
+    per field.
+    """
+    __slots__ = ('rover_numbers', 'start_x', 'start_y', 'start_headings', 'end_x', 'end_y', 'end_headings',
+                 'instructions')
+
+    def __init__(self):
+        self.rover_numbers = array('q')
+        self.start_x = array('q')
+        self.start_y = array('q')
+        self.start_headings = array('B')
+        self.end_x = array('q')
+        self.end_y = array('q')
+        self.end_headings = array('B')
+        self.instructions = list()
+
+    def __len__(self):
+        return len(self.rover_numbers)
+
+    def append(self, rover_number, start_position, list_of_instructions='', end_position=None):
+        """
+        RoverRecords's function that will add the record of a Rover.
+        :param rover_number: Number of the Rover.
+        :param start_position: Rover start position [x, y, orientation].
+        :param list_of_instructions: Parsed list (or string) of known movements.
+        :param end_position: Rover end position [x, y, orientation], None if it has not finished moving.
+        :return: Index of the record.
+        """
+        self.rover_numbers.append(rover_number)
+        self.start_x.append(start_position[value_zero])
+        self.start_y.append(start_position[value_one])
+        self.start_headings.append(heading_codes[start_position[value_two]])
+        self.end_x.append(value_zero)
+        self.end_y.append(value_zero)
+        self.end_headings.append(heading_unknown)
+        self.instructions.append(list_of_instructions if isinstance(list_of_instructions, str)
+                                 else ''.join(list_of_instructions))
+
+        if end_position is not None:
+            self.set_end_position(len(self) - value_one, end_position)
+
+        return len(self) - value_one
+
+    def set_end_position(self, index, end_position):
+        """
+        Setter for the end position of a record, None if the Rover has not finished moving.
+        """
+        if end_position is None:
+            self.end_headings[index] = heading_unknown
+        else:
+            self.end_x[index] = end_position[value_zero]
+            self.end_y[index] = end_position[value_one]
+            self.end_headings[index] = heading_codes[end_position[value_two]]
+
+    def start_position(self, index):
+        """
+        RoverRecords's function that will return the start position of a record, as a new [x, y, orientation] list.
+        """
+        return [self.start_x[index], self.start_y[index], heading_names[self.start_headings[index]]]
+
+    def end_position(self, index):
+        """
+        RoverRecords's function that will return the end position of a record, as a new [x, y, orientation] list,
+        None if the Rover has not finished moving.
+        """
+        if self.end_headings[index] == heading_unknown:
+            return None
+
+        return [self.end_x[index], self.end_y[index], heading_names[self.end_headings[index]]]
+
+    def rover(self, index):
+        """
+        RoverRecords's function that will return a new Rover object with the values of a record.
+        """
+        rover = Rover(self.rover_numbers[index])
+        rover.start_position = self.start_position(index)
+        rover.requested_list_of_instructions = self.instructions[index]
+        rover.end_position = self.end_position(index)
+
+        return rover
+
+
+def build_rover_records(rovers):
+    """
+    build_rover_records(): Function that will store the values of many Rover objects in one RoverRecords object.
+    :param rovers: Iterable of Rover objects, with start position set.
+    :return: RoverRecords object.
+    """
+    records = RoverRecords()
+
+    for rover in rovers:
+        records.append(rover.rover_number, rover.start_position, rover.requested_list_of_instructions or '',
+                       rover.end_position)
+
+    return records
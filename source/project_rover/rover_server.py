@@ -0,0 +1,231 @@
+# Asyncio server deploying and moving Rovers for many operators at once, over TCP or a Unix socket.
+# Each connection is a session with its own plane, following the same dialogue as the interactive mode:
+#   - First line is the top right coordinates of the plane.
+#   - Then, for each Rover, a line with its start position followed by a line with its set of instructions.
+# Every line received gets one reply, ended by an empty line:
+#   - "OK" once the plane or the start position of the Rover is accepted.
+#   - "Rover[n] final position: [x, y, 'N']" once the Rover has moved.
+#   - "Top right coordinates:" or "Rover[n]:" followed by the message of the exception raised, the same line has to
+#     be sent again, as when asking for keyboard inputs.
+# A line longer than line_limit gets the same kind of reply before the session is closed, nothing can be read after it.
+# Lines of several rovers can be sent without waiting for the replies, they are processed in order.
+
+# Python imports
+import argparse
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+# Custom imports
+from .common_params import value_zero, value_one
+from .coordinates import Coordinates as myCoordinate
+from .main import first_line_types, second_line_types, rover_exceptions_list, parse_rover_parameters
+from .rover import Rover
+from .rover_exceptions import ExceptionLineTooLong
+
+# Sets of instructions longer than this are parsed and executed out of the event loop, so that other sessions are not
+# blocked
+executor_instructions_threshold = 10000
+
+# Longest line accepted, sets of instructions are sent in one single line
+line_limit = 2 ** 24
+
+# Pending connections queued by the operating system
+default_backlog = 4096
+
+reply_ok = "OK"
+
+
+async def read_session_line(reader):
+    """
+    read_session_line(): Function that will read the next line of a session, removing the end of line characters.
+    :param reader: asyncio.StreamReader of the session.
+    :return: Line read, None if the connection has been closed.
+    """
+    try:
+        line = await reader.readline()
+    except ValueError:
+        # Line longer than line_limit, nothing else can be read from this session
+        raise ExceptionLineTooLong(line_limit)
+
+    if not line:
+        return None
+
+    return line.decode('utf-8', 'replace').rstrip("\r\n")
+
+
+async def write_session_reply(writer, reply):
+    """
+    write_session_reply(): Function that will send a reply, ended by an empty line, to the client of a session.
+    :param writer: asyncio.StreamWriter of the session.
+    :param reply: Text of the reply.
+    :return: Nothing
+    """
+    writer.write("{}\n\n".format(reply).encode('utf-8'))
+    await writer.drain()
+
+
+def set_and_execute_instructions(rover, line, coordinates):
+    """
+    set_and_execute_instructions(): Function that will parse the set of instructions of a Rover and execute its
+    movement.
+    :param rover: Rover object, with its start position.
+    :param line: Line received with the set of instructions.
+    :param coordinates: Coordinates object of the session.
+    :return: Nothing
+    """
+    rover.set_list_of_instructions(line)
+    rover.execute_movement(coordinates)
+
+
+async def execute_rover_instructions(rover, line, coordinates, executor):
+    """
+    execute_rover_instructions(): Function that will parse the set of instructions of a Rover and execute its
+    movement, short lines are processed right away, long ones in the executor so that the event loop keeps serving the
+    other sessions.
+    :param rover: Rover object, with its start position.
+    :param line: Line received with the set of instructions.
+    :param coordinates: Coordinates object of the session.
+    :param executor: concurrent.futures.Executor used for long sets of instructions, None for the loop's default one.
+    :return: Nothing
+    """
+    if len(line) > executor_instructions_threshold:
+        # The session waits for the result, nobody else is using its plane meanwhile
+        await asyncio.get_running_loop().run_in_executor(executor, set_and_execute_instructions, rover, line,
+                                                         coordinates)
+    else:
+        set_and_execute_instructions(rover, line, coordinates)
+
+
+async def handle_session(reader, writer, executor=None):
+    """
+    handle_session(): Function that will handle all the steps to deploy and move the Rovers of one client, with its
+    own plane, until the connection is closed.
+    :param reader: asyncio.StreamReader of the session.
+    :param writer: asyncio.StreamWriter of the session.
+    :param executor: concurrent.futures.Executor used for long sets of instructions, None for the loop's default one.
+    :return: Nothing
+    """
+    # Init coordinates Class object, one plane per session
+    coordinates = myCoordinate()
+
+    # Beginning of the error replies, until the plane is accepted
+    reply_prefix = "Top right coordinates"
+
+    try:
+        # Keep reading until correct data to be fully received
+        while coordinates.top_right_coordinates is None:
+            line = await read_session_line(reader)
+            if line is None:
+                return
+
+            try:
+                coordinates.set_top_right_coordinates(parse_rover_parameters(line, first_line_types, coordinates))
+                await write_session_reply(writer, reply_ok)
+            except rover_exceptions_list as e:
+                await write_session_reply(writer, "Top right coordinates:\n{}".format(e))
+
+        # Rover's counter
+        count = value_zero
+
+        while True:
+            count += value_one
+
+            # Init rover Class object
+            rover = Rover(count)
+            reply_prefix = rover.rover_id
+
+            while rover.start_position is None:
+                line = await read_session_line(reader)
+                if line is None:
+                    return
+
+                try:
+                    rover.set_rover_start_position(parse_rover_parameters(line, second_line_types, coordinates),
+                                                   coordinates)
+                    await write_session_reply(writer, reply_ok)
+                except rover_exceptions_list as e:
+                    await write_session_reply(writer, "{}:\n{}".format(rover.rover_id, e))
+
+            while rover.end_position is None:
+                line = await read_session_line(reader)
+                if line is None:
+                    return
+
+                try:
+                    await execute_rover_instructions(rover, line, coordinates, executor)
+                    await write_session_reply(writer, "{} final position: {}".format(rover.rover_id,
+                                                                                       rover.end_position))
+
+                    # Next Rovers can not go through this one
+                    coordinates.set_occupied_position(rover.end_position)
+                except rover_exceptions_list as e:
+                    await write_session_reply(writer, "{}:\n{}".format(rover.rover_id, e))
+    except ExceptionLineTooLong as e:
+        try:
+            await write_session_reply(writer, "{}:\n{}".format(reply_prefix, e))
+        except ConnectionError:
+            # Client gone, nothing else to reply
+            pass
+    except ConnectionError:
+        # Client gone, nothing else to reply
+        pass
+    finally:
+        writer.close()
+
+
+async def start_rover_server(host=None, port=None, unix_path=None, executor=None, backlog=default_backlog):
+    """
+    start_rover_server(): Function that will start listening for sessions, on a Unix socket if unix_path is given,
+    on TCP otherwise.
+    :param host: Host to listen on for TCP.
+    :param port: Port to listen on for TCP.
+    :param unix_path: Path of the Unix socket.
+    :param executor: concurrent.futures.Executor used for long sets of instructions, None for the loop's default one.
+    :param backlog: Pending connections queued by the operating system.
+    :return: asyncio.AbstractServer object.
+    """
+    session_handler = functools.partial(handle_session, executor=executor)
+
+    if unix_path is not None:
+        return await asyncio.start_unix_server(session_handler, path=unix_path, limit=line_limit, backlog=backlog)
+
+    return await asyncio.start_server(session_handler, host, port, limit=line_limit, backlog=backlog)
+
+
+async def serve(host=None, port=None, unix_path=None, workers=None):
+    """
+    serve(): Function that will serve sessions until cancelled.
+    :param host: Host to listen on for TCP.
+    :param port: Port to listen on for TCP.
+    :param unix_path: Path of the Unix socket.
+    :param workers: Number of threads executing long sets of instructions.
+    :return: Nothing
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        server = await start_rover_server(host, port, unix_path, executor)
+
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    """
+    main(): Function that will parse the arguments and serve sessions until interrupted.
+    :return: Nothing
+    """
+    parser = argparse.ArgumentParser(description="Serve Rover sessions over TCP or a Unix socket")
+    parser.add_argument('--host', default='127.0.0.1', help="Host to listen on for TCP")
+    parser.add_argument('--port', type=int, default=8042, help="Port to listen on for TCP")
+    parser.add_argument('--unix', default=None, help="Path of a Unix socket to listen on instead of TCP")
+    parser.add_argument('--workers', type=int, default=None, help="Threads executing long sets of instructions")
+    arguments = parser.parse_args()
+
+    try:
+        asyncio.run(serve(arguments.host, arguments.port, arguments.unix, arguments.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
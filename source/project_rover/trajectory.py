@@ -0,0 +1,223 @@
+# Binary trajectory files, every step done by every Rover, for replaying missions.
+# File layout, little endian:
+#   - Header: magic, version, number of Rovers, offset of the index.
+#   - Records: one (x, y, heading code) record of 64 bits integers per step, the start position being step 0. Version 1
+#     used 32 bits integers, too small for big planes.
+#   - Index: one (Rover number, first record, number of records, status) entry of 64 bits integers per Rover.
+
+# Python imports
+import mmap
+import re
+import struct
+import sys
+from array import array
+
+# Custom imports
+from .common_params import value_zero, value_one, value_two
+from . import movement_engine
+
+trajectory_magic = b'RTRJ'
+trajectory_version = 2
+header_struct = struct.Struct('<4sIqq')
+record_struct = struct.Struct('<qqq')
+index_struct = struct.Struct('<qqqq')
+record_values = 3
+record_typecode = 'q'
+record_max_value = 2 ** 63 - 1
+
+# Status of each Rover path
+status_finished = 0
+status_rejected = 1
+
+# Each step is either a single rotation or one of the forward movements of a run
+step_pattern = re.compile('(M+)|([LR])')
+rotation_codes = {'L': movement_engine.instruction_left, 'R': movement_engine.instruction_right}
+
+
+class TrajectoryWriter:
+    """
+    TrajectoryWriter Class object, it streams the paths of the Rovers to a binary trajectory file. Records are kept in
+    a fixed size array buffer and written at once when it is full.
+    """
+    def __init__(self, path, buffer_records=2 ** 16):
+        self.trajectory_file = open(path, 'wb')
+        self.trajectory_file.write(header_struct.pack(trajectory_magic, trajectory_version, value_zero, value_zero))
+        self.buffer = array(record_typecode)
+        self.buffer_records = buffer_records
+        self.number_of_records = value_zero
+        self.number_of_rovers = value_zero
+        self.index = bytearray()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def write_path(self, rover_number, start_position, list_of_instructions, error=None):
+        """
+        TrajectoryWriter's function that will write every step of the path of a Rover. Forward movements are written
+        by runs, filling the array of records by slices instead of step by step.
+        :param rover_number: Number of the Rover.
+        :param start_position: Rover start position [x, y, orientation].
+        :param list_of_instructions: Parsed list (or string) of known movements.
+        :param error: Exception raised whilst pre-executing the movements, if any, the path is written until the
+        forward movement reaching its first wrong position.
+        :return: Nothing
+        """
+        first_record = self.number_of_records
+        x, y = start_position[value_zero], start_position[value_one]
+
+        # No step goes farther than the number of instructions from the start position
+        if max(abs(x), abs(y)) + len(list_of_instructions) > record_max_value:
+            raise ValueError("Path of Rover {} does not fit in the 64 bits records of a trajectory file".format(
+                rover_number))
+
+        heading = movement_engine.heading_codes[start_position[value_two]]
+        stop_position = error.first_wrong_position[:value_two] if error is not None else None
+
+        self._append_records(array(record_typecode, [x, y, heading]))
+
+        for step_match in step_pattern.finditer(''.join(list_of_instructions)):
+            movements, rotation = step_match.groups()
+
+            if rotation:
+                heading = movement_engine.turn_table[rotation_codes[rotation]][heading]
+                self._append_records(array(record_typecode, [x, y, heading]))
+                continue
+
+            delta_x, delta_y = movement_engine.delta_x[heading], movement_engine.delta_y[heading]
+            number_of_steps = len(movements)
+            stopped = False
+
+            if stop_position is not None:
+                # Steps needed for reaching the first wrong position, if it is on this run
+                steps_to_stop = (stop_position[value_zero] - x) * delta_x + (stop_position[value_one] - y) * delta_y
+                if [x + delta_x * steps_to_stop, y + delta_y * steps_to_stop] == stop_position and \
+                        value_one <= steps_to_stop <= number_of_steps:
+                    number_of_steps, stopped = steps_to_stop, True
+
+            records = array(record_typecode, [heading]) * (record_values * number_of_steps)
+            records[value_zero::record_values] = _axis_values(x, delta_x, number_of_steps)
+            records[value_one::record_values] = _axis_values(y, delta_y, number_of_steps)
+            self._append_records(records)
+
+            x += delta_x * number_of_steps
+            y += delta_y * number_of_steps
+
+            if stopped:
+                break
+
+        self.index.extend(index_struct.pack(rover_number, first_record, self.number_of_records - first_record,
+                                            status_finished if error is None else status_rejected))
+        self.number_of_rovers += value_one
+
+    def _append_records(self, records):
+        """
+        _append_records(): Append records to the buffer, writing it to the file when it is full.
+        """
+        self.buffer.extend(records)
+        self.number_of_records += len(records) // record_values
+
+        if len(self.buffer) >= self.buffer_records * record_values:
+            self.flush()
+
+    def flush(self):
+        """
+        TrajectoryWriter's function that will write the records buffered to the file.
+        """
+        if sys.byteorder != 'little':
+            self.buffer.byteswap()
+
+        self.buffer.tofile(self.trajectory_file)
+        del self.buffer[:]
+
+    def close(self):
+        """
+        TrajectoryWriter's function that will write the index and the final header, and close the file.
+        """
+        if self.trajectory_file.closed:
+            return
+
+        self.flush()
+        index_offset = self.trajectory_file.tell()
+        self.trajectory_file.write(self.index)
+        self.trajectory_file.seek(value_zero)
+        self.trajectory_file.write(header_struct.pack(trajectory_magic, trajectory_version, self.number_of_rovers,
+                                                      index_offset))
+        self.trajectory_file.close()
+
+
+class TrajectoryReader:
+    """
+    TrajectoryReader Class object, it memory maps a trajectory file for random access to any step of any Rover.
+    """
+    def __init__(self, path):
+        self.trajectory_file = open(path, 'rb')
+        self.data = mmap.mmap(self.trajectory_file.fileno(), value_zero, access=mmap.ACCESS_READ)
+        magic, version, self.number_of_rovers, self.index_offset = header_struct.unpack_from(self.data, value_zero)
+
+        if magic != trajectory_magic or version != trajectory_version:
+            self.close()
+            raise ValueError("{} is not a trajectory file of version {}".format(path, trajectory_version))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self.number_of_rovers
+
+    def rover_entry(self, index):
+        """
+        TrajectoryReader's function that will return the index entry of the index-th Rover written.
+        :return: Tuple (Rover number, first record, number of records, status).
+        """
+        if not value_zero <= index < self.number_of_rovers:
+            raise IndexError("Rover index out of range")
+
+        return index_struct.unpack_from(self.data, self.index_offset + index * index_struct.size)
+
+    def position(self, index, step):
+        """
+        TrajectoryReader's function that will return the position of the index-th Rover written after step steps.
+        :return: Position [x, y, orientation].
+        """
+        _, first_record, number_of_records, _ = self.rover_entry(index)
+
+        if not value_zero <= step < number_of_records:
+            raise IndexError("Step out of range")
+
+        x, y, heading = record_struct.unpack_from(self.data, header_struct.size +
+                                                  (first_record + step) * record_struct.size)
+        return [x, y, movement_engine.heading_names[heading]]
+
+    def positions(self, index):
+        """
+        TrajectoryReader's generator that will return every position of the path of the index-th Rover written.
+        """
+        _, first_record, number_of_records, _ = self.rover_entry(index)
+        offset = header_struct.size + first_record * record_struct.size
+
+        for record in range(number_of_records):
+            x, y, heading = record_struct.unpack_from(self.data, offset + record * record_struct.size)
+            yield [x, y, movement_engine.heading_names[heading]]
+
+    def close(self):
+        """
+        TrajectoryReader's function that will release the memory map and close the file.
+        """
+        self.data.close()
+        self.trajectory_file.close()
+
+
+def _axis_values(start, delta, number_of_steps):
+    """
+    _axis_values(): Values taken by one axis along a run of forward movements, starting after start.
+    """
+    if delta:
+        return array(record_typecode, range(start + delta, start + delta * (number_of_steps + value_one), delta))
+
+    return array(record_typecode, [start]) * number_of_steps